@@ -6,8 +6,14 @@ Provides manual control and monitoring of ML pipeline
 from django.core.management.base import BaseCommand
 from django.db.models import Q
 from applications.models import CreditApplication, MLCreditAssessment
-from applications.tasks import process_ml_credit_assessment, batch_process_ml_assessments
+from applications.tasks import (
+    process_ml_credit_assessment, batch_process_ml_assessments,
+    _prepare_ml_input_data, _validate_ml_input, _process_ghana_employment_features,
+    save_ml_assessments, save_risk_explanations, save_counterfactual_explanations, assess_applications
+)
 from applications.signals import trigger_manual_ml_assessment, trigger_batch_ml_assessment
+import json
+import os
 import time
 
 
@@ -42,6 +48,35 @@ class Command(BaseCommand):
             default=10,
             help='Batch size for processing (default: 10)'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Score locally across this many worker processes instead of queueing '
+                 'Celery tasks (offline rescoring; no notifications are sent)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Applications per worker task with --workers, or per page with --stream (default: 500)'
+        )
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            help='Score locally page by page (keyset pagination, one model call and bulk writes '
+                 'per page) instead of queueing Celery tasks; no notifications are sent'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            help='With --stream, record the last processed application ID in this file after every page'
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='With --stream, continue after the application ID recorded in --checkpoint'
+        )
         parser.add_argument(
             '--dry-run',
             action='store_true',
@@ -147,6 +182,14 @@ class Command(BaseCommand):
                 self.stdout.write(f"  ... and {total_count - 10} more")
             return
 
+        if options['stream']:
+            self.process_streaming(applications, options)
+            return
+
+        if options['workers'] > 1:
+            self.process_in_parallel(applications, options)
+            return
+
         # Process in batches
         batch_size = options['batch_size']
         processed = 0
@@ -191,6 +234,182 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"Processing completed. {processed} assessments processed successfully.")
         )
 
+    def process_in_parallel(self, applications, options):
+        """Score applications across a local process pool and save assessments directly."""
+        from ml_model.src.parallel_scoring import iter_parallel_predictions
+
+        force = options['force']
+        chunk_size = options['chunk_size']
+        candidates = []
+        ml_inputs = []
+        skipped = 0
+        failed = 0
+
+        for application in applications.select_related('ml_assessment').iterator(chunk_size=chunk_size):
+            if getattr(application, 'ml_assessment', None) and not force:
+                skipped += 1
+                continue
+            ml_data = _prepare_ml_input_data(application)
+            if not _validate_ml_input(ml_data):
+                failed += 1
+                self.stdout.write(self.style.WARNING(f"  ✗ {application.reference_number}: invalid ML input data"))
+                continue
+            candidates.append(application)
+            ml_inputs.append(ml_data)
+
+        self.stdout.write(
+            f"Scoring {len(ml_inputs)} applications with {options['workers']} workers "
+            f"(chunk size {chunk_size}, {skipped} skipped)..."
+        )
+
+        def report_progress(scored, total):
+            self.stdout.write(f"  Scored {scored}/{total}")
+
+        start_time = time.time()
+        completed = 0
+        explained = 0
+        pending = []
+        predictions = iter_parallel_predictions(
+            ml_inputs, workers=options['workers'], chunk_size=chunk_size,
+            progress_callback=report_progress
+        )
+
+        for application, ml_data, prediction_result in zip(candidates, ml_inputs, predictions):
+            if not prediction_result.get('success', False):
+                failed += 1
+                self.stdout.write(
+                    self.style.WARNING(f"  ✗ {application.reference_number}: {prediction_result.get('error', 'Unknown error')}")
+                )
+                continue
+
+            # Assessments, explanations and counterfactuals are written in bulk, one chunk at a time
+            pending.append((application, ml_data, prediction_result))
+            if len(pending) >= chunk_size:
+                saved, stored = self._save_scored_chunk(pending)
+                completed += saved
+                failed += len(pending) - saved
+                explained += stored
+                pending = []
+
+        if pending:
+            saved, stored = self._save_scored_chunk(pending)
+            completed += saved
+            failed += len(pending) - saved
+            explained += stored
+
+        elapsed = time.time() - start_time
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Parallel processing completed in {elapsed:.1f}s:\n"
+                f"  ✓ Completed: {completed} ({explained} explanations stored)\n"
+                f"  ○ Skipped: {skipped}\n"
+                f"  ✗ Failed: {failed}"
+            )
+        )
+
+    def process_streaming(self, applications, options):
+        """
+        Score applications page by page and save assessments directly.
+
+        Pages are read with keyset pagination on the primary key, so every
+        page is one indexed query and memory stays bounded by --chunk-size.
+        Each page is scored with one model call and written in bulk; after
+        each page the last processed ID is written to the checkpoint file.
+        """
+        chunk_size = options['chunk_size']
+        checkpoint_path = options['checkpoint']
+        totals = {'completed': 0, 'skipped': 0, 'failed': 0}
+        last_id = None
+        processed = 0
+
+        if options['resume']:
+            if not checkpoint_path:
+                self.stdout.write(self.style.ERROR("--resume requires --checkpoint"))
+                return
+            checkpoint = self._read_checkpoint(checkpoint_path)
+            if checkpoint:
+                last_id = checkpoint['last_id']
+                processed = checkpoint.get('processed', 0)
+                totals.update({key: checkpoint.get(key, 0) for key in totals})
+                self.stdout.write(f"Resuming after application {last_id} ({processed} already processed)")
+
+        queryset = applications.order_by('pk').select_related('ml_assessment')
+        start_time = time.time()
+
+        while True:
+            page = queryset.filter(pk__gt=last_id) if last_id is not None else queryset
+            chunk = list(page[:chunk_size].iterator(chunk_size=chunk_size))
+            if not chunk:
+                break
+
+            results, _ = assess_applications(chunk, options['force'])
+            for key in totals:
+                totals[key] += results[key]
+            for error in results['errors'][:5]:
+                self.stdout.write(self.style.WARNING(f"  ✗ {error}"))
+
+            processed += len(chunk)
+            last_id = chunk[-1].pk
+            if checkpoint_path:
+                self._write_checkpoint(checkpoint_path, last_id, processed, totals)
+
+            elapsed = time.time() - start_time
+            self.stdout.write(
+                f"  Processed {processed} applications "
+                f"({totals['completed']} completed, {totals['skipped']} skipped, {totals['failed']} failed, {elapsed:.1f}s)"
+            )
+
+        # A finished run starts from the beginning next time
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Streaming processing completed in {time.time() - start_time:.1f}s:\n"
+                f"  ✓ Completed: {totals['completed']}\n"
+                f"  ○ Skipped: {totals['skipped']}\n"
+                f"  ✗ Failed: {totals['failed']}"
+            )
+        )
+
+    def _read_checkpoint(self, path):
+        """Load a streaming checkpoint, or None if there is none."""
+        if not os.path.exists(path):
+            self.stdout.write(self.style.WARNING(f"No checkpoint at {path}, starting from the beginning"))
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _write_checkpoint(self, path, last_id, processed, totals):
+        """Atomically record streaming progress after a page."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'last_id': str(last_id), 'processed': processed, **totals}, f)
+        os.replace(temp_path, path)
+
+    def _save_scored_chunk(self, pending):
+        """
+        Save assessments for a chunk of scored applications with save_ml_assessments,
+        as the batch task does, then store their explanations.
+        
+        Returns:
+            (assessments saved, explanations stored)
+        """
+        applications, _, predictions = map(list, zip(*pending))
+        try:
+            ghana_data = [_process_ghana_employment_features(application) for application in applications]
+            save_ml_assessments(applications, predictions, ghana_data)
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"  ✗ Saving {len(applications)} assessments failed: {str(e)}"))
+            return 0, 0
+        return len(applications), self._save_explanations(pending)
+
+    def _save_explanations(self, pending):
+        """Store explanations and counterfactuals for a chunk of scored applications."""
+        applications, ml_inputs, predictions = map(list, zip(*pending))
+        save_counterfactual_explanations(applications, ml_inputs)
+        return save_risk_explanations(applications, ml_inputs, predictions)
+
     def monitor_processing_status(self):
         """Monitor current ML processing status."""
         self.stdout.write(self.style.SUCCESS("ML Processing Status Monitor"))
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_assigned_at(apps, schema_editor):
+    """Existing assignments have no record of when they were made; use the submission date."""
+    CreditApplication = apps.get_model('applications', 'CreditApplication')
+    CreditApplication.objects.filter(assigned_analyst__isnull=False, assigned_at__isnull=True).update(
+        assigned_at=F('submission_date')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0013_add_application_tracking_models'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='creditapplication',
+            name='assigned_at',
+            field=models.DateTimeField(blank=True, help_text='When the current analyst was assigned', null=True),
+        ),
+        migrations.RunPython(backfill_assigned_at, migrations.RunPython.noop),
+    ]
@@ -43,6 +43,7 @@ class CreditApplication(models.Model):
         related_name='assigned_applications',
         limit_choices_to={'user_type': 'ANALYST'}
     )
+    assigned_at = models.DateTimeField(null=True, blank=True, help_text="When the current analyst was assigned")
     is_priority = models.BooleanField(default=False)
     notes = models.TextField(blank=True)
     
@@ -81,6 +82,14 @@ class CreditApplication(models.Model):
     # Custom manager
     objects = ApplicationManager()
     
+    # Fields whose saved values are snapshotted for has_changed()/old_value()
+    TRACKED_FIELDS = (
+        'status', 'annual_income', 'debt_to_income_ratio', 'interest_rate', 'revolving_utilization',
+        'delinquencies_2yr', 'inquiries_6mo', 'employment_length', 'open_accounts', 'collections_12mo',
+        'loan_amount', 'credit_history_length', 'max_bankcard_balance', 'total_accounts',
+        'revolving_accounts_12mo', 'public_records', 'home_ownership', 'job_title', 'assigned_analyst_id',
+    )
+    
     class Meta:
         ordering = ['-submission_date']
         permissions = [
@@ -88,18 +97,65 @@ class CreditApplication(models.Model):
             ('can_change_status', 'Can change application status'),
         ]
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Snapshot the tracked fields as loaded, so saves need no extra read."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: getattr(instance, name) for name in cls.TRACKED_FIELDS if name in field_names
+        }
+        return instance
+    
+    def _tracked_snapshot(self):
+        """
+        Saved values of the tracked fields.
+        
+        Instances loaded from the database carry a snapshot already; for
+        others (or deferred fields) the missing values are read once, in one
+        query, and kept for the rest of the save.
+        """
+        snapshot = getattr(self, '_loaded_values', None)
+        if snapshot is None:
+            snapshot = self._loaded_values = {}
+        if self._state.adding:
+            return snapshot
+        
+        missing = [name for name in self.TRACKED_FIELDS if name not in snapshot]
+        if missing:
+            row = CreditApplication.objects.with_deleted().filter(pk=self.pk).values(*missing).first()
+            snapshot.update(row or dict.fromkeys(missing))
+        return snapshot
+    
+    def _refresh_snapshot(self, fields=None):
+        """Record the current values of the tracked fields (or only those given) as saved."""
+        snapshot = getattr(self, '_loaded_values', None)
+        if snapshot is None:
+            snapshot = self._loaded_values = {}
+        for name in self.TRACKED_FIELDS:
+            # update_fields may name a foreign key by field name rather than attname
+            if fields is None or name in fields or (name.endswith('_id') and name[:-3] in fields):
+                snapshot[name] = getattr(self, name)
+    
+    def old_value(self, field):
+        """Value of a tracked field as last loaded or saved (None for unsaved applications)."""
+        if field not in self.TRACKED_FIELDS:
+            raise ValueError(f"{field} is not a tracked CreditApplication field")
+        return self._tracked_snapshot().get(field)
+    
+    def has_changed(self, field):
+        """Whether a tracked field differs from its saved value (always True for unsaved applications)."""
+        if self._state.adding:
+            return True
+        return self.old_value(field) != getattr(self, field)
+    
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._refresh_snapshot(fields)
+    
     def save(self, *args, **kwargs):
         # Track if this is a status change
-        is_new = self.pk is None
-        old_status = None
-        
-        if not is_new:
-            # Get the old status before saving
-            try:
-                old_instance = CreditApplication.objects.get(pk=self.pk)
-                old_status = old_instance.status
-            except CreditApplication.DoesNotExist:
-                old_status = None
+        is_new = self._state.adding
+        old_status = None if is_new else self.old_value('status')
         
         # Generate reference number when submitted
         if not self.reference_number and self.status == 'SUBMITTED':
@@ -109,6 +165,14 @@ class CreditApplication(models.Model):
         if self.status == 'SUBMITTED' and not self.submission_date:
             self.submission_date = timezone.now()
         
+        # Record when an analyst is (re)assigned, for the assignment rotation
+        update_fields = kwargs.get('update_fields')
+        if (self.assigned_analyst_id and (update_fields is None or 'assigned_analyst' in update_fields)
+                and self.has_changed('assigned_analyst_id')):
+            self.assigned_at = timezone.now()
+            if update_fields is not None:
+                kwargs['update_fields'] = [*update_fields, 'assigned_at']
+        
         super().save(*args, **kwargs)
         
         # Create status history and activity records after saving
@@ -126,6 +190,9 @@ class CreditApplication(models.Model):
                 self.applicant,
                 f"Application {self.reference_number or 'draft'} created"
             )
+        
+        # Post-save signal handlers have seen the old values; this save is now the baseline
+        self._refresh_snapshot(kwargs.get('update_fields'))
     
     @classmethod
     def create_for_user(cls, user, **kwargs):
@@ -0,0 +1,86 @@
+"""
+Shared services for credit applications
+Builds the ML model input from an application; used by the submit view,
+the ML assessment tasks and the management commands.
+"""
+
+import logging
+from typing import Any, Dict
+
+from .models import CreditApplication
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_ml_input_data(application: CreditApplication) -> Dict[str, Any]:
+    """
+    Prepare input data for ML model from credit application.
+    
+    Args:
+        application: CreditApplication instance
+        
+    Returns:
+        Dictionary formatted for ML model input
+    """
+    # Extract all relevant fields for ML model
+    ml_data = {
+        'annual_inc': float(application.annual_income or 50000),
+        'dti': float(application.debt_to_income_ratio or 20.0),
+        'int_rate': float(application.interest_rate or 12.0),
+        'revol_util': float(application.revolving_utilization or 50.0),
+        'delinq_2yrs': int(application.delinquencies_2yr or 0),
+        'inq_last_6mths': int(application.inquiries_6mo or 1),
+        'emp_length': str(application.employment_length or '5 years'),
+        'open_acc': int(application.open_accounts or 8),
+        'collections_12_mths_ex_med': int(application.collections_12mo or 0),
+        'loan_amnt': float(application.loan_amount or 25000),
+        'credit_history_length': float(application.credit_history_length or 10.0),
+        'max_bal_bc': float(application.max_bankcard_balance or 5000),
+        'total_acc': int(application.total_accounts or 15),
+        'open_rv_12m': int(application.revolving_accounts_12mo or 2),
+        'pub_rec': int(application.public_records or 0),
+        'home_ownership': str(application.home_ownership or 'RENT'),
+    }
+    
+    # Add Ghana-specific employment features
+    if application.job_title:
+        ml_data['emp_title'] = application.job_title
+    
+    return ml_data
+
+
+def validate_ml_input(ml_data: Dict[str, Any]) -> bool:
+    """
+    Validate ML input data for completeness and ranges.
+    
+    Args:
+        ml_data: ML input dictionary
+        
+    Returns:
+        True if valid, False otherwise
+    """
+    required_fields = [
+        'annual_inc', 'dti', 'int_rate', 'revol_util', 'delinq_2yrs',
+        'inq_last_6mths', 'emp_length', 'open_acc', 'loan_amnt'
+    ]
+    
+    # Check required fields
+    for field in required_fields:
+        if field not in ml_data or ml_data[field] is None:
+            logger.error(f"Missing required ML field: {field}")
+            return False
+    
+    # Basic range validations
+    if ml_data['annual_inc'] <= 0 or ml_data['annual_inc'] > 10000000:
+        logger.error(f"Invalid annual income: {ml_data['annual_inc']}")
+        return False
+        
+    if ml_data['dti'] < 0 or ml_data['dti'] > 100:
+        logger.error(f"Invalid debt-to-income ratio: {ml_data['dti']}")
+        return False
+        
+    if ml_data['int_rate'] < 0 or ml_data['int_rate'] > 50:
+        logger.error(f"Invalid interest rate: {ml_data['int_rate']}")
+        return False
+    
+    return True
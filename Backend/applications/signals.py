@@ -4,49 +4,67 @@ Automatically triggers ML credit assessment and handles status changes with noti
 """
 
 import logging
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django.core.cache import cache
+from django.conf import settings
 from django.utils import timezone
 from .models import CreditApplication
-from .tasks import process_ml_credit_assessment
+from .tasks import process_ml_credit_assessment, enqueue_ml_assessment
 from users.models import User
 
 logger = logging.getLogger(__name__)
 
 
+# Statuses that count towards an analyst's open workload
+OPEN_REVIEW_STATUSES = ['SUBMITTED', 'UNDER_REVIEW', 'NEEDS_INFO']
+
+
 def auto_assign_risk_analyst(application):
-    """Automatically assign a risk analyst to the application"""
+    """
+    Automatically assign a risk analyst to the application.
+    
+    The least-loaded active analyst is picked in one query, with open
+    workloads counted by a correlated subquery; ties go to the analyst whose
+    latest assignment is oldest. The chosen analyst's row stays locked until
+    the assignment commits and concurrent submissions skip locked rows, so
+    simultaneous submissions spread across analysts instead of all landing
+    on the same one.
+    """
     try:
-        # Get all available risk analysts
-        risk_analysts = User.objects.filter(
+        open_workload = CreditApplication.objects.filter(
+            assigned_analyst=OuterRef('pk'),
+            status__in=OPEN_REVIEW_STATUSES
+        ).order_by().values('assigned_analyst').annotate(count=Count('pk')).values('count')
+        last_assigned = CreditApplication.objects.filter(
+            assigned_analyst=OuterRef('pk')
+        ).order_by(F('assigned_at').desc(nulls_last=True)).values('assigned_at')[:1]
+        
+        analysts = User.objects.filter(
             user_type='ANALYST',
             is_active=True
-        )
-        
-        if not risk_analysts.exists():
-            logger.warning(f"No risk analysts available to assign application {application.id}")
-            return None
+        ).annotate(
+            workload=Coalesce(Subquery(open_workload), 0),
+            last_assigned=Subquery(last_assigned)
+        ).order_by('workload', F('last_assigned').asc(nulls_first=True), 'pk')
+        
+        with transaction.atomic():
+            selected_analyst = analysts.select_for_update(skip_locked=True, of=('self',)).first()
+            if selected_analyst is None:
+                # Every analyst is locked by a concurrent assignment; take the least loaded anyway
+                selected_analyst = analysts.first()
+            if selected_analyst is None:
+                logger.warning(f"No risk analysts available to assign application {application.id}")
+                return None
             
-        # Simple round-robin assignment based on current workload
-        analyst_workloads = []
-        for analyst in risk_analysts:
-            # Count applications currently assigned to this analyst that are not completed
-            active_applications = CreditApplication.objects.filter(
-                assigned_analyst=analyst,
-                status__in=['SUBMITTED', 'UNDER_REVIEW', 'NEEDS_INFO']
-            ).count()
-            analyst_workloads.append((analyst, active_applications))
+            # Assign the analyst
+            application.assigned_analyst = selected_analyst
+            application.save(update_fields=['assigned_analyst'])
         
-        # Sort by workload (ascending) and assign to analyst with least workload
-        analyst_workloads.sort(key=lambda x: x[1])
-        selected_analyst = analyst_workloads[0][0]
-        
-        # Assign the analyst
-        application.assigned_analyst = selected_analyst
-        application.save(update_fields=['assigned_analyst'])
-        
-        logger.info(f"Auto-assigned application {application.id} to analyst {selected_analyst.email}")
+        logger.info(f"Auto-assigned application {application.id} to analyst {selected_analyst.email} "
+                    f"(open workload {selected_analyst.workload})")
         return selected_analyst
         
     except Exception as e:
@@ -81,7 +99,8 @@ def trigger_ml_assessment_on_submission(sender, instance, created, **kwargs):
         # Send notifications to all relevant parties
         send_status_update_notifications(instance, 'DRAFT', 'SUBMITTED')
         
-        process_ml_credit_assessment.delay(str(instance.id))
+        if getattr(settings, 'ML_AUTO_TRIGGER_ON_SUBMIT', True):
+            enqueue_ml_assessment(instance.id, on_submission=True)
         return
     
     # Only trigger ML processing for submitted applications
@@ -91,57 +110,10 @@ def trigger_ml_assessment_on_submission(sender, instance, created, **kwargs):
     # For updated applications, check if ML-relevant fields changed
     if _has_ml_relevant_changes(instance):
         logger.info(f"ML-relevant changes detected for {instance.reference_number} - Triggering ML reassessment")
-        process_ml_credit_assessment.delay(str(instance.id), force_reprocess=True)
-
-
-@receiver(pre_save, sender=CreditApplication)
-def cache_previous_ml_data(sender, instance, **kwargs):
-    """
-    Cache previous ML-relevant data before save to detect changes.
-    
-    Args:
-        sender: CreditApplication model class
-        instance: CreditApplication instance
-        **kwargs: Additional signal arguments
-    """
-    # Only cache for existing instances
-    if not instance.pk:
-        return
-    
-    try:
-        # Get current instance from database
-        current = CreditApplication.objects.get(pk=instance.pk)
-        
-        # Cache ML-relevant fields
-        ml_fields = {
-            'annual_income': current.annual_income,
-            'debt_to_income_ratio': current.debt_to_income_ratio,
-            'interest_rate': current.interest_rate,
-            'revolving_utilization': current.revolving_utilization,
-            'delinquencies_2yr': current.delinquencies_2yr,
-            'inquiries_6mo': current.inquiries_6mo,
-            'employment_length': current.employment_length,
-            'open_accounts': current.open_accounts,
-            'collections_12mo': current.collections_12mo,
-            'loan_amount': current.loan_amount,
-            'credit_history_length': current.credit_history_length,
-            'max_bankcard_balance': current.max_bankcard_balance,
-            'total_accounts': current.total_accounts,
-            'revolving_accounts_12mo': current.revolving_accounts_12mo,
-            'public_records': current.public_records,
-            'home_ownership': current.home_ownership,
-            'job_title': current.job_title,
-            'status': current.status
-        }
-        
-        cache_key = f"ml_fields_{instance.pk}"
-        cache.set(cache_key, ml_fields, timeout=300)  # 5 minutes
-        
-    except CreditApplication.DoesNotExist:
-        # Instance doesn't exist yet, skip caching
-        pass
-    except Exception as e:
-        logger.error(f"Failed to cache ML fields for application {instance.pk}: {str(e)}")
+        enqueue_ml_assessment(
+            instance.id, force_reprocess=True,
+            debounce_seconds=getattr(settings, 'ML_REASSESSMENT_DEBOUNCE_SECONDS', 30)
+        )
 
 
 def _has_ml_relevant_changes(instance):
@@ -154,12 +126,6 @@ def _has_ml_relevant_changes(instance):
     Returns:
         True if ML-relevant changes detected, False otherwise
     """
-    cache_key = f"ml_fields_{instance.pk}"
-    previous_fields = cache.get(cache_key)
-    
-    if not previous_fields:
-        return False
-    
     # List of fields that trigger ML reprocessing if changed
     ml_sensitive_fields = [
         'annual_income',
@@ -178,7 +144,7 @@ def _has_ml_relevant_changes(instance):
     
     for field in ml_sensitive_fields:
         current_value = getattr(instance, field)
-        previous_value = previous_fields.get(field)
+        previous_value = instance.old_value(field)
         
         # Check if values are significantly different
         if _is_significant_change(field, previous_value, current_value):
@@ -239,20 +205,6 @@ def _is_significant_change(field_name, old_value, new_value):
     return old_value != new_value
 
 
-@receiver(post_save, sender=CreditApplication)
-def cleanup_ml_cache(sender, instance, **kwargs):
-    """
-    Clean up cached ML fields after processing.
-    
-    Args:
-        sender: CreditApplication model class
-        instance: CreditApplication instance
-        **kwargs: Additional signal arguments
-    """
-    cache_key = f"ml_fields_{instance.pk}"
-    cache.delete(cache_key)
-
-
 @receiver(post_save, sender=CreditApplication)
 def handle_status_change_notifications(sender, instance, created, **kwargs):
     """
@@ -263,9 +215,8 @@ def handle_status_change_notifications(sender, instance, created, **kwargs):
         return
     
     try:
-        # Get the previous instance to detect status changes
-        cache_key = f"app_status_{instance.pk}"
-        previous_status = cache.get(cache_key)
+        # Status as loaded before this save
+        previous_status = instance.old_value('status')
         
         if previous_status and previous_status != instance.status:
             logger.info(f"Status changed from {previous_status} to {instance.status} for application {instance.id}")
@@ -276,31 +227,10 @@ def handle_status_change_notifications(sender, instance, created, **kwargs):
             # Create status history record
             create_status_change_records(instance, previous_status, instance.status)
         
-        # Cache current status for next time
-        cache.set(cache_key, instance.status, timeout=3600)  # 1 hour
-        
     except Exception as e:
         logger.error(f"Failed to handle status change notifications: {str(e)}")
 
 
-@receiver(pre_save, sender=CreditApplication)
-def cache_previous_status(sender, instance, **kwargs):
-    """
-    Cache the previous status before saving to detect changes.
-    """
-    if not instance.pk:
-        return
-        
-    try:
-        current = CreditApplication.objects.get(pk=instance.pk)
-        cache_key = f"app_status_{instance.pk}"
-        cache.set(cache_key, current.status, timeout=300)  # 5 minutes
-    except CreditApplication.DoesNotExist:
-        pass
-    except Exception as e:
-        logger.error(f"Failed to cache previous status: {str(e)}")
-
-
 # Manual trigger functions for admin/API use
 def trigger_manual_ml_assessment(application_id, force_reprocess=False):
     """
@@ -5,16 +5,20 @@ Automated ML processing with Celery background tasks
 
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 from datetime import datetime
 from celery import shared_task
+from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.core.exceptions import ValidationError
 
-from .models import CreditApplication, MLCreditAssessment
+from .models import CreditApplication, MLCreditAssessment, ApplicationNote
+from .services import prepare_ml_input_data, validate_ml_input
 from ml_model.src.credit_scorer import get_credit_scorer
+from risk.models import RiskAssessment
+from risk.services import RiskEngine, ExplanationService, CounterfactualService
 from ml_model.ghana_employment_processor import (
     categorize_ghana_job_title, 
     calculate_ghana_employment_score,
@@ -26,15 +30,194 @@ from django.contrib.contenttypes.models import ContentType
 
 logger = logging.getLogger(__name__)
 
+# Former private names, still used by the management commands and tests
+_prepare_ml_input_data = prepare_ml_input_data
+_validate_ml_input = validate_ml_input
+
+
+# Redis clients for the ML job leases, one per ML_JOBS_REDIS_URL
+_lease_clients: Dict[str, Any] = {}
+
+# Merge a trigger into the queued job's lease, or create the lease if no job
+# is queued. Returns 1 when the lease was created and the caller must send
+# the job, 0 when the trigger was merged into a queued one.
+# KEYS: lease; ARGV: force_reprocess, on_submission, not_before, timeout
+_MERGE_LEASE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('HSET', KEYS[1], 'force_reprocess', ARGV[1], 'on_submission', ARGV[2], 'not_before', ARGV[3])
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return 1
+end
+if ARGV[1] == '1' then redis.call('HSET', KEYS[1], 'force_reprocess', '1') end
+if ARGV[2] == '1' then redis.call('HSET', KEYS[1], 'on_submission', '1') end
+if tonumber(ARGV[3]) > tonumber(redis.call('HGET', KEYS[1], 'not_before') or '0') then
+    redis.call('HSET', KEYS[1], 'not_before', ARGV[3])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 0
+"""
+
+# Read the lease's merged flags and release it unless the debounce window is
+# still open. KEYS: lease; ARGV: now
+_CLAIM_LEASE_SCRIPT = """
+local options = redis.call('HGETALL', KEYS[1])
+local not_before = tonumber(redis.call('HGET', KEYS[1], 'not_before') or '0')
+if not_before <= tonumber(ARGV[1]) then
+    redis.call('DEL', KEYS[1])
+end
+return options
+"""
+
+
+def enqueue_ml_assessment(application_id, force_reprocess: bool = False, on_submission: bool = False,
+                          provisional_result: Optional[Dict[str, Any]] = None, debounce_seconds: int = 0) -> None:
+    """
+    Queue process_ml_credit_assessment, coalescing requests for the same application.
+    
+    Only one job per application waits in the queue at a time; a lease
+    (ml_queued_<id>) on the ML_JOBS_REDIS_URL Redis server marks it. Requests
+    made while a job is queued are merged into it atomically (their flags
+    are read by the job when it starts), so a submission that is seen by
+    both the submit view and the post_save signal is scored once.
+    
+    Everything happens after the current transaction commits, so a rolled
+    back request leaves no lease behind and the job always reads the saved
+    application. Without ML_JOBS_REDIS_URL, or when Redis cannot be
+    reached, every request queues its own job.
+    
+    With debounce_seconds, the job runs only once that many seconds have
+    passed without another request: each merged request pushes the start
+    back, and a job that starts early re-schedules itself. A burst of edits
+    is scored once, against the latest state.
+    
+    Args:
+        application_id: UUID of the credit application
+        force_reprocess: Force reprocessing even if assessment exists
+        on_submission: Also run the submission steps (risk assessment, audit note)
+        provisional_result: Synchronous prediction to reuse, as {'ml_input': ..., 'prediction': ...}
+        debounce_seconds: Quiet period to wait for before scoring
+    """
+    application_id = str(application_id)
+    
+    def send(coalesced: bool):
+        kwargs = {'on_submission': on_submission, 'provisional_result': provisional_result}
+        if coalesced:
+            kwargs['coalesced'] = True
+        process_ml_credit_assessment.apply_async(
+            (application_id, force_reprocess), kwargs, countdown=debounce_seconds or None
+        )
+    
+    def dispatch():
+        if not _coalescing_available():
+            send(coalesced=False)
+            return
+        
+        cache_key = f'ml_queued_{application_id}'
+        timeout = getattr(settings, 'ML_ASSESSMENT_COALESCE_SECONDS', 600) + debounce_seconds
+        try:
+            created = _run_lease_script(
+                _MERGE_LEASE_SCRIPT, cache_key,
+                int(force_reprocess), int(on_submission), time.time() + debounce_seconds, timeout
+            )
+        except Exception as e:
+            logger.warning(f"ML job lease unavailable for application {application_id}, queueing without it: {str(e)}")
+            send(coalesced=False)
+            return
+        
+        if not created:
+            logger.info(f"ML assessment for application {application_id} merged into the queued job")
+            return
+        
+        try:
+            send(coalesced=True)
+        except Exception:
+            # No job will release the lease; drop it so later requests queue again
+            _delete_lease(cache_key)
+            raise
+    
+    transaction.on_commit(dispatch)
+
+
+def _lease_client():
+    """
+    Redis client holding the ML job leases, created once per process.
+    
+    Returns:
+        The client, or None when ML_JOBS_REDIS_URL is empty (no coalescing)
+    """
+    url = getattr(settings, 'ML_JOBS_REDIS_URL', '')
+    if not url:
+        return None
+    client = _lease_clients.get(url)
+    if client is None:
+        try:
+            import redis
+        except ImportError:
+            logger.warning("redis is not installed; ML assessment triggers are not coalesced")
+            return None
+        client = _lease_clients[url] = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+    return client
+
+
+def _coalescing_available() -> bool:
+    """Whether a Redis server shared between processes is configured for the queued-job lease."""
+    return _lease_client() is not None
+
+
+def _run_lease_script(script: str, cache_key: str, *args):
+    """Run a lease script against the ML job Redis server."""
+    return _lease_client().register_script(script)(keys=[cache_key], args=list(args))
+
+
+def _delete_lease(cache_key: str) -> None:
+    """Drop a lease whose job could not be sent."""
+    try:
+        _lease_client().delete(cache_key)
+    except Exception as e:
+        logger.error(f"Could not release ML job lease {cache_key}: {str(e)}")
+
+
+def _claim_queued_options(application_id: str) -> Tuple[Dict[str, Any], float]:
+    """
+    Take the flags merged into this application's queued job.
+    
+    Returns:
+        (merged flags, seconds until the debounce window ends). When the
+        window is still open the lease is kept, otherwise it is released so
+        new requests queue a new job. If the lease cannot be read the job
+        runs with its own flags.
+    """
+    cache_key = f'ml_queued_{application_id}'
+    now = time.time()
+    try:
+        fields = _run_lease_script(_CLAIM_LEASE_SCRIPT, cache_key, now)
+    except Exception as e:
+        logger.warning(f"Could not read ML job lease for application {application_id}: {str(e)}")
+        return {}, 0
+    
+    lease = {name.decode() if isinstance(name, bytes) else name: value for name, value in zip(fields[::2], fields[1::2])}
+    options = {
+        'force_reprocess': int(lease.get('force_reprocess', 0)) == 1,
+        'on_submission': int(lease.get('on_submission', 0)) == 1,
+        'not_before': float(lease.get('not_before', 0)),
+    }
+    return options, max(options['not_before'] - now, 0)
+
 
 @shared_task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
-def process_ml_credit_assessment(self, application_id: str, force_reprocess: bool = False):
+def process_ml_credit_assessment(self, application_id: str, force_reprocess: bool = False,
+                                 on_submission: bool = False, provisional_result: Optional[Dict[str, Any]] = None,
+                                 coalesced: bool = False):
     """
     Process ML credit assessment for a credit application.
     
     Args:
         application_id: UUID of the credit application
         force_reprocess: Force reprocessing even if assessment exists
+        on_submission: Also run the risk assessment and write the submission audit note
+        provisional_result: Prediction already made at submission, reused when
+            the application's ML input has not changed since
+        coalesced: Queued by enqueue_ml_assessment; merge the requests made while queued
     
     Returns:
         Dict with processing results
@@ -42,6 +225,27 @@ def process_ml_credit_assessment(self, application_id: str, force_reprocess: boo
     start_time = time.time()
     
     try:
+        if coalesced:
+            queued_options, remaining = _claim_queued_options(application_id)
+            if remaining > 0:
+                # Requests arrived during the debounce window; wait for it to close
+                try:
+                    self.apply_async(
+                        (application_id, force_reprocess),
+                        {'on_submission': on_submission, 'provisional_result': provisional_result, 'coalesced': True},
+                        countdown=remaining
+                    )
+                except Exception:
+                    _delete_lease(f'ml_queued_{application_id}')
+                    raise
+                return {
+                    'status': 'deferred',
+                    'message': f'Debounced for {remaining:.1f}s',
+                    'application_id': str(application_id)
+                }
+            force_reprocess = force_reprocess or queued_options.get('force_reprocess', False)
+            on_submission = on_submission or queued_options.get('on_submission', False)
+        
         # Get application
         application = CreditApplication.objects.get(pk=application_id)
         
@@ -74,17 +278,18 @@ def process_ml_credit_assessment(self, application_id: str, force_reprocess: boo
         ml_notification_service.ml_processing_started(application.applicant, application)
         
         # Prepare ML input data
-        ml_input_data = _prepare_ml_input_data(application)
+        ml_input_data = prepare_ml_input_data(application)
         
         # Validate ML input
-        if not _validate_ml_input(ml_input_data):
+        if not validate_ml_input(ml_input_data):
             raise ValueError("Invalid ML input data")
         
-        # Get ML credit scorer
-        scorer = get_credit_scorer()
-        
-        # Process ML prediction
-        prediction_result = scorer.predict_credit_score(ml_input_data)
+        # Reuse the submission's provisional prediction if it scored the same input
+        if (provisional_result and provisional_result.get('ml_input') == ml_input_data
+                and provisional_result.get('prediction', {}).get('success')):
+            prediction_result = provisional_result['prediction']
+        else:
+            prediction_result = get_credit_scorer().predict_credit_score(ml_input_data)
         
         if not prediction_result.get('success', False):
             raise ValueError(f"ML prediction failed: {prediction_result.get('error', 'Unknown error')}")
@@ -104,18 +309,21 @@ def process_ml_credit_assessment(self, application_id: str, force_reprocess: boo
                 ml_assessment = _create_ml_assessment(application, prediction_result, ghana_employment_data)
                 logger.info(f"Created ML assessment for {application.reference_number}")
         
+        # Store the score explanation alongside the assessment
+        save_risk_explanations([application], [ml_input_data], [prediction_result])
+        save_counterfactual_explanations([application], [ml_input_data])
+        
         # Calculate processing time
         processing_time_ms = int((time.time() - start_time) * 1000)
         ml_assessment.processing_time_ms = processing_time_ms
         ml_assessment.save()
         
-        # Send completion notifications
-        ml_notification_service.ml_processing_completed(application.applicant, application, ml_assessment)
-        ml_notification_service.credit_score_generated(application.applicant, application, ml_assessment)
+        if on_submission:
+            save_risk_assessment(application)
+            _create_submission_note(application, ml_assessment)
         
-        # Create notification for assigned analyst
-        if application.assigned_analyst:
-            _create_ml_assessment_notification(application, ml_assessment)
+        # Send completion notifications
+        _send_assessment_notifications(application, ml_assessment)
         
         # Clear cache
         cache.delete(cache_key)
@@ -158,10 +366,14 @@ def process_ml_credit_assessment(self, application_id: str, force_reprocess: boo
         # Clear cache on error
         cache.delete(f'ml_processing_{application_id}')
         
-        # Retry logic
+        # Retry logic; the lease is already claimed, so retry with the merged flags
         if self.request.retries < self.max_retries:
             logger.info(f"Retrying ML processing for application {application_id} (attempt {self.request.retries + 1})")
-            raise self.retry(countdown=60 * (2 ** self.request.retries))  # Exponential backoff
+            raise self.retry(
+                args=(application_id, force_reprocess),
+                kwargs={'on_submission': on_submission, 'provisional_result': provisional_result},
+                countdown=60 * (2 ** self.request.retries)  # Exponential backoff
+            )
         
         return {
             'status': 'failed',
@@ -171,47 +383,149 @@ def process_ml_credit_assessment(self, application_id: str, force_reprocess: boo
         }
 
 
-@shared_task
-def batch_process_ml_assessments(application_ids: list, force_reprocess: bool = False):
+@shared_task(bind=True)
+def batch_process_ml_assessments(self, application_ids: list, force_reprocess: bool = False, notify: bool = True):
     """
     Process ML assessments for multiple applications in batch.
     
+    Applications are loaded with one query, scored with one model call and
+    their assessments written with bulk_create/bulk_update in one
+    transaction. Progress is reported through the task state
+    (PROGRESS with stage, current and total).
+    
     Args:
         application_ids: List of application UUIDs
         force_reprocess: Force reprocessing even if assessments exist
+        notify: Send the completion notifications for each scored application
     
     Returns:
         Dict with batch processing results
     """
     logger.info(f"Starting batch ML processing for {len(application_ids)} applications")
     
+    _report_batch_progress(self, 'loading', 0, len(application_ids))
+    loaded = {
+        str(application.id): application
+        for application in CreditApplication.objects.filter(pk__in=application_ids)
+        .select_related('ml_assessment', 'applicant', 'assigned_analyst')
+    }
+    applications = [loaded[app_id] for app_id in map(str, application_ids) if app_id in loaded]
+    missing = [app_id for app_id in map(str, application_ids) if app_id not in loaded]
+    
+    results, assessed = assess_applications(
+        applications, force_reprocess,
+        progress_callback=lambda stage, current, total: _report_batch_progress(self, stage, current, total)
+    )
+    results['total'] += len(missing)
+    results['failed'] += len(missing)
+    results['errors'] += [f"{app_id}: Application not found" for app_id in missing]
+    
+    if notify and assessed:
+        _report_batch_progress(self, 'notifying', results['completed'], len(assessed))
+        for application, assessment in assessed:
+            try:
+                _send_assessment_notifications(application, assessment)
+            except Exception as e:
+                logger.error(f"Notifications failed for application {application.id}: {str(e)}")
+    
+    logger.info(f"Batch ML processing completed: {results['completed']} successful, {results['failed']} failed, {results['skipped']} skipped")
+    return results
+
+
+def assess_applications(applications: list, force_reprocess: bool = False,
+                        progress_callback: Optional[Callable[[str, int, int], None]] = None) -> Tuple[Dict[str, Any], list]:
+    """
+    Score loaded applications with one model call and bulk-save their assessments.
+    
+    Applications that already have an assessment, or are being processed by
+    another task, are skipped unless force_reprocess is set. Explanations and
+    counterfactuals are stored for every saved assessment; notifications are
+    left to the caller.
+    
+    Args:
+        applications: CreditApplication instances, loaded with select_related('ml_assessment')
+        force_reprocess: Force reprocessing even if assessments exist
+        progress_callback: Optional callable(stage, current, total)
+    
+    Returns:
+        (results dict with total/completed/skipped/failed/errors,
+         list of (application, assessment) pairs that were saved)
+    """
+    start_time = time.time()
+    report = progress_callback or (lambda stage, current, total: None)
     results = {
-        'total': len(application_ids),
+        'total': len(applications),
         'completed': 0,
         'skipped': 0,
         'failed': 0,
         'errors': []
     }
     
-    for app_id in application_ids:
-        try:
-            result = process_ml_credit_assessment.delay(app_id, force_reprocess).get(timeout=300)  # 5 minutes
-            
-            if result['status'] == 'completed':
-                results['completed'] += 1
-            elif result['status'] == 'skipped':
-                results['skipped'] += 1
-            else:
-                results['failed'] += 1
-                results['errors'].append(f"{app_id}: {result.get('error', 'Unknown error')}")
-                
-        except Exception as e:
+    processing = cache.get_many([f'ml_processing_{application.id}' for application in applications])
+    candidates = []
+    ml_inputs = []
+    for application in applications:
+        if not force_reprocess and (getattr(application, 'ml_assessment', None)
+                                    or f'ml_processing_{application.id}' in processing):
+            results['skipped'] += 1
+            continue
+        
+        ml_input_data = prepare_ml_input_data(application)
+        if not validate_ml_input(ml_input_data):
             results['failed'] += 1
-            results['errors'].append(f"{app_id}: {str(e)}")
-            logger.error(f"Batch processing failed for application {app_id}: {str(e)}")
+            results['errors'].append(f"{application.id}: Invalid ML input data")
+            continue
+        candidates.append(application)
+        ml_inputs.append(ml_input_data)
     
-    logger.info(f"Batch ML processing completed: {results['completed']} successful, {results['failed']} failed, {results['skipped']} skipped")
-    return results
+    if not candidates:
+        return results, []
+    
+    report('scoring', 0, len(candidates))
+    try:
+        batch_result = get_credit_scorer().batch_predict_compact(ml_inputs)
+    except Exception as e:
+        logger.error(f"Batch ML scoring failed: {str(e)}", exc_info=True)
+        results['failed'] += len(candidates)
+        results['errors'].append(f"Batch scoring failed: {str(e)}")
+        return results, []
+    
+    scored = []
+    for i, (application, ml_input_data) in enumerate(zip(candidates, ml_inputs)):
+        prediction_result = batch_result.to_dict(i)
+        if not prediction_result.get('success', False):
+            results['failed'] += 1
+            results['errors'].append(f"{application.id}: {prediction_result.get('error', 'Unknown error')}")
+            continue
+        scored.append((application, ml_input_data, prediction_result))
+    
+    if not scored:
+        return results, []
+    
+    report('saving', 0, len(scored))
+    scored_applications, scored_inputs, predictions = map(list, zip(*scored))
+    ghana_data = [_process_ghana_employment_features(application) for application in scored_applications]
+    processing_time_ms = int((time.time() - start_time) * 1000 / len(scored))
+    try:
+        assessments = save_ml_assessments(scored_applications, predictions, ghana_data, processing_time_ms)
+    except Exception as e:
+        logger.error(f"Saving batch ML assessments failed: {str(e)}", exc_info=True)
+        results['failed'] += len(scored)
+        results['errors'].append(f"Saving assessments failed: {str(e)}")
+        return results, []
+    results['completed'] = len(assessments)
+    
+    report('explaining', results['completed'], len(scored))
+    save_risk_explanations(scored_applications, scored_inputs, predictions)
+    save_counterfactual_explanations(scored_applications, scored_inputs)
+    
+    return results, list(zip(scored_applications, assessments))
+
+
+def _report_batch_progress(task, stage: str, current: int, total: int) -> None:
+    """Publish batch progress as the PROGRESS task state (no-op when called outside a worker)."""
+    if task.request.id:
+        task.update_state(state='PROGRESS', meta={'stage': stage, 'current': current, 'total': total})
 
 
 @shared_task
@@ -226,78 +540,123 @@ def cleanup_stale_ml_processing_locks():
     return {"status": "completed", "message": "Stale locks cleaned up"}
 
 
-def _prepare_ml_input_data(application: CreditApplication) -> Dict[str, Any]:
+def save_risk_explanations(applications: list, ml_inputs: list, predictions: Optional[list] = None) -> int:
     """
-    Prepare input data for ML model from credit application.
+    Store RiskExplanation rows for scored applications in one batch.
+    
+    Explanation failures are logged and never fail the assessment itself.
     
-    Args:
-        application: CreditApplication instance
-        
     Returns:
-        Dictionary formatted for ML model input
-    """
-    # Extract all relevant fields for ML model
-    ml_data = {
-        'annual_inc': float(application.annual_income or 50000),
-        'dti': float(application.debt_to_income_ratio or 20.0),
-        'int_rate': float(application.interest_rate or 12.0),
-        'revol_util': float(application.revolving_utilization or 50.0),
-        'delinq_2yrs': int(application.delinquencies_2yr or 0),
-        'inq_last_6mths': int(application.inquiries_6mo or 1),
-        'emp_length': str(application.employment_length or '5 years'),
-        'open_acc': int(application.open_accounts or 8),
-        'collections_12_mths_ex_med': int(application.collections_12mo or 0),
-        'loan_amnt': float(application.loan_amount or 25000),
-        'credit_history_length': float(application.credit_history_length or 10.0),
-        'max_bal_bc': float(application.max_bankcard_balance or 5000),
-        'total_acc': int(application.total_accounts or 15),
-        'open_rv_12m': int(application.revolving_accounts_12mo or 2),
-        'pub_rec': int(application.public_records or 0),
-        'home_ownership': str(application.home_ownership or 'RENT'),
-    }
+        Number of explanations stored
+    """
+    if not getattr(settings, 'ML_EXPLANATIONS_ON_SCORING', True) or not applications:
+        return 0
     
-    # Add Ghana-specific employment features
-    if application.job_title:
-        ml_data['emp_title'] = application.job_title
+    try:
+        return len(ExplanationService().save_explanations(applications, ml_inputs, predictions))
+    except Exception as e:
+        logger.error(f"Storing risk explanations failed for {len(applications)} applications: {str(e)}")
+        return 0
+
+
+def save_counterfactual_explanations(applications: list, ml_inputs: list) -> int:
+    """
+    Store CounterfactualExplanation rows for scored applications in one batch.
     
-    return ml_data
+    Counterfactual failures are logged and never fail the assessment itself.
+    
+    Returns:
+        Number of counterfactual scenarios stored
+    """
+    if not getattr(settings, 'ML_COUNTERFACTUALS_ON_SCORING', False) or not applications:
+        return 0
+    
+    try:
+        return len(CounterfactualService().save_counterfactuals(applications, ml_inputs))
+    except Exception as e:
+        logger.error(f"Storing counterfactuals failed for {len(applications)} applications: {str(e)}")
+        return 0
 
 
-def _validate_ml_input(ml_data: Dict[str, Any]) -> bool:
+def save_risk_assessment(application: CreditApplication) -> Optional[RiskAssessment]:
     """
-    Validate ML input data for completeness and ranges.
+    Run the risk engine for a submitted application, once per application.
+    
+    Risk assessment failures are logged and never fail the ML assessment itself.
     
-    Args:
-        ml_data: ML input dictionary
-        
     Returns:
-        True if valid, False otherwise
+        The new RiskAssessment, or None if one exists or the engine failed
+    """
+    if RiskAssessment.objects.filter(application=application).exists():
+        return None
+    
+    try:
+        return RiskEngine().calculate_risk(application)
+    except Exception as e:
+        logger.error(f"Risk assessment failed for application {application.id}: {str(e)}")
+        return None
+
+
+def save_submission_assessment(application: CreditApplication,
+                               provisional_result: Optional[Dict[str, Any]] = None) -> Optional[MLCreditAssessment]:
     """
-    required_fields = [
-        'annual_inc', 'dti', 'int_rate', 'revol_util', 'delinq_2yrs',
-        'inq_last_6mths', 'emp_length', 'open_acc', 'loan_amnt'
-    ]
+    Store a submission's ML assessment, audit note and risk assessment within the request.
     
-    # Check required fields
-    for field in required_fields:
-        if field not in ml_data or ml_data[field] is None:
-            logger.error(f"Missing required ML field: {field}")
-            return False
+    Used when no background job runs the submission steps
+    (ML_AUTO_TRIGGER_ON_SUBMIT off). The provisional prediction is reused
+    when it succeeded; explanations, counterfactuals and notifications are
+    left to a later reprocess. The risk assessment is stored even if
+    scoring fails.
     
-    # Basic range validations
-    if ml_data['annual_inc'] <= 0 or ml_data['annual_inc'] > 10000000:
-        logger.error(f"Invalid annual income: {ml_data['annual_inc']}")
-        return False
-        
-    if ml_data['dti'] < 0 or ml_data['dti'] > 100:
-        logger.error(f"Invalid debt-to-income ratio: {ml_data['dti']}")
-        return False
+    Args:
+        application: Submitted CreditApplication
+        provisional_result: Prediction made at submission, as {'ml_input': ..., 'prediction': ...}
+    
+    Returns:
+        The saved assessment, or None if scoring failed
+    """
+    start_time = time.time()
+    assessment = None
+    try:
+        if provisional_result and provisional_result.get('prediction', {}).get('success'):
+            prediction_result = provisional_result['prediction']
+        else:
+            ml_input_data = prepare_ml_input_data(application)
+            if not validate_ml_input(ml_input_data):
+                raise ValueError("Invalid ML input data")
+            prediction_result = get_credit_scorer().predict_credit_score(ml_input_data)
+            if not prediction_result.get('success', False):
+                raise ValueError(f"ML prediction failed: {prediction_result.get('error', 'Unknown error')}")
         
-    if ml_data['int_rate'] < 0 or ml_data['int_rate'] > 50:
-        logger.error(f"Invalid interest rate: {ml_data['int_rate']}")
-        return False
+        ghana_employment_data = _process_ghana_employment_features(application)
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        assessment = save_ml_assessments([application], [prediction_result], [ghana_employment_data],
+                                         processing_time_ms)[0]
+        _create_submission_note(application, assessment)
+    except Exception as e:
+        logger.error(f"ML assessment on submission failed for application {application.id}: {str(e)}")
     
-    return True
+    save_risk_assessment(application)
+    return assessment
+
+
+def _create_submission_note(application: CreditApplication, assessment: MLCreditAssessment) -> None:
+    """Write the internal audit note for a score generated on submission."""
+    try:
+        ApplicationNote.objects.create(
+            application=application,
+            author=application.applicant,
+            note=f"""Automatic ML Credit Score Generation:
+- Credit Score: {assessment.credit_score} ({assessment.category})
+- Risk Level: {assessment.risk_level}
+- Confidence: {assessment.confidence}%
+- Model Version: {assessment.model_version}
+- Processing Time: {assessment.processing_time_ms}ms
+- Generated automatically upon application submission""",
+            is_internal=True
+        )
+    except Exception as e:
+        logger.error(f"Failed to write submission note for application {application.id}: {str(e)}")
 
 
 def _process_ghana_employment_features(application: CreditApplication) -> Optional[Dict[str, Any]]:
@@ -337,20 +696,18 @@ def _process_ghana_employment_features(application: CreditApplication) -> Option
         return None
 
 
-def _create_ml_assessment(application: CreditApplication, prediction_result: Dict, ghana_data: Optional[Dict]) -> MLCreditAssessment:
+def _assessment_fields(prediction_result: Dict, ghana_data: Optional[Dict]) -> Dict[str, Any]:
     """
-    Create new ML credit assessment record.
+    MLCreditAssessment field values for a prediction.
     
     Args:
-        application: CreditApplication instance
         prediction_result: ML prediction results
         ghana_data: Ghana employment analysis results
         
     Returns:
-        Created MLCreditAssessment instance
+        Field values; Ghana fields are only included when analysis is available
     """
-    assessment_data = {
-        'application': application,
+    fields = {
         'credit_score': int(prediction_result['credit_score']),
         'category': prediction_result['category'],
         'risk_level': prediction_result['risk_level'],
@@ -363,13 +720,28 @@ def _create_ml_assessment(application: CreditApplication, prediction_result: Dic
     
     # Add Ghana employment features if available
     if ghana_data:
-        assessment_data.update({
+        fields.update({
             'ghana_job_category': ghana_data['job_category'],
             'ghana_employment_score': ghana_data['employment_score'],
             'ghana_job_stability_score': ghana_data['job_stability_score']
         })
     
-    return MLCreditAssessment.objects.create(**assessment_data)
+    return fields
+
+
+def _create_ml_assessment(application: CreditApplication, prediction_result: Dict, ghana_data: Optional[Dict]) -> MLCreditAssessment:
+    """
+    Create new ML credit assessment record.
+    
+    Args:
+        application: CreditApplication instance
+        prediction_result: ML prediction results
+        ghana_data: Ghana employment analysis results
+        
+    Returns:
+        Created MLCreditAssessment instance
+    """
+    return MLCreditAssessment.objects.create(application=application, **_assessment_fields(prediction_result, ghana_data))
 
 
 def _update_ml_assessment(assessment: MLCreditAssessment, prediction_result: Dict, ghana_data: Optional[Dict]) -> None:
@@ -381,23 +753,89 @@ def _update_ml_assessment(assessment: MLCreditAssessment, prediction_result: Dic
         prediction_result: ML prediction results
         ghana_data: Ghana employment analysis results
     """
-    assessment.credit_score = int(prediction_result['credit_score'])
-    assessment.category = prediction_result['category']
-    assessment.risk_level = prediction_result['risk_level']
-    assessment.confidence = float(prediction_result['confidence'])
-    assessment.model_version = prediction_result.get('model_version', '2.0.0')
-    assessment.model_accuracy = float(prediction_result.get('model_accuracy', 98.4))
-    assessment.confidence_factors = prediction_result.get('confidence_factors', {})
-    assessment.features_used = list(prediction_result.get('scaling_info', {}).keys()) if 'scaling_info' in prediction_result else []
+    for name, value in _assessment_fields(prediction_result, ghana_data).items():
+        setattr(assessment, name, value)
     assessment.prediction_timestamp = timezone.now()
+    assessment.save()
+
+
+def save_ml_assessments(applications: list, predictions: list, ghana_data: list,
+                        processing_time_ms: Optional[int] = None) -> list:
+    """
+    Create or update the MLCreditAssessment of many applications in one transaction.
     
-    # Update Ghana employment features if available
-    if ghana_data:
-        assessment.ghana_job_category = ghana_data['job_category']
-        assessment.ghana_employment_score = ghana_data['employment_score']
-        assessment.ghana_job_stability_score = ghana_data['job_stability_score']
+    Existing assessments are read (and locked) inside the transaction, so one
+    created by a concurrent task after the applications were loaded is
+    updated rather than inserted a second time. If another insert still
+    lands between that read and the bulk insert, the write is retried once.
     
-    assessment.save()
+    Args:
+        applications: CreditApplication instances
+        predictions: ML prediction results, one per application
+        ghana_data: Ghana employment analysis results (or None), one per application
+        processing_time_ms: Processing time to record on every assessment
+        
+    Returns:
+        The saved assessments, in application order
+    """
+    field_values = [_assessment_fields(prediction_result, ghana)
+                    for prediction_result, ghana in zip(predictions, ghana_data)]
+    
+    for attempt in range(2):
+        try:
+            with transaction.atomic():
+                return _write_ml_assessments(applications, field_values, processing_time_ms)
+        except IntegrityError:
+            if attempt:
+                raise
+            logger.warning("ML assessment created concurrently during a batch save, retrying")
+
+
+def _write_ml_assessments(applications: list, field_values: list, processing_time_ms: Optional[int]) -> list:
+    """Bulk insert or update assessments against the rows currently saved; runs inside a transaction."""
+    now = timezone.now()
+    existing = {
+        assessment.application_id: assessment
+        for assessment in MLCreditAssessment.objects.select_for_update().filter(
+            application_id__in=[application.pk for application in applications]
+        )
+    }
+    assessments = []
+    created = []
+    updated = []
+    update_fields = {'prediction_timestamp', 'last_updated', 'processing_time_ms'}
+    
+    for application, fields in zip(applications, field_values):
+        assessment = existing.get(application.pk)
+        if assessment is None:
+            assessment = MLCreditAssessment(application=application, **fields)
+            created.append(assessment)
+        else:
+            for name, value in fields.items():
+                setattr(assessment, name, value)
+            assessment.prediction_timestamp = now
+            # bulk_update does not apply auto_now
+            assessment.last_updated = now
+            update_fields.update(fields)
+            updated.append(assessment)
+        assessment.processing_time_ms = processing_time_ms
+        assessments.append(assessment)
+    
+    MLCreditAssessment.objects.bulk_create(created, batch_size=500)
+    if updated:
+        MLCreditAssessment.objects.bulk_update(updated, sorted(update_fields), batch_size=500)
+    
+    return assessments
+
+
+def _send_assessment_notifications(application: CreditApplication, assessment: MLCreditAssessment) -> None:
+    """Notify the applicant and the assigned analyst that an assessment is ready."""
+    ml_notification_service.ml_processing_completed(application.applicant, application, assessment)
+    ml_notification_service.credit_score_generated(application.applicant, application, assessment)
+    
+    # Create notification for assigned analyst
+    if application.assigned_analyst:
+        _create_ml_assessment_notification(application, assessment)
 
 
 def _create_ml_assessment_notification(application: CreditApplication, assessment: MLCreditAssessment) -> None:
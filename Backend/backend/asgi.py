@@ -23,6 +23,10 @@ from notifications.routing import websocket_urlpatterns
 # Get the Django ASGI application early
 django_asgi_app = get_asgi_application()
 
+# Load ML models at startup instead of on the first request
+from ml_api.warmup import warmup_models
+warmup_models()
+
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
     "websocket": AuthMiddlewareStack(
@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import worker_init
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
@@ -24,6 +25,12 @@ app.conf.update(
     task_reject_on_worker_lost=True,
 )
 
+@worker_init.connect
+def preload_ml_models(**kwargs):
+    """Load ML models in the main worker process before the pool forks."""
+    from ml_api.warmup import warmup_models
+    warmup_models()
+
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
\ No newline at end of file
@@ -498,11 +498,22 @@ CELERY_TASK_REJECT_ON_WORKER_LOST = True
 # ML Pipeline Configuration
 ML_PROCESSING_ENABLED = os.getenv('ML_PROCESSING_ENABLED', 'True').lower() == 'true'
 ML_AUTO_TRIGGER_ON_SUBMIT = os.getenv('ML_AUTO_TRIGGER_ON_SUBMIT', 'True').lower() == 'true'
+ML_PROVISIONAL_SCORE_ON_SUBMIT = os.getenv('ML_PROVISIONAL_SCORE_ON_SUBMIT', 'True').lower() == 'true'  # Return an unsaved score from the in-memory scorer on submit
+ML_ASSESSMENT_COALESCE_SECONDS = int(os.getenv('ML_ASSESSMENT_COALESCE_SECONDS', '600'))  # How long a queued assessment absorbs repeat requests
+ML_REASSESSMENT_DEBOUNCE_SECONDS = int(os.getenv('ML_REASSESSMENT_DEBOUNCE_SECONDS', '30'))  # Quiet period before rescoring an edited application
+ML_JOBS_REDIS_URL = os.getenv('ML_JOBS_REDIS_URL', 'redis://localhost:6379/2')  # Shared ML job leases; empty queues every trigger
 ML_BATCH_SIZE = int(os.getenv('ML_BATCH_SIZE', '10'))
 ML_RETRY_ATTEMPTS = int(os.getenv('ML_RETRY_ATTEMPTS', '3'))
+ML_API_MAX_BATCH_SIZE = int(os.getenv('ML_API_MAX_BATCH_SIZE', '100'))  # Max predictions per batch API request
+ML_EXPLANATIONS_ON_SCORING = os.getenv('ML_EXPLANATIONS_ON_SCORING', 'True').lower() == 'true'  # Store score explanations when assessments are written
+ML_COUNTERFACTUALS_ON_SCORING = os.getenv('ML_COUNTERFACTUALS_ON_SCORING', 'False').lower() == 'true'  # Store next-category what-if scenarios when assessments are written (a grid search per application)
+ML_METRICS_TOKEN = os.getenv('ML_METRICS_TOKEN', '')  # Bearer token for /api/ml/metrics/ scrapers; without it only staff sessions can read the metrics
 
 # ML Model Configuration
 ML_MODEL_PATH = os.path.join(BASE_DIR, 'ml_model', 'models')
+ML_PRELOAD_MODELS = os.getenv('ML_PRELOAD_MODELS', 'True').lower() == 'true'  # Load models at startup, before workers fork
+ML_MODEL_HOT_RELOAD = os.getenv('ML_MODEL_HOT_RELOAD', 'True').lower() == 'true'  # Swap in new model versions without restart
+ML_MODEL_RELOAD_INTERVAL = int(os.getenv('ML_MODEL_RELOAD_INTERVAL', '30'))  # Seconds between model version checks
 ML_CONFIDENCE_THRESHOLD = float(os.getenv('ML_CONFIDENCE_THRESHOLD', '0.7'))
 GHANA_EMPLOYMENT_ANALYSIS_ENABLED = os.getenv('GHANA_EMPLOYMENT_ANALYSIS_ENABLED', 'True').lower() == 'true'
 
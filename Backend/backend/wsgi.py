@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_wsgi_application()
+
+# Load ML models once here; with gunicorn --preload this happens before workers fork
+from ml_api.warmup import warmup_models
+warmup_models()
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from decimal import Decimal, InvalidOperation
 
@@ -186,6 +187,7 @@ class MLModelHealthSerializer(serializers.Serializer):
     ghana_employment_categories = serializers.IntegerField(help_text="Number of Ghana job categories")
     version = serializers.CharField(help_text="Model version")
     last_updated = serializers.DateTimeField(required=False, help_text="When model was last updated")
+    process_stats = serializers.DictField(required=False, help_text="Model load time and memory for this worker process")
 
 
 class BatchPredictionInputSerializer(serializers.Serializer):
@@ -196,8 +198,8 @@ class BatchPredictionInputSerializer(serializers.Serializer):
     predictions = serializers.ListField(
         child=MLPredictionInputSerializer(),
         min_length=1,
-        max_length=100,  # Limit batch size
-        help_text="List of prediction requests (max 100)"
+        max_length=getattr(settings, 'ML_API_MAX_BATCH_SIZE', 100),  # Limit batch size
+        help_text=f"List of prediction requests (max {getattr(settings, 'ML_API_MAX_BATCH_SIZE', 100)})"
     )
     
     include_detailed_analysis = serializers.BooleanField(
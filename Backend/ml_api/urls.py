@@ -3,6 +3,7 @@ from .views import (
     predict_credit_score,
     batch_predict_credit_scores,
     model_health_check,
+    model_metrics,
     model_documentation
 )
 
@@ -18,6 +19,9 @@ urlpatterns = [
     # Model health check
     path('health/', model_health_check, name='health'),
     
+    # Prometheus scoring metrics
+    path('metrics/', model_metrics, name='metrics'),
+    
     # API documentation (public endpoint)
     path('docs/', model_documentation, name='docs'),
 ]
\ No newline at end of file
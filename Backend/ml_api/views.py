@@ -2,6 +2,8 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
+from django.http import HttpResponse
 from django.utils import timezone
 from .serializers import (
     MLPredictionInputSerializer,
@@ -10,6 +12,7 @@ from .serializers import (
     BatchPredictionInputSerializer,
     BatchPredictionOutputSerializer
 )
+import hmac
 import sys
 import os
 import time
@@ -21,6 +24,29 @@ if ml_model_path not in sys.path:
     sys.path.append(ml_model_path)
 
 
+def _to_ml_input(validated_data):
+    """Map validated API fields to the feature names used by the ML model."""
+    return {
+        'annual_inc': float(validated_data['annual_income']),
+        'dti': float(validated_data['debt_to_income_ratio']),
+        'int_rate': float(validated_data['interest_rate']),
+        'revol_util': float(validated_data.get('revolving_utilization', 0)),
+        'delinq_2yrs': int(validated_data['delinquencies_2yr']),
+        'inq_last_6mths': int(validated_data['inquiries_6mo']),
+        'emp_length': validated_data['employment_length'],
+        'emp_title': validated_data['job_title'],  # Ghana employment analysis
+        'open_acc': int(validated_data.get('open_accounts', 0)),
+        'collections_12_mths_ex_med': int(validated_data['collections_12mo']),
+        'loan_amnt': float(validated_data['loan_amount']),
+        'credit_history_length': float(validated_data['credit_history_length']),
+        'max_bal_bc': float(validated_data.get('max_bankcard_balance', 0)),
+        'total_acc': int(validated_data['total_accounts']),
+        'open_rv_12m': int(validated_data['revolving_accounts_12mo']),
+        'pub_rec': int(validated_data['public_records']),
+        'home_ownership': validated_data['home_ownership']
+    }
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def predict_credit_score(request):
@@ -64,7 +90,7 @@ def predict_credit_score(request):
     try:
         # Import ML model
         try:
-            from src.credit_scorer import get_credit_scorer
+            from ml_model.src.credit_scorer import get_credit_scorer
         except ImportError as e:
             return Response({
                 'success': False,
@@ -73,25 +99,7 @@ def predict_credit_score(request):
             }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         
         # Prepare data for ML model
-        ml_data = {
-            'annual_inc': float(validated_data['annual_income']),
-            'dti': float(validated_data['debt_to_income_ratio']),
-            'int_rate': float(validated_data['interest_rate']),
-            'revol_util': float(validated_data.get('revolving_utilization', 0)),
-            'delinq_2yrs': int(validated_data['delinquencies_2yr']),
-            'inq_last_6mths': int(validated_data['inquiries_6mo']),
-            'emp_length': validated_data['employment_length'],
-            'emp_title': validated_data['job_title'],  # Ghana employment analysis
-            'open_acc': int(validated_data.get('open_accounts', 0)),
-            'collections_12_mths_ex_med': int(validated_data['collections_12mo']),
-            'loan_amnt': float(validated_data['loan_amount']),
-            'credit_history_length': float(validated_data['credit_history_length']),
-            'max_bal_bc': float(validated_data.get('max_bankcard_balance', 0)),
-            'total_acc': int(validated_data['total_accounts']),
-            'open_rv_12m': int(validated_data['revolving_accounts_12mo']),
-            'pub_rec': int(validated_data['public_records']),
-            'home_ownership': validated_data['home_ownership']
-        }
+        ml_data = _to_ml_input(validated_data)
         
         # Get ML prediction
         scorer = get_credit_scorer()
@@ -163,7 +171,8 @@ def batch_predict_credit_scores(request):
     Batch Credit Score Prediction API
     
     Process multiple credit score predictions in a single request.
-    Maximum 100 predictions per batch.
+    All predictions are scored with one batched model call.
+    Maximum ML_API_MAX_BATCH_SIZE (default 100) predictions per batch.
     
     **Input:**
     ```json
@@ -202,78 +211,64 @@ def batch_predict_credit_scores(request):
     batch_id = str(uuid.uuid4())
     start_time = time.time()
     
-    results = []
     successful_count = 0
     failed_count = 0
     
     try:
         # Import ML model
-        from src.credit_scorer import get_credit_scorer
+        from ml_model.src.credit_scorer import get_credit_scorer
         scorer = get_credit_scorer()
         
-        # Process each prediction
+        # Map every input first so mapping errors stay isolated to their own index
+        results = [None] * len(predictions_data)
+        ml_batch = []
+        ml_batch_indices = []
         for i, prediction_input in enumerate(predictions_data):
             try:
-                # Prepare ML data
-                ml_data = {
-                    'annual_inc': float(prediction_input['annual_income']),
-                    'dti': float(prediction_input['debt_to_income_ratio']),
-                    'int_rate': float(prediction_input['interest_rate']),
-                    'revol_util': float(prediction_input.get('revolving_utilization', 0)),
-                    'delinq_2yrs': int(prediction_input['delinquencies_2yr']),
-                    'inq_last_6mths': int(prediction_input['inquiries_6mo']),
-                    'emp_length': prediction_input['employment_length'],
-                    'emp_title': prediction_input['job_title'],
-                    'open_acc': int(prediction_input.get('open_accounts', 0)),
-                    'collections_12_mths_ex_med': int(prediction_input['collections_12mo']),
-                    'loan_amnt': float(prediction_input['loan_amount']),
-                    'credit_history_length': float(prediction_input['credit_history_length']),
-                    'max_bal_bc': float(prediction_input.get('max_bankcard_balance', 0)),
-                    'total_acc': int(prediction_input['total_accounts']),
-                    'open_rv_12m': int(prediction_input['revolving_accounts_12mo']),
-                    'pub_rec': int(prediction_input['public_records']),
-                    'home_ownership': prediction_input['home_ownership']
+                ml_batch.append(_to_ml_input(prediction_input))
+                ml_batch_indices.append(i)
+            except Exception as e:
+                results[i] = {
+                    'success': False,
+                    'error': f'Individual prediction error: {str(e)}',
+                    'batch_index': i
+                }
+                failed_count += 1
+        
+        # Score the whole batch with one model call; read the fields we return straight from the columns
+        batch_results = scorer.batch_predict_compact(ml_batch) if ml_batch else []
+        
+        for row, i in enumerate(ml_batch_indices):
+            prediction_input = predictions_data[i]
+            if batch_results.value(row, 'success'):
+                prediction_result = {
+                    'success': True,
+                    'credit_score': batch_results.value(row, 'credit_score'),
+                    'category': batch_results.value(row, 'category'),
+                    'risk_level': batch_results.value(row, 'risk_level'),
+                    'confidence': batch_results.value(row, 'confidence'),
+                    'batch_index': i
                 }
                 
-                # Get prediction
-                result = scorer.predict_credit_score(ml_data)
-                
-                if result['success']:
-                    prediction_result = {
-                        'success': True,
-                        'credit_score': result['credit_score'],
-                        'category': result['category'],
-                        'risk_level': result['risk_level'],
-                        'confidence': result['confidence'],
-                        'batch_index': i
-                    }
-                    
-                    if include_detailed:
-                        prediction_result.update({
-                            'ghana_employment_analysis': {
-                                'job_title': prediction_input['job_title'],
-                                'job_category': result.get('job_category', 'N/A'),
-                                'employment_length': prediction_input['employment_length']
-                            },
-                            'confidence_factors': result.get('confidence_factors', {})
-                        })
-                    
-                    results.append(prediction_result)
-                    successful_count += 1
-                else:
-                    results.append({
-                        'success': False,
-                        'error': result.get('error', 'Prediction failed'),
-                        'batch_index': i
+                if include_detailed:
+                    job_category = batch_results.value(row, 'job_category')
+                    prediction_result.update({
+                        'ghana_employment_analysis': {
+                            'job_title': prediction_input['job_title'],
+                            'job_category': 'N/A' if job_category is None else job_category,
+                            'employment_length': prediction_input['employment_length']
+                        },
+                        'confidence_factors': batch_results.confidence_factors(row) or {}
                     })
-                    failed_count += 1
-                    
-            except Exception as e:
-                results.append({
+                
+                results[i] = prediction_result
+                successful_count += 1
+            else:
+                results[i] = {
                     'success': False,
-                    'error': f'Individual prediction error: {str(e)}',
+                    'error': batch_results.value(row, 'error') or 'Prediction failed',
                     'batch_index': i
-                })
+                }
                 failed_count += 1
         
         # Calculate processing summary
@@ -329,7 +324,8 @@ def model_health_check(request):
     """
     
     try:
-        from src.credit_scorer import get_credit_scorer
+        from ml_model.src.credit_scorer import get_credit_scorer
+        from ml_model.src.model_registry import registry
         
         scorer = get_credit_scorer()
         health = scorer.health_check()
@@ -349,7 +345,11 @@ def model_health_check(request):
                 'Risk category assessment',
                 'Ghana employment analysis',
                 'Confidence scoring'
-            ]
+            ],
+            'process_stats': {
+                **registry.stats(),
+                'prediction_cache': registry.get('prediction_cache').stats()
+            }
         }
         
         # Validate with serializer
@@ -377,6 +377,38 @@ def model_health_check(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _metrics_authorized(request):
+    """Scrapers send ML_METRICS_TOKEN as a bearer token; staff users may use their session."""
+    token = getattr(settings, 'ML_METRICS_TOKEN', '')
+    if token:
+        supplied = request.META.get('HTTP_AUTHORIZATION', '')
+        if hmac.compare_digest(supplied.encode(), f'Bearer {token}'.encode()):
+            return True
+    user = getattr(request, 'user', None)
+    return bool(user is not None and user.is_authenticated and user.is_staff)
+
+
+def model_metrics(request):
+    """
+    Scoring metrics in the Prometheus text format.
+    
+    Stage latency histograms (validation, preprocessing, model predict,
+    Ghana analysis, confidence) and request counters per model version.
+    Requires the ML_METRICS_TOKEN bearer token, or a logged-in staff user.
+    
+    The counters live in the memory of the worker process that answers the
+    request. Behind gunicorn each scrape sees one worker's counters, and
+    they restart from zero when the worker is recycled (--max-requests), so
+    treat them as per-worker samples: use rate()/histogram_quantile() rather
+    than absolute totals.
+    """
+    if not _metrics_authorized(request):
+        return HttpResponse('Unauthorized\n', status=401, content_type='text/plain')
+    
+    from ml_model.src.scoring_metrics import scoring_metrics, PROMETHEUS_CONTENT_TYPE
+    return HttpResponse(scoring_metrics.render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @api_view(['GET'])
 @permission_classes([])  # Public endpoint - no authentication required
 def model_documentation(request):
@@ -404,7 +436,7 @@ def model_documentation(request):
                 'max_request_size': '10KB'
             },
             'POST /api/ml/batch-predict/': {
-                'description': 'Batch predictions (max 100)',
+                'description': f"Batch predictions (max {getattr(settings, 'ML_API_MAX_BATCH_SIZE', 100)})",
                 'authentication': 'Required', 
                 'rate_limit': '10 requests/minute',
                 'max_request_size': '1MB'
@@ -0,0 +1,107 @@
+"""
+Model warmup and hot reload hooks for server and worker startup
+"""
+
+import logging
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+def warmup_models():
+    """
+    Load registered ML models before the first request.
+
+    Called from wsgi/asgi startup and the celery main process. With gunicorn
+    --preload (or celery prefork) this runs in the master before workers fork,
+    so every worker inherits the loaded models. Failures are logged and the
+    affected models fall back to loading lazily on first use.
+
+    Loading reads the active AIModelVersion, so database connections are
+    closed afterwards; forked workers must not share the master's socket.
+    """
+    try:
+        configure_hot_reload()
+        return _preload_models()
+    finally:
+        connections.close_all()
+
+
+def _preload_models():
+    """Load every registered model if ML_PRELOAD_MODELS is set."""
+    if not getattr(settings, 'ML_PRELOAD_MODELS', False):
+        return None
+
+    try:
+        from ml_model.src.model_registry import registry
+        # Importing these modules registers their model loaders
+        import ml_model.src.credit_scorer  # noqa: F401
+        import risk.services  # noqa: F401
+    except Exception as e:
+        logger.warning(f"ML model warmup skipped: {e}")
+        return None
+
+    result = registry.warmup()
+    loaded = [name for name, info in result['models'].items() if info['loaded']]
+    memory = result['process']['memory']
+    logger.info(
+        f"ML models warmed up in pid {memory['pid']}: {', '.join(loaded) or 'none'} "
+        f"(rss {memory['rss_mb']} MB)"
+    )
+    return result
+
+
+def configure_hot_reload():
+    """
+    Let workers pick up new model versions without a restart.
+
+    Each process polls the model directory checksums and the active
+    RISK_SCORE AIModelVersion every ML_MODEL_RELOAD_INTERVAL seconds. On a
+    change the new model is loaded in the background and swapped in between
+    requests. Saving an AIModelVersion wakes the watcher of the saving process
+    immediately; other processes follow on their next poll.
+    """
+    if not getattr(settings, 'ML_MODEL_HOT_RELOAD', False):
+        return
+
+    try:
+        from django.db.models.signals import post_save
+        from ml_model.src.model_registry import registry
+        import ml_model.src.credit_scorer  # noqa: F401
+    except Exception as e:
+        logger.warning(f"ML model hot reload not available: {e}")
+        return
+
+    registry.add_version_source('credit_scorer', _active_model_version)
+    registry.enable_hot_reload(getattr(settings, 'ML_MODEL_RELOAD_INTERVAL', 30))
+    post_save.connect(_model_version_saved, sender='ai.AIModelVersion',
+                      dispatch_uid='ml_api_model_version_hot_reload')
+
+
+def _active_model_version():
+    """Version token from the active RISK_SCORE model version in the database."""
+    from django.db import connection
+    from ml_model.src.model_registry import registry
+
+    try:
+        from ai.models import AIModelVersion
+        return tuple(
+            AIModelVersion.objects.filter(model_type='RISK_SCORE', is_active=True)
+            .order_by('pk')
+            .values_list('pk', 'version')
+        )
+    except Exception as e:
+        logger.debug(f"Active model version unavailable: {e}")
+        return None
+    finally:
+        # The watcher thread polls forever; do not keep a connection open between polls
+        if registry.in_watcher_thread():
+            connection.close()
+
+
+def _model_version_saved(sender, instance, **kwargs):
+    """Check for a new model right away when the active model version changes."""
+    if instance.model_type == 'RISK_SCORE':
+        from ml_model.src.model_registry import registry
+        registry.wake_watcher()
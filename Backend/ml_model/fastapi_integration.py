@@ -4,16 +4,24 @@ FastAPI Integration Template for Credit Scoring ML Model
 Ready-to-use FastAPI application with the credit scoring model.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field, validator
 from typing import Dict, List, Any, Optional
+import hmac
 import logging
+import os
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 
 # Import ML model
 from src.credit_scorer import get_credit_scorer
+from src.model_registry import registry
+from src.micro_batcher import MicroBatcher
+from src.health_monitor import health_monitor
+from src.scoring_metrics import scoring_metrics, PROMETHEUS_CONTENT_TYPE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,20 +45,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global model instance (loaded once at startup)
-scorer = None
+# Set once the model has loaded at startup
+model_ready = False
+
+# Inference mode:
+#   microbatch - concurrent single requests are grouped and scored in one model call (default)
+#   threadpool - each request is scored in the worker pool, off the event loop
+#   inline     - score on the event loop (previous behaviour)
+INFERENCE_MODE = os.getenv('ML_INFERENCE_MODE', 'microbatch').lower()
+inference_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('ML_INFERENCE_WORKERS', '2')),
+    thread_name_prefix='ml-inference'
+)
+micro_batcher = MicroBatcher(
+    score_batch=lambda items: get_credit_scorer().batch_predict(items),
+    executor=inference_executor,
+    max_batch_size=int(os.getenv('ML_MICROBATCH_MAX_SIZE', '32')),
+    max_wait_ms=float(os.getenv('ML_MICROBATCH_MAX_WAIT_MS', '5')),
+    max_concurrent_batches=int(os.getenv('ML_INFERENCE_WORKERS', '2'))
+)
+
+async def score_application(scorer: Any, app_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Score one application according to the configured inference mode."""
+    if INFERENCE_MODE == 'microbatch':
+        result = await micro_batcher.submit(app_data)
+        result.pop('batch_index', None)
+        return result
+    if INFERENCE_MODE == 'threadpool':
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(inference_executor, scorer.predict_credit_score, app_data)
+    return scorer.predict_credit_score(app_data)
+
+async def score_batch(scorer: Any, app_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score an explicit batch off the event loop (unless running inline)."""
+    if INFERENCE_MODE == 'inline':
+        return scorer.batch_predict(app_data_list)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(inference_executor, scorer.batch_predict, app_data_list)
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize ML model on startup."""
-    global scorer
+    global model_ready
     try:
+        # Poll the model directory and hot-swap new versions without a restart
+        if os.getenv('ML_MODEL_HOT_RELOAD', 'True').lower() == 'true':
+            registry.enable_hot_reload(float(os.getenv('ML_MODEL_RELOAD_INTERVAL', '30')))
+        
         logger.info("Loading ML model...")
         scorer = get_credit_scorer()
         logger.info("✅ ML model loaded successfully")
         
-        # Perform health check
-        health = scorer.health_check()
+        # Perform health check (fresh probe; later checks read the background result)
+        health = scorer.health_check(max_age=0)
         if health['status'] != 'healthy':
             logger.error(f"❌ Model health check failed: {health}")
             raise RuntimeError("Model health check failed")
@@ -59,15 +106,27 @@ async def startup_event():
         performance = scorer.get_model_performance()
         logger.info(f"📊 Model accuracy: {performance.get('test_r2', 0) * 100:.2f}%")
         
+        if INFERENCE_MODE == 'microbatch':
+            await micro_batcher.start()
+        logger.info(f"⚙️ Inference mode: {INFERENCE_MODE}")
+        model_ready = True
+        
     except Exception as e:
         logger.error(f"❌ Failed to load ML model: {e}")
         raise RuntimeError(f"Model initialization failed: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish in-flight batches and release the inference pool."""
+    await micro_batcher.stop()
+    inference_executor.shutdown(wait=True)
+    health_monitor.stop()
+
 def get_scorer():
-    """Dependency injection for the scorer."""
-    if scorer is None:
+    """Dependency injection for the scorer (current version from the model registry)."""
+    if not model_ready:
         raise HTTPException(status_code=503, detail="ML model not available")
-    return scorer
+    return get_credit_scorer()
 
 # Pydantic models for request/response validation
 class CreditApplication(BaseModel):
@@ -163,8 +222,8 @@ async def predict_credit_score(
         # Convert to dictionary
         app_data = application.dict()
         
-        # Get prediction
-        result = scorer.predict_credit_score(app_data)
+        # Get prediction (off the event loop)
+        result = await score_application(scorer, app_data)
         
         if not result['success']:
             raise HTTPException(
@@ -216,8 +275,8 @@ async def batch_predict_credit_scores(
         # Convert applications to list of dictionaries
         app_data_list = [app.dict() for app in batch_request.applications]
         
-        # Process batch
-        results = scorer.batch_predict(app_data_list)
+        # Process batch (off the event loop)
+        results = await score_batch(scorer, app_data_list)
         
         # Calculate metrics
         successful = sum(1 for r in results if r.get('success', False))
@@ -301,9 +360,24 @@ async def api_status():
             "Batch processing",
             "98.39% model accuracy",
             "Dynamic confidence scoring"
-        ]
+        ],
+        "inference": {
+            "mode": INFERENCE_MODE,
+            "micro_batching": micro_batcher.stats() if INFERENCE_MODE == 'microbatch' else None
+        }
     }
 
+def require_metrics_token(authorization: Optional[str] = Header(None)):
+    """Dependency: scrapers send ML_METRICS_TOKEN as a bearer token; without a token set, metrics are disabled."""
+    token = os.getenv('ML_METRICS_TOKEN', '')
+    if not token or not hmac.compare_digest((authorization or '').encode(), f'Bearer {token}'.encode()):
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+@app.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    """Scoring stage histograms and request counters in the Prometheus text format (ML_METRICS_TOKEN bearer token)."""
+    return PlainTextResponse(scoring_metrics.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 # Background tasks
 async def log_batch_details(results: List[Dict[str, Any]]):
     """Background task to log detailed batch results."""
@@ -6,19 +6,119 @@ Enhanced with Ghana-specific employment processing.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple, Union
 try:
-    from ghana_employment_processor import categorize_ghana_job_title, calculate_ghana_employment_score, get_ghana_job_stability_score
+    from .ghana_employment_processor import categorize_ghana_job_title, calculate_ghana_employment_score, get_ghana_job_stability_score
 except ImportError:
-    # Fallback functions if Ghana processor not available
-    def categorize_ghana_job_title(title):
-        return 'Other Services'
-    def calculate_ghana_employment_score(emp_length, job_category, annual_income=None):
-        return {'total_employment_score': 50.0}
-    def get_ghana_job_stability_score(job_category):
-        return 50
-
-def preprocess_for_prediction_final(data: Dict[str, Any], model_dir: str) -> pd.DataFrame:
+    try:
+        from ghana_employment_processor import categorize_ghana_job_title, calculate_ghana_employment_score, get_ghana_job_stability_score
+    except ImportError:
+        # Fallback functions if Ghana processor not available
+        def categorize_ghana_job_title(title):
+            return 'Other Services'
+        def calculate_ghana_employment_score(emp_length, job_category, annual_income=None):
+            return {'total_employment_score': 50.0}
+        def get_ghana_job_stability_score(job_category):
+            return 50
+
+# Expected model features in the exact order used at training time
+EXPECTED_FEATURES = [
+    'annual_inc', 'dti', 'int_rate', 'revol_util', 'delinq_2yrs', 'inq_last_6mths',
+    'open_acc', 'collections_12_mths_ex_med', 'loan_amnt', 'max_bal_bc', 'total_acc', 
+    'open_rv_12m', 'pub_rec', 'credit_history_length', 'emp_length_encoded', 'home_ownership_encoded'
+]
+
+# Additional Ghana features for analysis (not yet in model)
+GHANA_FEATURES = ['ghana_employment_score', 'ghana_job_stability_score']
+
+EMP_LENGTH_MAPPING = {
+    '< 1 year': 0, '1 year': 1, '2 years': 2, '3 years': 3, '4 years': 4, '5 years': 5,
+    '6 years': 6, '7 years': 7, '8 years': 8, '9 years': 9, '10+ years': 10
+}
+
+HOME_OWNERSHIP_MAPPING = {
+    'OWN': 0,       # Lowest risk
+    'MORTGAGE': 1,  # Low risk  
+    'RENT': 2,      # Medium risk
+    'OTHER': 3,     # Higher risk
+    'NONE': 3,      # Higher risk
+    'ANY': 3        # Higher risk
+}
+
+# Default values for missing numeric features
+NUMERIC_DEFAULTS = {
+    'annual_inc': 50000.0, 'dti': 20.0, 'int_rate': 12.0, 
+    'revol_util': 50.0, 'delinq_2yrs': 0.0, 'inq_last_6mths': 1.0,
+    'open_acc': 8.0, 'collections_12_mths_ex_med': 0.0,
+    'loan_amnt': 10000, 'total_acc': 15.0, 'pub_rec': 0.0,
+    'credit_history_length': 10.0
+}
+
+# These were filled with 0 in training after being 100% missing
+ZERO_FILLED_FEATURES = ['max_bal_bc', 'open_rv_12m']
+
+class FeatureContext:
+    """
+    Per-application feature values shared across one prediction.
+
+    The Ghana job category and employment score are derived once here and
+    reused by preprocessing, confidence scoring, the reported employment
+    analysis and explanations. After preprocessing, the context also carries
+    the processed frame (model features plus Ghana side-features).
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.emp_title = data.get('emp_title', '')
+        self.emp_length = data.get('emp_length', '5 years')
+        self.annual_income = data.get('annual_inc', 50000)
+        self.processed_data = None
+        self._job_category = None
+        self._employment = None
+        self._analysis = None
+
+    @property
+    def job_category(self) -> str:
+        """Ghana job category of the application's job title."""
+        if self._job_category is None:
+            self._job_category = categorize_ghana_job_title(self.emp_title)
+        return self._job_category
+
+    @property
+    def employment(self) -> Dict[str, Any]:
+        """Ghana employment score breakdown for the application."""
+        if self._employment is None:
+            self._employment = calculate_ghana_employment_score(self.emp_length, self.job_category, self.annual_income)
+        return self._employment
+
+    @property
+    def ghana_features(self) -> Dict[str, float]:
+        """GHANA_FEATURES values for the processed frame."""
+        return {
+            'ghana_employment_score': float(self.employment['total_employment_score']),
+            'ghana_job_stability_score': float(get_ghana_job_stability_score(self.job_category))
+        }
+
+    def employment_analysis(self) -> Tuple[Any, str, Dict[str, Any]]:
+        """
+        Job title, category and employment score as reported with the prediction.
+
+        The reported analysis treats a missing emp_title as 'Other' rather than
+        an empty title, so it is only shared with the features when a title
+        was given.
+        """
+        if 'emp_title' in self.data:
+            return self.emp_title, self.job_category, self.employment
+        if self._analysis is None:
+            job_category = categorize_ghana_job_title('Other')
+            self._analysis = (
+                'Other', job_category,
+                calculate_ghana_employment_score(self.emp_length, job_category, self.annual_income)
+            )
+        return self._analysis
+
+def preprocess_for_prediction_final(data: Dict[str, Any], model_dir: str,
+                                    context: FeatureContext = None) -> pd.DataFrame:
     """
     Preprocess data to match the retrained model format with encoded categorical features.
     
@@ -26,122 +126,47 @@ def preprocess_for_prediction_final(data: Dict[str, Any], model_dir: str) -> pd.
     ['annual_inc', 'dti', 'int_rate', 'revol_util', 'delinq_2yrs', 'inq_last_6mths', 
      'open_acc', 'collections_12_mths_ex_med', 'loan_amnt', 'max_bal_bc', 'total_acc', 
      'open_rv_12m', 'pub_rec', 'credit_history_length', 'emp_length_encoded', 'home_ownership_encoded']
+    
+    Pass a FeatureContext to reuse its Ghana values and keep the processed
+    frame on it for the rest of the prediction.
     """
+    if context is None:
+        context = FeatureContext(data)
     
-    # Expected features in the exact order
     # Note: Ghana features are computed but not included in model input yet (model needs retraining)
-    expected_features = [
-        'annual_inc', 'dti', 'int_rate', 'revol_util', 'delinq_2yrs', 'inq_last_6mths',
-        'open_acc', 'collections_12_mths_ex_med', 'loan_amnt', 'max_bal_bc', 'total_acc', 
-        'open_rv_12m', 'pub_rec', 'credit_history_length', 'emp_length_encoded', 'home_ownership_encoded'
-    ]
-    
-    # Additional Ghana features for analysis (not yet in model)
-    ghana_features = ['ghana_employment_score', 'ghana_job_stability_score']
-    
     processed_data = {}
     
     # Process each feature
-    for feature in expected_features:
+    for feature in EXPECTED_FEATURES:
         if feature == 'emp_length_encoded':
             # Convert employment length to encoded value
-            emp_mapping = {
-                '< 1 year': 0, '1 year': 1, '2 years': 2, '3 years': 3, '4 years': 4, '5 years': 5,
-                '6 years': 6, '7 years': 7, '8 years': 8, '9 years': 9, '10+ years': 10
-            }
-            
             if 'emp_length' in data:
-                emp_value = str(data['emp_length'])
-                if emp_value in emp_mapping:
-                    processed_data[feature] = float(emp_mapping[emp_value])
-                else:
-                    # Try to parse numeric value
-                    try:
-                        if '10+' in emp_value:
-                            processed_data[feature] = 10.0
-                        elif '< 1' in emp_value:
-                            processed_data[feature] = 0.0
-                        else:
-                            # Extract number from string like "5 years"
-                            num = float(''.join(filter(str.isdigit, emp_value)))
-                            processed_data[feature] = min(max(num, 0), 10)  # Clamp to 0-10
-                    except:
-                        processed_data[feature] = 5.0  # Default to 5 years
+                processed_data[feature] = _encode_emp_length_value(data['emp_length'])
             else:
                 processed_data[feature] = 5.0  # Default
                 
         elif feature == 'home_ownership_encoded':
             # Convert home ownership to encoded value
-            home_mapping = {
-                'OWN': 0,       # Lowest risk
-                'MORTGAGE': 1,  # Low risk  
-                'RENT': 2,      # Medium risk
-                'OTHER': 3,     # Higher risk
-                'NONE': 3,      # Higher risk
-                'ANY': 3        # Higher risk
-            }
-            
             if 'home_ownership' in data:
-                home_value = str(data['home_ownership']).upper()
-                processed_data[feature] = float(home_mapping.get(home_value, 2))  # Default to RENT
+                processed_data[feature] = _encode_home_ownership_value(data['home_ownership'])
             else:
                 processed_data[feature] = 2.0  # Default to RENT
                 
-        elif feature in ['max_bal_bc', 'open_rv_12m']:
-            # These were filled with 0 in training after being 100% missing
+        elif feature in ZERO_FILLED_FEATURES:
             processed_data[feature] = 0.0
             
-        elif feature == 'ghana_employment_score':
-            # Calculate Ghana employment score
-            emp_length = data.get('emp_length', '5 years')
-            emp_title = data.get('emp_title', '')
-            annual_income = data.get('annual_inc', 50000)
-            
-            # Get Ghana job category
-            job_category = categorize_ghana_job_title(emp_title)
-            
-            # Calculate comprehensive employment score
-            employment_data = calculate_ghana_employment_score(emp_length, job_category, annual_income)
-            processed_data[feature] = float(employment_data['total_employment_score'])
-            
-        elif feature == 'ghana_job_stability_score':
-            # Get job stability score for Ghana context
-            emp_title = data.get('emp_title', '')
-            job_category = categorize_ghana_job_title(emp_title)
-            processed_data[feature] = float(get_ghana_job_stability_score(job_category))
-            
         else:
             # Numeric features - process normally
             if feature in data and data[feature] is not None:
                 processed_data[feature] = float(data[feature])
             else:
-                # Default values for missing numeric features
-                defaults = {
-                    'annual_inc': 50000.0, 'dti': 20.0, 'int_rate': 12.0, 
-                    'revol_util': 50.0, 'delinq_2yrs': 0.0, 'inq_last_6mths': 1.0,
-                    'open_acc': 8.0, 'collections_12_mths_ex_med': 0.0,
-                    'loan_amnt': 10000, 'total_acc': 15.0, 'pub_rec': 0.0,
-                    'credit_history_length': 10.0
-                }
-                processed_data[feature] = defaults.get(feature, 0.0)
-    
-    # Process Ghana features for analysis (store but don't include in model input yet)
-    ghana_data = {}
-    for feature in ghana_features:
-        if feature == 'ghana_employment_score':
-            emp_length = data.get('emp_length', '5 years')
-            emp_title = data.get('emp_title', '')
-            annual_income = data.get('annual_inc', 50000)
-            job_category = categorize_ghana_job_title(emp_title)
-            employment_data = calculate_ghana_employment_score(emp_length, job_category, annual_income)
-            ghana_data[feature] = float(employment_data['total_employment_score'])
-        elif feature == 'ghana_job_stability_score':
-            emp_title = data.get('emp_title', '')
-            job_category = categorize_ghana_job_title(emp_title)
-            ghana_data[feature] = float(get_ghana_job_stability_score(job_category))
+                processed_data[feature] = NUMERIC_DEFAULTS.get(feature, 0.0)
+    
+    # Ghana features for analysis (stored but not included in model input yet)
+    ghana_data = context.ghana_features
     
     # Create DataFrame with exact column order (model features only)
-    df_final = pd.DataFrame([processed_data], columns=expected_features)
+    df_final = pd.DataFrame([processed_data], columns=EXPECTED_FEATURES)
     
     # Add Ghana features as metadata (not for model prediction yet)
     for feature, value in ghana_data.items():
@@ -154,8 +179,177 @@ def preprocess_for_prediction_final(data: Dict[str, Any], model_dir: str) -> pd.
         else:
             df_final[col] = df_final[col].astype('float64')
     
+    context.processed_data = df_final
     return df_final
 
+def _encode_emp_length_value(value: Any) -> float:
+    """Encode a single employment length value, defaulting to 5 years."""
+    emp_value = str(value)
+    if emp_value in EMP_LENGTH_MAPPING:
+        return float(EMP_LENGTH_MAPPING[emp_value])
+    try:
+        if '10+' in emp_value:
+            return 10.0
+        elif '< 1' in emp_value:
+            return 0.0
+        num = float(''.join(filter(str.isdigit, emp_value)))
+        return float(min(max(num, 0), 10))  # Clamp to 0-10
+    except ValueError:
+        return 5.0  # Default to 5 years
+
+def _encode_home_ownership_value(value: Any) -> float:
+    """Encode a single home ownership value, defaulting to RENT."""
+    return float(HOME_OWNERSHIP_MAPPING.get(str(value).upper(), 2))
+
+def _lookup_encode(values: List[Any], encoder, default: float) -> np.ndarray:
+    """
+    Encode a column of categorical values through a NumPy lookup table.
+
+    Each distinct value is encoded once and broadcast back with the inverse
+    index from np.unique. Missing entries get the default.
+    """
+    encoded = np.full(len(values), default, dtype='float64')
+    present = np.array([v is not _MISSING for v in values], dtype=bool)
+    if present.any():
+        keys = np.array([str(v) for v, p in zip(values, present) if p])
+        uniques, inverse = np.unique(keys, return_inverse=True)
+        table = np.array([encoder(u) for u in uniques], dtype='float64')
+        encoded[present] = table[inverse]
+    return encoded
+
+def _to_float(value: Any) -> float:
+    """Convert a raw numeric value, returning NaN (and not raising) on bad input."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+# Marker for keys absent from an input record
+_MISSING = object()
+
+def _extract_columns(records: Union[List[Dict[str, Any]], pd.DataFrame], keys: List[str],
+                     none_is_missing: bool = True) -> Dict[str, List[Any]]:
+    """
+    Pull raw column values out of a list of dicts or a DataFrame.
+
+    Absent keys are returned as the _MISSING marker. For dict records, None
+    values are also treated as missing when none_is_missing is set; DataFrames
+    cannot tell an absent key from an empty cell, so None/NaN cells are always
+    treated as missing there.
+    """
+    columns = {}
+    if isinstance(records, pd.DataFrame):
+        n_rows = len(records)
+        for key in keys:
+            if key not in records.columns:
+                columns[key] = [_MISSING] * n_rows
+            else:
+                raw = records[key].to_numpy(dtype=object)
+                missing = pd.isna(raw)
+                columns[key] = [_MISSING if m else v for v, m in zip(raw, missing)]
+    else:
+        for key in keys:
+            values = [record.get(key, _MISSING) for record in records]
+            if none_is_missing:
+                values = [_MISSING if v is None else v for v in values]
+            columns[key] = values
+    return columns
+
+def _ghana_feature_columns(records: Union[List[Dict[str, Any]], pd.DataFrame], n_rows: int) -> np.ndarray:
+    """Compute the Ghana analysis features for every row, memoizing repeated inputs."""
+    columns = _extract_columns(records, ['emp_title', 'emp_length', 'annual_inc'], none_is_missing=False)
+    ghana = np.empty((n_rows, len(GHANA_FEATURES)), dtype='float64')
+    category_cache = {}
+    score_cache = {}
+    for i in range(n_rows):
+        emp_title = columns['emp_title'][i]
+        emp_length = columns['emp_length'][i]
+        annual_income = columns['annual_inc'][i]
+        emp_title = '' if emp_title is _MISSING else emp_title
+        emp_length = '5 years' if emp_length is _MISSING else emp_length
+        annual_income = 50000 if annual_income is _MISSING else annual_income
+
+        # Keyed by type and value, so None and 'None' (or NaN and 'nan') stay apart
+        title_key = (type(emp_title), emp_title)
+        try:
+            job_category = category_cache[title_key]
+        except KeyError:
+            job_category = category_cache[title_key] = categorize_ghana_job_title(emp_title)
+        except TypeError:
+            job_category = categorize_ghana_job_title(emp_title)
+
+        score_key = (type(emp_length), emp_length, job_category, annual_income)
+        try:
+            try:
+                ghana[i] = score_cache[score_key]
+            except KeyError:
+                ghana[i] = score_cache[score_key] = _ghana_scores(emp_length, job_category, annual_income)
+            except TypeError:
+                ghana[i] = _ghana_scores(emp_length, job_category, annual_income)
+        except (TypeError, ValueError):
+            ghana[i] = np.nan
+    return ghana
+
+def _ghana_scores(emp_length: Any, job_category: str, annual_income: Any) -> Tuple[float, float]:
+    """GHANA_FEATURES values for one row."""
+    return (
+        float(calculate_ghana_employment_score(emp_length, job_category, annual_income)['total_employment_score']),
+        float(get_ghana_job_stability_score(job_category))
+    )
+
+def preprocess_batch_final(records: Union[List[Dict[str, Any]], pd.DataFrame],
+                           model_dir: str = None,
+                           include_ghana_features: bool = False) -> np.ndarray:
+    """
+    Columnar version of preprocess_for_prediction_final for many applications.
+
+    Builds one float64 matrix in EXPECTED_FEATURES order instead of one
+    DataFrame per application. Categorical encodings go through NumPy lookup
+    tables so each distinct emp_length / home_ownership value is only parsed once.
+
+    Args:
+        records: List of application dicts, or a DataFrame with one row per application
+        model_dir: Kept for signature parity with the single-row path (unused)
+        include_ghana_features: Append GHANA_FEATURES as two extra columns
+
+    Returns:
+        Array of shape (n_rows, 16), or (n_rows, 18) with Ghana features.
+        Rows with values that cannot be converted to numbers contain NaN in
+        that column; callers that need per-row isolation should check for it.
+    """
+    n_rows = len(records)
+    numeric_features = list(NUMERIC_DEFAULTS.keys())
+    columns = _extract_columns(records, numeric_features)
+    columns.update(_extract_columns(records, ['emp_length', 'home_ownership'], none_is_missing=False))
+
+    n_cols = len(EXPECTED_FEATURES) + (len(GHANA_FEATURES) if include_ghana_features else 0)
+    matrix = np.zeros((n_rows, n_cols), dtype='float64')
+    if n_rows == 0:
+        return matrix
+
+    for feature in numeric_features:
+        default = float(NUMERIC_DEFAULTS[feature])
+        matrix[:, EXPECTED_FEATURES.index(feature)] = [
+            default if v is _MISSING else _to_float(v) for v in columns[feature]
+        ]
+
+    # loan_amnt is an int64 column in the single-row path; mirror the truncation
+    loan_idx = EXPECTED_FEATURES.index('loan_amnt')
+    matrix[:, loan_idx] = np.trunc(matrix[:, loan_idx])
+
+    matrix[:, EXPECTED_FEATURES.index('emp_length_encoded')] = _lookup_encode(
+        columns['emp_length'], _encode_emp_length_value, 5.0)
+    matrix[:, EXPECTED_FEATURES.index('home_ownership_encoded')] = _lookup_encode(
+        columns['home_ownership'], _encode_home_ownership_value, 2.0)
+
+    for feature in ZERO_FILLED_FEATURES:
+        matrix[:, EXPECTED_FEATURES.index(feature)] = 0.0
+
+    if include_ghana_features:
+        matrix[:, len(EXPECTED_FEATURES):] = _ghana_feature_columns(records, n_rows)
+
+    return matrix
+
 def validate_single_application(data: Dict[str, Any]) -> tuple:
     """Validate single application data."""
     errors = []
@@ -7,109 +7,145 @@ Adapted for Ghana's economic context, job market, and employment patterns.
 import pandas as pd
 import numpy as np
 from collections import Counter
+from functools import lru_cache
 import re
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Union
 
-def categorize_ghana_job_title(title: str) -> str:
-    """
-    Categorize job titles based on Ghana's employment landscape and economic sectors.
-    
-    Ghana's economy is driven by:
-    - Services (54% of GDP): Banking, telecom, retail, hospitality
-    - Industry (25% of GDP): Mining, manufacturing, construction  
-    - Agriculture (21% of GDP): Cocoa, agriculture, fishing
-    """
-    if pd.isna(title) or title == '':
-        return 'Unknown'
-    
-    title = str(title).lower().strip()
-    
+# Job title keywords per category, in matching priority order: a title containing
+# keywords of several categories gets the category listed first.
+GHANA_JOB_CATEGORY_KEYWORDS = [
     # HIGH-INCOME PROFESSIONAL SECTORS (Most stable)
     # Banking & Financial Services (Very developed in Ghana)
-    if any(word in title for word in ['bank', 'finance', 'financial', 'accounting', 'accountant', 'auditor', 'treasury']):
-        return 'Banking & Finance'
-    
+    ('Banking & Finance', ['bank', 'finance', 'financial', 'accounting', 'accountant', 'auditor', 'treasury']),
     # Mining & Oil/Gas (Major economic drivers)
-    if any(word in title for word in ['mining', 'mine', 'gold', 'oil', 'gas', 'petroleum', 'drilling', 'exploration']):
-        return 'Mining & Energy'
-    
+    ('Mining & Energy', ['mining', 'mine', 'gold', 'oil', 'gas', 'petroleum', 'drilling', 'exploration']),
     # Telecommunications (Strong sector in Ghana)
-    if any(word in title for word in ['telecom', 'telecommunications', 'network', 'mtn', 'vodafone', 'airtel']):
-        return 'Telecommunications'
-    
+    ('Telecommunications', ['telecom', 'telecommunications', 'network', 'mtn', 'vodafone', 'airtel']),
     # Medical & Healthcare
-    if any(word in title for word in ['doctor', 'physician', 'surgeon', 'dentist', 'pharmacist', 'medical officer']):
-        return 'Medical Professional'
-    elif any(word in title for word in ['nurse', 'midwife', 'medical', 'health', 'clinical']):
-        return 'Healthcare Worker'
-    
+    ('Medical Professional', ['doctor', 'physician', 'surgeon', 'dentist', 'pharmacist', 'medical officer']),
+    ('Healthcare Worker', ['nurse', 'midwife', 'medical', 'health', 'clinical']),
     # Legal & Professional Services
-    if any(word in title for word in ['lawyer', 'attorney', 'barrister', 'solicitor', 'legal', 'counsel']):
-        return 'Legal Professional'
-    
+    ('Legal Professional', ['lawyer', 'attorney', 'barrister', 'solicitor', 'legal', 'counsel']),
     # Engineering & Technical (Infrastructure development focus)
-    if any(word in title for word in ['engineer', 'engineering', 'technical', 'architect', 'surveyor']):
-        return 'Engineering & Technical'
-    
+    ('Engineering & Technical', ['engineer', 'engineering', 'technical', 'architect', 'surveyor']),
     # GOVERNMENT & PUBLIC SECTOR (Very stable in Ghana)
-    if any(word in title for word in ['government', 'civil service', 'ministry', 'assembly', 'municipal', 'district', 'public service', 'ghana revenue', 'immigration', 'customs']):
-        return 'Government Worker'
-    
+    ('Government Worker', ['government', 'civil service', 'ministry', 'assembly', 'municipal', 'district', 'public service', 'ghana revenue', 'immigration', 'customs']),
     # EDUCATION SECTOR
-    if any(word in title for word in ['teacher', 'lecturer', 'professor', 'educator', 'principal', 'headmaster', 'university', 'polytechnic']):
-        return 'Education Professional'
-    
+    ('Education Professional', ['teacher', 'lecturer', 'professor', 'educator', 'principal', 'headmaster', 'university', 'polytechnic']),
     # MANAGEMENT & EXECUTIVE ROLES
-    if any(word in title for word in ['manager', 'director', 'executive', 'president', 'ceo', 'managing director', 'general manager']):
-        return 'Management Executive'
-    elif any(word in title for word in ['supervisor', 'team lead', 'coordinator', 'assistant manager']):
-        return 'Supervisory Role'
-    
+    ('Management Executive', ['manager', 'director', 'executive', 'president', 'ceo', 'managing director', 'general manager']),
+    ('Supervisory Role', ['supervisor', 'team lead', 'coordinator', 'assistant manager']),
     # BUSINESS & ENTREPRENEURSHIP (Very common in Ghana)
-    if any(word in title for word in ['owner', 'entrepreneur', 'business owner', 'proprietor', 'trader', 'merchant']):
-        return 'Business Owner/Trader'
-    
+    ('Business Owner/Trader', ['owner', 'entrepreneur', 'business owner', 'proprietor', 'trader', 'merchant']),
     # AGRICULTURE & AGRIBUSINESS (21% of GDP)
-    if any(word in title for word in ['farmer', 'agriculture', 'agric', 'cocoa', 'plantation', 'farming', 'fisherman', 'fishing']):
-        return 'Agriculture & Fishing'
-    
+    ('Agriculture & Fishing', ['farmer', 'agriculture', 'agric', 'cocoa', 'plantation', 'farming', 'fisherman', 'fishing']),
     # MANUFACTURING & INDUSTRY
-    if any(word in title for word in ['manufacturing', 'factory', 'production', 'assembly', 'industrial', 'brewery', 'textiles']):
-        return 'Manufacturing'
-    
+    ('Manufacturing', ['manufacturing', 'factory', 'production', 'assembly', 'industrial', 'brewery', 'textiles']),
     # CONSTRUCTION & REAL ESTATE (Growing sector)
-    if any(word in title for word in ['construction', 'contractor', 'builder', 'real estate', 'property', 'estate']):
-        return 'Construction & Real Estate'
-    
+    ('Construction & Real Estate', ['construction', 'contractor', 'builder', 'real estate', 'property', 'estate']),
     # SKILLED TRADES
-    if any(word in title for word in ['electrician', 'plumber', 'mechanic', 'welder', 'carpenter', 'mason', 'technician']):
-        return 'Skilled Trades'
-    
+    ('Skilled Trades', ['electrician', 'plumber', 'mechanic', 'welder', 'carpenter', 'mason', 'technician']),
     # TRANSPORTATION (Important due to logistics)
-    if any(word in title for word in ['driver', 'transport', 'logistics', 'delivery', 'truck', 'taxi', 'uber', 'bolt']):
-        return 'Transportation & Logistics'
-    
+    ('Transportation & Logistics', ['driver', 'transport', 'logistics', 'delivery', 'truck', 'taxi', 'uber', 'bolt']),
     # RETAIL & SALES
-    if any(word in title for word in ['sales', 'retail', 'shop', 'store', 'marketing', 'customer service', 'cashier']):
-        return 'Retail & Sales'
-    
+    ('Retail & Sales', ['sales', 'retail', 'shop', 'store', 'marketing', 'customer service', 'cashier']),
     # HOSPITALITY & TOURISM
-    if any(word in title for word in ['hotel', 'restaurant', 'tourism', 'hospitality', 'chef', 'cook', 'waiter', 'bartender']):
-        return 'Hospitality & Tourism'
-    
+    ('Hospitality & Tourism', ['hotel', 'restaurant', 'tourism', 'hospitality', 'chef', 'cook', 'waiter', 'bartender']),
     # SECURITY SERVICES (Common employment)
-    if any(word in title for word in ['security', 'guard', 'watchman', 'police', 'military']):
-        return 'Security Services'
-    
+    ('Security Services', ['security', 'guard', 'watchman', 'police', 'military']),
     # DOMESTIC & SERVICE WORKERS
-    if any(word in title for word in ['domestic', 'house help', 'cleaner', 'gardener', 'laundry']):
-        return 'Domestic Services'
-    
+    ('Domestic Services', ['domestic', 'house help', 'cleaner', 'gardener', 'laundry']),
     # MEDIA & CREATIVE
-    if any(word in title for word in ['journalist', 'media', 'radio', 'television', 'artist', 'musician', 'photographer']):
-        return 'Media & Creative'
+    ('Media & Creative', ['journalist', 'media', 'radio', 'television', 'artist', 'musician', 'photographer']),
+]
+
+def _keyword_trie_pattern(keywords: List[str]) -> str:
+    """Regex alternation of keywords factored into a prefix trie (longest match first)."""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def to_pattern(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + to_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            return ('(?:' + pattern + ')?') if len(branches) == 1 else pattern + '?'
+        return pattern
+
+    return to_pattern(trie)
+
+def _build_job_title_matcher() -> Tuple[re.Pattern, Dict[str, int]]:
+    """
+    Compile every category keyword into one regex.
+
+    The trie-shaped lookahead reports the longest keyword starting at each
+    position in a single finditer pass. Any shorter keyword starting at the
+    same position is a prefix of it, so each keyword's priority is taken as
+    the best priority among its keyword prefixes. The lowest priority over
+    all positions is then the category the sequential keyword scans return.
+    """
+    keyword_priority = {}
+    for priority, (_, keywords) in enumerate(GHANA_JOB_CATEGORY_KEYWORDS):
+        for keyword in keywords:
+            keyword_priority.setdefault(keyword, priority)
+
+    match_priority = {
+        keyword: min(other_priority for other, other_priority in keyword_priority.items()
+                     if keyword.startswith(other))
+        for keyword in keyword_priority
+    }
+    return re.compile(f'(?=({_keyword_trie_pattern(list(keyword_priority))}))'), match_priority
+
+_JOB_TITLE_PATTERN, _KEYWORD_PRIORITY = _build_job_title_matcher()
+
+@lru_cache(maxsize=4096)
+def _categorize_normalized_title(title: str) -> str:
+    """Categorize a lowercased, stripped job title."""
+    best = len(GHANA_JOB_CATEGORY_KEYWORDS)
+    for match in _JOB_TITLE_PATTERN.finditer(title):
+        priority = _KEYWORD_PRIORITY[match.group(1)]
+        if priority < best:
+            best = priority
+            if best == 0:
+                break
+    if best == len(GHANA_JOB_CATEGORY_KEYWORDS):
+        return 'Other Services'
+    return GHANA_JOB_CATEGORY_KEYWORDS[best][0]
+
+def categorize_ghana_job_title(title: str) -> str:
+    """
+    Categorize job titles based on Ghana's employment landscape and economic sectors.
+    
+    Ghana's economy is driven by:
+    - Services (54% of GDP): Banking, telecom, retail, hospitality
+    - Industry (25% of GDP): Mining, manufacturing, construction  
+    - Agriculture (21% of GDP): Cocoa, agriculture, fishing
     
-    return 'Other Services'
+    Keyword categories are checked in GHANA_JOB_CATEGORY_KEYWORDS order
+    with one precompiled regex pass; recently seen titles are cached.
+    """
+    if pd.isna(title) or title == '':
+        return 'Unknown'
+    
+    return _categorize_normalized_title(str(title).lower().strip())
+
+def categorize_ghana_job_titles(titles: Union[pd.Series, List[Any]]) -> pd.Series:
+    """
+    Vectorized categorize_ghana_job_title for a Series of job titles.
+    
+    Each distinct title is categorized once and the results are broadcast
+    back to every row; missing titles map to 'Unknown'.
+    """
+    titles = titles if isinstance(titles, pd.Series) else pd.Series(titles, dtype=object)
+    codes, uniques = pd.factorize(titles)
+    # Missing values get code -1, which picks the trailing 'Unknown'
+    categories = np.array([categorize_ghana_job_title(title) for title in uniques] + ['Unknown'], dtype=object)
+    return pd.Series(categories[codes], index=titles.index, name=titles.name)
 
 def get_ghana_job_stability_score(job_category: str) -> int:
     """
@@ -200,25 +236,7 @@ def calculate_ghana_employment_score(emp_length: str, job_category: str, annual_
         Dictionary with employment metrics
     """
     # Employment length scoring (0-40 points)
-    emp_length_score = 0
-    emp_length_str = str(emp_length).lower()
-    
-    if '10+' in emp_length_str or '10 years' in emp_length_str:
-        emp_length_score = 40
-    elif any(x in emp_length_str for x in ['8', '9']):
-        emp_length_score = 35
-    elif any(x in emp_length_str for x in ['6', '7']):
-        emp_length_score = 30
-    elif any(x in emp_length_str for x in ['4', '5']):
-        emp_length_score = 25
-    elif any(x in emp_length_str for x in ['2', '3']):
-        emp_length_score = 15
-    elif '1' in emp_length_str:
-        emp_length_score = 10
-    elif '< 1' in emp_length_str or 'less than 1' in emp_length_str:
-        emp_length_score = 5
-    else:
-        emp_length_score = 15  # Default
+    emp_length_score = _employment_length_score(emp_length)
     
     # Job stability score (0-60 points)
     job_stability_score = get_ghana_job_stability_score(job_category)
@@ -254,6 +272,27 @@ def calculate_ghana_employment_score(emp_length: str, job_category: str, annual_
         'employment_risk_level': _get_employment_risk_level(total_score)
     }
 
+def _employment_length_score(emp_length: Any) -> int:
+    """Score employment length on a 0-40 scale."""
+    emp_length_str = str(emp_length).lower()
+    
+    if '10+' in emp_length_str or '10 years' in emp_length_str:
+        return 40
+    elif any(x in emp_length_str for x in ['8', '9']):
+        return 35
+    elif any(x in emp_length_str for x in ['6', '7']):
+        return 30
+    elif any(x in emp_length_str for x in ['4', '5']):
+        return 25
+    elif any(x in emp_length_str for x in ['2', '3']):
+        return 15
+    elif '1' in emp_length_str:
+        return 10
+    elif '< 1' in emp_length_str or 'less than 1' in emp_length_str:
+        return 5
+    else:
+        return 15  # Default
+
 def _get_employment_risk_level(score: float) -> str:
     """Convert employment score to risk level."""
     if score >= 90:
@@ -267,10 +306,27 @@ def _get_employment_risk_level(score: float) -> str:
     else:
         return 'Very High Risk'
 
+def _map_unique(values: pd.Series, func) -> np.ndarray:
+    """Apply func to each distinct value once and broadcast the results back."""
+    codes, uniques = pd.factorize(values)
+    # Missing values get code -1, which picks the trailing func(nan)
+    table = np.array([func(value) for value in uniques] + [func(np.nan)], dtype=object)
+    return table[codes]
+
+def _round_unique(values: np.ndarray, digits: int = 1) -> np.ndarray:
+    """Python round() over the distinct values (matches the scalar path exactly)."""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    return np.array([round(float(value), digits) for value in uniques], dtype='float64')[inverse]
+
 def process_ghana_employment_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     Process employment features for Ghana context.
     
+    Columnar equivalent of calling calculate_ghana_employment_score per row:
+    job titles, employment lengths and categories are scored once per
+    distinct value and the income fit is computed with NumPy over the
+    whole frame.
+    
     Args:
         df: DataFrame with raw employment data
         
@@ -278,26 +334,67 @@ def process_ghana_employment_features(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with processed Ghana employment features
     """
     processed_df = df.copy()
+    n_rows = len(processed_df)
     
     # Categorize job titles for Ghana context
     if 'emp_title' in processed_df.columns:
-        processed_df['ghana_job_category'] = processed_df['emp_title'].apply(categorize_ghana_job_title)
-        processed_df['ghana_job_stability_score'] = processed_df['ghana_job_category'].apply(get_ghana_job_stability_score)
-    
-    # Calculate comprehensive employment scores
-    employment_scores = []
-    for idx, row in processed_df.iterrows():
-        emp_length = row.get('emp_length', '5 years')
-        job_category = row.get('ghana_job_category', 'Other Services')
-        annual_income = row.get('annual_inc', None)
-        
-        score_data = calculate_ghana_employment_score(emp_length, job_category, annual_income)
-        employment_scores.append(score_data)
+        job_categories = categorize_ghana_job_titles(processed_df['emp_title'])
+    else:
+        job_categories = pd.Series(['Other Services'] * n_rows, index=processed_df.index, dtype=object)
+    category_codes, categories = pd.factorize(job_categories)
+    stability = np.array([get_ghana_job_stability_score(c) for c in categories], dtype='int64')[category_codes]
     
-    # Add employment scores as new columns
-    for key in employment_scores[0].keys():
-        if key != 'expected_income_range_monthly':  # Skip tuple column
-            processed_df[f'ghana_{key}'] = [score[key] for score in employment_scores]
+    if 'emp_title' in processed_df.columns:
+        processed_df['ghana_job_category'] = job_categories
+        processed_df['ghana_job_stability_score'] = stability
+    
+    # Employment length scoring (0-40 points)
+    if 'emp_length' in processed_df.columns:
+        emp_length_scores = _map_unique(processed_df['emp_length'], _employment_length_score).astype('int64')
+    else:
+        emp_length_scores = np.full(n_rows, _employment_length_score('5 years'), dtype='int64')
+    
+    # Job stability score (0-60 points) and expected income range per category
+    job_stability_scores = (stability / 100) * 60
+    income_ranges = np.array([get_ghana_income_expectation(c) for c in categories], dtype='float64').reshape(-1, 2)
+    expected_min = income_ranges[category_codes, 0]
+    expected_max = income_ranges[category_codes, 1]
+    
+    # Income consistency score (0-20 points) - default 10 when income is not provided
+    income_scores = np.full(n_rows, 10, dtype='int64')
+    if 'annual_inc' in processed_df.columns:
+        annual_incomes = processed_df['annual_inc']
+        provided = np.ones(n_rows, dtype=bool)
+        if annual_incomes.dtype == object:
+            provided = np.array([value is not None for value in annual_incomes], dtype=bool)
+            annual_incomes = annual_incomes.where(provided, np.nan)
+        monthly_income = annual_incomes.to_numpy(dtype='float64') / 12
+        
+        with np.errstate(invalid='ignore'):
+            income_scores = np.where(provided, np.select(
+                [
+                    (expected_min <= monthly_income) & (monthly_income <= expected_max),
+                    monthly_income > expected_max,
+                    monthly_income >= expected_min * 0.8,
+                    monthly_income >= expected_min * 0.6
+                ],
+                [20, 18, 15, 10],
+                default=5
+            ), 10).astype('int64')
+    
+    total_scores = emp_length_scores + job_stability_scores + income_scores
+    
+    # Add employment scores as new columns (same names and order as the per-row version)
+    processed_df['ghana_total_employment_score'] = _round_unique(total_scores)
+    processed_df['ghana_employment_length_score'] = emp_length_scores
+    processed_df['ghana_job_stability_score'] = _round_unique(job_stability_scores)
+    processed_df['ghana_income_consistency_score'] = income_scores
+    processed_df['ghana_job_category'] = job_categories.to_numpy(dtype=object)
+    processed_df['ghana_employment_risk_level'] = np.select(
+        [total_scores >= 90, total_scores >= 75, total_scores >= 60, total_scores >= 45],
+        ['Very Low Risk', 'Low Risk', 'Medium Risk', 'High Risk'],
+        default='Very High Risk'
+    ).astype(object)
     
     return processed_df
 
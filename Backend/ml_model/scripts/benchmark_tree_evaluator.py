@@ -0,0 +1,84 @@
+"""
+Tree Evaluator Benchmark Script
+Compares the NumPy tree evaluator with XGBoost predict for parity and latency.
+
+Usage:
+    python ml_model/scripts/benchmark_tree_evaluator.py [--iterations N] [--rows N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the ml_model directory to the path for imports
+ml_model_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ml_model_dir not in sys.path:
+    sys.path.append(ml_model_dir)
+
+from src.credit_scorer import CreditScorer
+from src.tree_evaluator import NumpyTreeEvaluator
+
+
+def _latency_ms(func, argument, iterations: int) -> np.ndarray:
+    """Time repeated calls and return per-call latencies in milliseconds."""
+    func(argument)  # warm up
+    timings = np.empty(iterations)
+    for i in range(iterations):
+        start_time = time.perf_counter()
+        func(argument)
+        timings[i] = time.perf_counter() - start_time
+    return timings * 1000
+
+
+def run_benchmark(iterations: int = 5000, rows: int = 50000) -> None:
+    """Check parity on random rows, then compare single-row latency."""
+    scorer = CreditScorer()
+    if not scorer.load_model():
+        raise RuntimeError("Failed to load credit scoring model")
+    evaluator = NumpyTreeEvaluator.from_booster(scorer.model)
+    print(f"Model: {evaluator.n_trees} trees, max depth {evaluator.max_depth}, {len(evaluator.split_index)} nodes")
+
+    # Parity over random inputs, including missing values
+    rng = np.random.default_rng(0)
+    features = np.column_stack(
+        [rng.uniform(0, 400000, rows), rng.uniform(0, 80, rows), rng.uniform(3, 35, rows), rng.uniform(0, 150, rows)] +
+        [rng.integers(0, 25, rows).astype('float64') for _ in range(12)]
+    )
+    features[::50, 3] = np.nan
+    mismatches = int((evaluator.predict(features) != scorer.model.predict(features)).sum())
+    print(f"Parity: {mismatches} mismatches in {rows} rows")
+
+    # Single-row latency as seen by predict_credit_score (one-row DataFrame input)
+    sample = scorer._preprocess_single_application(scorer._get_sample_data()).iloc[:, :16]
+    results = {
+        'xgboost predict (DataFrame)': _latency_ms(scorer.model.predict, sample, iterations),
+        'native predict (DataFrame)': _latency_ms(evaluator.predict, sample, iterations),
+        'native predict (ndarray)': _latency_ms(evaluator.predict, sample.to_numpy(), iterations),
+    }
+
+    print(f"\nSingle-row latency over {iterations} calls (ms)")
+    print(f"{'backend':32} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, timings in results.items():
+        p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+        print(f"{name:32} {p50:8.3f} {p95:8.3f} {p99:8.3f}")
+
+    if mismatches:
+        raise SystemExit(1)
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description='Benchmark the NumPy tree evaluator against XGBoost')
+    parser.add_argument('--iterations', type=int, default=5000, help='Timed single-row calls per backend')
+    parser.add_argument('--rows', type=int, default=50000, help='Random rows for the parity check')
+    args = parser.parse_args()
+
+    run_benchmark(args.iterations, args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Model Artifact Export Script
+Converts the legacy pickled model into a native XGBoost booster plus a
+versioned manifest with checksums and feature order.
+
+Usage:
+    python ml_model/scripts/export_model_artifacts.py [--model-dir DIR] [--model-version VERSION]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add the ml_model directory to the path for imports
+ml_model_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ml_model_dir not in sys.path:
+    sys.path.append(ml_model_dir)
+
+from final_preprocessor import EXPECTED_FEATURES
+from src.credit_scorer import CreditScorer
+from src.model_artifacts import build_manifest, write_manifest, file_sha256
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BOOSTER_FILENAME = 'xgboost_credit_model_fixed.ubj'
+
+
+def export_artifacts(model_dir: str, model_version: str = None) -> str:
+    """
+    Export the currently deployed legacy model to manifest format.
+
+    Args:
+        model_dir: Model directory containing the legacy pickle files
+        model_version: Version label (defaults to the version in the model metrics)
+
+    Returns:
+        Path of the written manifest
+    """
+    scorer = CreditScorer(model_dir)
+    scorer._load_legacy_artifacts()
+    scorer._validate_model_integrity()
+    scorer.is_loaded = True
+    legacy_source = scorer.artifact_source.split(' ', 1)[1]
+
+    # Native booster format: no pickle, loads independently of the Python class layout
+    booster_path = os.path.join(model_dir, BOOSTER_FILENAME)
+    scorer.model.save_model(booster_path)
+    logger.info(f"Booster saved: {booster_path}")
+
+    artifacts = {'booster': {'file': BOOSTER_FILENAME, 'format': 'xgboost-ubj'}}
+    if os.path.exists(os.path.join(model_dir, 'preprocessor.pkl')):
+        artifacts['preprocessor'] = {'file': 'preprocessor.pkl', 'format': 'pickle'}
+
+    encoding = scorer.data_processor.home_ownership_encoding
+    encoding = {str(k): float(v) for k, v in encoding.items()} if encoding else {}
+
+    if model_version is None:
+        model_version = scorer.model_metadata.get('model_version', '1.0')
+
+    manifest = build_manifest(
+        model_dir,
+        artifacts=artifacts,
+        feature_order=EXPECTED_FEATURES,
+        model_version=model_version,
+        metadata=_json_safe(scorer.model_metadata),
+        home_ownership_encoding=encoding,
+        source={'file': legacy_source, 'sha256': file_sha256(os.path.join(model_dir, legacy_source))}
+    )
+    manifest_path = write_manifest(model_dir, manifest)
+
+    # Verify the exported model gives the same predictions as the pickle
+    exported = CreditScorer(model_dir)
+    if not exported.load_model() or not exported.artifact_source.startswith('manifest'):
+        raise RuntimeError("Exported manifest could not be loaded")
+    sample = scorer._get_sample_data()
+    original = scorer.predict_credit_score(sample)['raw_prediction']
+    reloaded = exported.predict_credit_score(sample)['raw_prediction']
+    if original != reloaded:
+        raise RuntimeError(f"Exported model prediction differs: {original} != {reloaded}")
+
+    logger.info(f"Export verified (sample raw prediction {reloaded:.4f})")
+    return manifest_path
+
+
+def _json_safe(value):
+    """Convert model metadata to JSON-serializable values."""
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if hasattr(value, 'to_dict'):
+        return _json_safe(value.to_dict('records') if hasattr(value, 'columns') else value.to_dict())
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+def main():
+    """Main export function."""
+    parser = argparse.ArgumentParser(description='Export model artifacts with a versioned manifest')
+    parser.add_argument('--model-dir', default=os.path.join(ml_model_dir, 'models'),
+                        help='Model directory (default: ml_model/models)')
+    parser.add_argument('--model-version', default=None,
+                        help='Version label for the manifest (default: from model metrics)')
+    args = parser.parse_args()
+
+    manifest_path = export_artifacts(args.model_dir, args.model_version)
+    print(f"Manifest written to {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,15 @@ import os
 from typing import Dict, List, Tuple, Optional, Union
 from sklearn.preprocessing import StandardScaler
 
+try:
+    from ..src.model_registry import registry
+except (ImportError, ValueError):
+    import sys
+    ml_model_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if ml_model_dir not in sys.path:
+        sys.path.append(ml_model_dir)
+    from src.model_registry import registry
+
 
 class CreditRiskModel:
     """
@@ -309,17 +318,21 @@ def validate_input_data(data: Dict[str, Union[str, float]]) -> Tuple[bool, List[
     return len(errors) == 0, errors
 
 
-# Global model instance for efficient reuse
-_model_instance = None
+def _load_model_instance() -> CreditRiskModel:
+    """Create and load the model for the model registry."""
+    model = CreditRiskModel()
+    if not model.load_model():
+        raise RuntimeError("Failed to load model")
+    return model
+
+
+# Registered at import so warmup hooks can preload it
+registry.register('credit_risk_model', _load_model_instance)
+
 
 def get_model_instance() -> CreditRiskModel:
-    """Get singleton model instance for efficient reuse."""
-    global _model_instance
-    if _model_instance is None:
-        _model_instance = CreditRiskModel()
-        if not _model_instance.load_model():
-            raise RuntimeError("Failed to load model")
-    return _model_instance
+    """Get shared model instance from the model registry."""
+    return registry.get('credit_risk_model')
 
 
 def quick_predict(data: Dict[str, Union[str, float]]) -> Dict[str, Union[float, str]]:
@@ -13,7 +13,7 @@ ml_model_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if ml_model_dir not in sys.path:
     sys.path.append(ml_model_dir)
 
-from scripts.model_utils import CreditRiskModel, validate_input_data, quick_predict
+from scripts.model_utils import CreditRiskModel, validate_input_data, quick_predict, get_model_instance
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +38,7 @@ class CreditRiskPredictor:
     def _load_model(self) -> CreditRiskModel:
         """Load the credit risk model."""
         try:
-            model = CreditRiskModel()
-            if not model.load_model():
-                raise RuntimeError("Failed to load credit risk model")
+            model = get_model_instance()
             logger.info("Credit risk model loaded successfully")
             return model
         except Exception as e:
@@ -0,0 +1,263 @@
+"""
+Batch Scoring Results for RiskGuard System
+Column-oriented batch results with model-level metadata stored once per batch
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# Confidence factors in the order they are weighted into the final confidence
+CONFIDENCE_FACTOR_WEIGHTS = (
+    ('model_performance', 0.35),
+    ('score_range', 0.25),
+    ('prediction_stability', 0.20),
+    ('feature_completeness', 0.15),
+    ('ghana_employment', 0.15),
+)
+
+CONFIDENCE_FACTOR_DESCRIPTIONS = {
+    'prediction_stability': "Based on model prediction error metrics",
+    'feature_completeness': "Based on input data quality and completeness",
+    'ghana_employment': "Based on Ghana-specific employment analysis",
+}
+
+
+def confidence_level(confidence_score: float) -> str:
+    """Convert confidence score to descriptive level."""
+    if confidence_score >= 90:
+        return "Very High"
+    elif confidence_score >= 80:
+        return "High"
+    elif confidence_score >= 70:
+        return "Medium"
+    elif confidence_score >= 60:
+        return "Low"
+    else:
+        return "Very Low"
+
+
+def confidence_explanation(confidence_score: float, factors: Dict) -> str:
+    """Generate human-readable confidence explanation."""
+    level = confidence_level(confidence_score)
+
+    # Find the highest contributing factor
+    max_contribution = max(factors.values(), key=lambda x: x['score'] * x['weight'])
+
+    explanations = {
+        "Very High": f"Very high confidence ({confidence_score}%) due to excellent model performance and stable prediction.",
+        "High": f"High confidence ({confidence_score}%) with good model reliability. Primary factor: {max_contribution['description']}",
+        "Medium": f"Medium confidence ({confidence_score}%). Consider reviewing input data quality for better reliability.",
+        "Low": f"Low confidence ({confidence_score}%). Prediction may be less reliable due to data limitations or extreme values.",
+        "Very Low": f"Very low confidence ({confidence_score}%). Use this prediction with caution."
+    }
+
+    return explanations.get(level, f"Confidence: {confidence_score}%")
+
+
+def confidence_factors(score: int, metrics: Dict[str, float], score_confidence: float, stability_confidence: float,
+                       feature_confidence: float, ghana_employment_confidence: float) -> Dict[str, Dict[str, Any]]:
+    """Per-factor confidence breakdown for one prediction."""
+    base_r2 = metrics['base_r2']
+    model_accuracy_percent = metrics['model_accuracy_percent']
+    weights = dict(CONFIDENCE_FACTOR_WEIGHTS)
+    return {
+        'model_performance': {
+            'score': round(base_r2 * 100, 2),
+            'weight': weights['model_performance'],
+            'description': f"Model accuracy: {model_accuracy_percent}% (R² = {base_r2:.4f})",
+            'display_accuracy': model_accuracy_percent
+        },
+        'score_range': {
+            'score': score_confidence,
+            'weight': weights['score_range'],
+            'description': f"Credit score {score} in typical range"
+        },
+        'prediction_stability': {
+            'score': stability_confidence,
+            'weight': weights['prediction_stability'],
+            'description': CONFIDENCE_FACTOR_DESCRIPTIONS['prediction_stability']
+        },
+        'feature_completeness': {
+            'score': feature_confidence,
+            'weight': weights['feature_completeness'],
+            'description': CONFIDENCE_FACTOR_DESCRIPTIONS['feature_completeness']
+        },
+        'ghana_employment': {
+            'score': ghana_employment_confidence,
+            'weight': weights['ghana_employment'],
+            'description': CONFIDENCE_FACTOR_DESCRIPTIONS['ghana_employment']
+        }
+    }
+
+
+def weighted_confidence(factors: Dict[str, Dict[str, Any]]) -> float:
+    """Weighted confidence, capped at 99.9% and rounded like the API reports it."""
+    total = sum(factor['score'] * factor['weight'] for factor in factors.values())
+    return round(min(total, 99.9), 2)
+
+
+def weighted_confidence_array(metrics: Dict[str, float], score_confidence: np.ndarray,
+                              stability_confidence: np.ndarray, feature_confidence: np.ndarray,
+                              ghana_confidence: np.ndarray) -> List[float]:
+    """
+    weighted_confidence for whole columns.
+
+    Terms are added in factor order starting from 0, like sum() does, so the
+    float64 results are bit-identical to the per-row calculation.
+    """
+    weights = dict(CONFIDENCE_FACTOR_WEIGHTS)
+    total = 0 + round(metrics['base_r2'] * 100, 2) * weights['model_performance']
+    total = total + score_confidence * weights['score_range']
+    total = total + stability_confidence * weights['prediction_stability']
+    total = total + feature_confidence * weights['feature_completeness']
+    total = total + ghana_confidence * weights['ghana_employment']
+    return [round(min(value, 99.9), 2) for value in np.broadcast_to(total, score_confidence.shape).tolist()]
+
+
+class BatchScoringResult:
+    """
+    Compact result of scoring one batch.
+
+    Per-row values live in column arrays; values shared by the whole batch
+    (model version, timestamp, scaling info, model metrics) are stored once
+    in metadata. Rows that were not scored in the vectorized pass (cache
+    hits, validation errors, per-row fallbacks) keep their result dict in
+    rows. to_dict()/to_dicts() rebuild the predict_credit_score dict shape
+    on demand; to_json() emits the compact form without building per-row
+    dicts.
+    """
+
+    __slots__ = ('size', 'metadata', 'columns', 'rows', '_metrics')
+
+    # Columns of the compact form, in output order
+    COLUMN_NAMES = ('success', 'credit_score', 'category', 'risk_level', 'confidence', 'confidence_level',
+                    'raw_prediction', 'job_category', 'ghana_job_stability_score', 'ghana_employment_score', 'error')
+
+    def __init__(self, size: int, metadata: Dict[str, Any], columns: Optional[Dict[str, Any]] = None,
+                 rows: Optional[Dict[int, Dict[str, Any]]] = None, confidence_metrics: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            size: Number of applications in the batch
+            metadata: Batch-level values shared by every scored row
+            columns: Per-row arrays for the vectorized rows; 'scored' marks them
+            rows: Complete result dicts for the other rows, by batch index
+            confidence_metrics: Model metrics used to rebuild confidence factors
+        """
+        self.size = size
+        self.metadata = metadata
+        self.columns = columns if columns is not None else {'scored': np.zeros(size, dtype=bool)}
+        self.rows = rows if rows is not None else {}
+        self._metrics = confidence_metrics
+
+    @classmethod
+    def from_rows(cls, results: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> 'BatchScoringResult':
+        """Wrap already built result dicts (e.g. from the per-row path)."""
+        return cls(len(results), metadata or {}, rows=dict(enumerate(results)))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self.size):
+            yield self.to_dict(i)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        return self.to_dict(index)
+
+    def is_scored(self, index: int) -> bool:
+        """Whether a row comes from the vectorized pass (rather than a stored dict)."""
+        return bool(self.columns['scored'][index])
+
+    def value(self, index: int, name: str) -> Any:
+        """One field of one row without building the full result dict."""
+        if not self.is_scored(index):
+            return self.rows[index].get(name)
+        if name == 'success':
+            return True
+        if name == 'error':
+            return None
+        value = self.columns[name][index]
+        return value.item() if isinstance(value, np.generic) else value
+
+    def confidence_factors(self, index: int) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Confidence factor breakdown for one row."""
+        if not self.is_scored(index):
+            return self.rows[index].get('confidence_factors')
+        return confidence_factors(
+            int(self.columns['credit_score'][index]), self._metrics,
+            float(self.columns['score_confidence'][index]),
+            float(self.columns['stability_confidence'][index]),
+            float(self.columns['feature_confidence'][index]),
+            float(self.columns['ghana_confidence'][index])
+        )
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        """Result for one row in the predict_credit_score dict shape, with batch_index."""
+        if not self.is_scored(index):
+            return self.rows[index]
+
+        columns = self.columns
+        metadata = self.metadata
+        confidence = float(columns['confidence'][index])
+        factors = self.confidence_factors(index)
+        return {
+            'success': True,
+            'credit_score': int(columns['credit_score'][index]),
+            'category': self.value(index, 'category'),
+            'risk_level': self.value(index, 'risk_level'),
+            'confidence': confidence,
+            'confidence_level': confidence_level(confidence),
+            'confidence_factors': factors,
+            'confidence_explanation': confidence_explanation(confidence, factors),
+            'model_accuracy': metadata['model_accuracy'],
+            'model_metrics': dict(metadata['model_metrics']),
+            'model_version': metadata['model_version'],
+            'prediction_timestamp': metadata['prediction_timestamp'],
+            'raw_prediction': float(columns['raw_prediction'][index]),
+            'scaling_info': dict(metadata['scaling_info']),
+            # Ghana employment analysis results
+            'job_category': self.value(index, 'job_category'),
+            'ghana_job_stability_score': self.value(index, 'ghana_job_stability_score'),
+            'ghana_employment_score': self.value(index, 'ghana_employment_score'),
+            'batch_index': index
+        }
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Every row in the predict_credit_score dict shape (the batch_predict format)."""
+        return [self.to_dict(i) for i in range(self.size)]
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Per-row values as plain lists, one list per field in COLUMN_NAMES."""
+        scored = self.columns['scored']
+        output = {}
+        for name in self.COLUMN_NAMES:
+            if name == 'success':
+                values = scored.tolist()
+            elif name == 'error':
+                values = [None] * self.size
+            elif name in self.columns:
+                values = self.columns[name].tolist()
+            else:
+                values = [None] * self.size
+            for index, row in self.rows.items():
+                values[index] = row.get(name)
+            output[name] = values
+        return output
+
+    def to_compact(self) -> Dict[str, Any]:
+        """Compact form: batch metadata once, then one list per field."""
+        return {
+            'metadata': self.metadata,
+            'count': self.size,
+            'columns': self.to_columns()
+        }
+
+    def to_json(self) -> str:
+        """JSON encoding of the compact form."""
+        return json.dumps(self.to_compact(), separators=(',', ':'))
@@ -0,0 +1,202 @@
+"""
+Counterfactual Engine for RiskGuard System
+Finds the smallest changes that lift an application into the next score category
+"""
+
+import itertools
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Actionable model features and the relative reductions tried for each.
+# Count features are reduced to whole numbers; loan_amnt is truncated like the preprocessor does.
+COUNTERFACTUAL_CHANGES = {
+    'dti': [0.1, 0.2, 0.3, 0.4, 0.5],
+    'revol_util': [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+    'loan_amnt': [0.1, 0.2, 0.3, 0.4, 0.5],
+    'int_rate': [0.1, 0.2, 0.3],
+    'inq_last_6mths': [0.5, 1.0],
+    'delinq_2yrs': [1.0],
+    'collections_12_mths_ex_med': [1.0],
+    'pub_rec': [1.0],
+}
+
+COUNT_FEATURES = {'inq_last_6mths', 'delinq_2yrs', 'collections_12_mths_ex_med', 'pub_rec'}
+
+FEATURE_DESCRIPTIONS = {
+    'dti': 'debt-to-income ratio',
+    'revol_util': 'revolving credit utilization',
+    'loan_amnt': 'requested loan amount',
+    'int_rate': 'interest rate',
+    'inq_last_6mths': 'recent credit inquiries',
+    'delinq_2yrs': 'delinquencies in the last 2 years',
+    'collections_12_mths_ex_med': 'collections in the last 12 months',
+    'pub_rec': 'public records',
+}
+
+
+class CounterfactualEngine:
+    """
+    Vectorized counterfactual search over a grid of feature changes.
+
+    For every application the engine builds single-feature reductions and
+    pairwise combinations of them, stacks the candidates of all
+    applications into one matrix and scores it with a single model call.
+    Candidates that reach the next score category are ranked by the number
+    of features changed, then by total relative change, and the smallest
+    distinct scenarios are kept.
+    """
+
+    def __init__(self, scorer: Any, changes: Optional[Dict[str, List[float]]] = None,
+                 max_scenarios: int = 3, max_pair_steps: int = 3):
+        """
+        Args:
+            scorer: Loaded CreditScorer
+            changes: Feature -> relative reductions to try (defaults to COUNTERFACTUAL_CHANGES)
+            max_scenarios: Scenarios kept per application
+            max_pair_steps: Smallest reductions per feature used in pairwise combinations
+        """
+        self.scorer = scorer
+        self.changes = changes or COUNTERFACTUAL_CHANGES
+        self.max_scenarios = max_scenarios
+        self.max_pair_steps = max_pair_steps
+        self.feature_names = list(scorer.model.get_booster().feature_names)
+
+    def _next_category(self, score: int) -> Optional[Tuple[int, str]]:
+        """Minimum score and name of the category above the given score."""
+        for (min_score, _), (category, _) in sorted(self.scorer.score_categories.items()):
+            if min_score > score:
+                return min_score, category
+        return None
+
+    def _candidate_changes(self, row: np.ndarray) -> List[Dict[str, Tuple[float, float]]]:
+        """Feature changes to try for one feature row: {feature: (new_value, relative_change)}."""
+        single = {}
+        for feature, reductions in self.changes.items():
+            if feature not in self.feature_names:
+                continue
+            current = row[self.feature_names.index(feature)]
+            if not np.isfinite(current) or current <= 0:
+                continue
+            steps = []
+            for reduction in reductions:
+                value = current * (1 - reduction)
+                if feature in COUNT_FEATURES or feature == 'loan_amnt':
+                    value = float(np.floor(value))
+                value = round(float(value), 4)
+                if value < current and all(value != existing for existing, _ in steps):
+                    steps.append((value, (current - value) / current))
+            if steps:
+                single[feature] = steps
+
+        candidates = [{feature: step} for feature, steps in single.items() for step in steps]
+        for first, second in itertools.combinations(single, 2):
+            for step_a in single[first][:self.max_pair_steps]:
+                for step_b in single[second][:self.max_pair_steps]:
+                    candidates.append({first: step_a, second: step_b})
+        return candidates
+
+    def generate(self, features: np.ndarray, scores: Optional[np.ndarray] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Generate counterfactual scenarios for a model feature matrix.
+
+        Args:
+            features: Matrix in EXPECTED_FEATURES order, one row per application
+            scores: Current credit scores (computed from features when omitted)
+
+        Returns:
+            One list of scenarios per application (empty when the application is
+            already in the top category or no candidate reaches the next one)
+        """
+        features = np.asarray(features, dtype='float64')
+        if scores is None:
+            scores = self.to_scores(self.scorer._predict_raw(features))
+
+        # Build every application's grid, then score them all in one call
+        grids = []
+        blocks = []
+        for row, score in zip(features, scores):
+            candidates = self._candidate_changes(row) if self._next_category(int(score)) else []
+            grid = np.repeat(row[None, :], len(candidates), axis=0)
+            for i, candidate in enumerate(candidates):
+                for feature, (value, _) in candidate.items():
+                    grid[i, self.feature_names.index(feature)] = value
+            grids.append(candidates)
+            blocks.append(grid)
+
+        stacked = np.vstack(blocks) if blocks else np.empty((0, len(self.feature_names)))
+        projected = self.to_scores(self.scorer._predict_raw(stacked)) if len(stacked) else np.empty(0, dtype=int)
+
+        results = []
+        offset = 0
+        for row, score, candidates in zip(features, scores, grids):
+            candidate_scores = projected[offset:offset + len(candidates)]
+            offset += len(candidates)
+            results.append(self._select_scenarios(row, int(score), candidates, candidate_scores))
+        return results
+
+    def to_scores(self, raw_predictions: np.ndarray) -> np.ndarray:
+        """Credit scores for raw model outputs (CreditScorer._scale_raw_prediction_to_credit_score, vectorized)."""
+        scaled = 300 + (np.asarray(raw_predictions) - self.scorer.raw_score_min) * self.scorer.scale_factor
+        return np.rint(np.clip(scaled, 300, 850)).astype(int)
+
+    def _select_scenarios(self, row: np.ndarray, score: int, candidates: List[Dict[str, Tuple[float, float]]],
+                          candidate_scores: np.ndarray) -> List[Dict[str, Any]]:
+        """Keep the smallest distinct changes that reach the next category."""
+        target = self._next_category(score)
+        if target is None:
+            return []
+        target_score, target_category = target
+
+        reaching = [
+            (len(candidate), sum(change for _, change in candidate.values()), i)
+            for i, candidate in enumerate(candidates)
+            if candidate_scores[i] >= target_score
+        ]
+        reaching.sort()
+
+        scenarios = []
+        used_feature_sets = []
+        for _, _, i in reaching:
+            feature_set = set(candidates[i])
+            # A scenario is redundant if a smaller kept scenario already changes a subset of its features
+            if any(kept <= feature_set for kept in used_feature_sets):
+                continue
+            used_feature_sets.append(feature_set)
+            scenarios.append(self._build_scenario(row, score, int(candidate_scores[i]), candidates[i], target_category))
+            if len(scenarios) >= self.max_scenarios:
+                break
+        return scenarios
+
+    def _build_scenario(self, row: np.ndarray, score: int, projected_score: int,
+                        candidate: Dict[str, Tuple[float, float]], target_category: str) -> Dict[str, Any]:
+        """Describe one counterfactual scenario."""
+        required_changes = {}
+        descriptions = []
+        for feature, (value, change) in candidate.items():
+            current = float(row[self.feature_names.index(feature)])
+            required_changes[feature] = {
+                'current': round(current, 4),
+                'target': value,
+                'change_percent': round(-change * 100, 1)
+            }
+            descriptions.append(
+                f"{FEATURE_DESCRIPTIONS.get(feature, feature)} from {current:g} to {value:g}"
+            )
+
+        return {
+            'scenario': f"Reach {target_category}: reduce " + " and ".join(
+                FEATURE_DESCRIPTIONS.get(feature, feature) for feature in candidate
+            ),
+            'target_category': target_category,
+            'original_score': score,
+            'projected_score': projected_score,
+            'required_changes': required_changes,
+            'explanation': (
+                f"Reducing {' and '.join(descriptions)} is projected to raise the credit score "
+                f"from {score} to {projected_score} ({target_category})."
+            )
+        }
@@ -7,21 +7,54 @@ import pandas as pd
 import numpy as np
 import pickle
 import os
+import sys
 import logging
 from typing import Dict, List, Union, Optional, Any, Tuple
 from datetime import datetime
 import json
+import copy
+import time
+import threading
 
 # Import validation function from final_preprocessor
 try:
-    from ..final_preprocessor import validate_single_application
+    from .. import final_preprocessor
+    from ..final_preprocessor import validate_single_application, FeatureContext
 except ImportError:
     import sys
     import os
     parent_dir = os.path.dirname(os.path.dirname(__file__))
     if parent_dir not in sys.path:
         sys.path.append(parent_dir)
-    from final_preprocessor import validate_single_application
+    import final_preprocessor
+    from final_preprocessor import validate_single_application, FeatureContext
+
+try:
+    from .model_registry import registry
+    from .model_artifacts import read_manifest, verify_artifacts, manifest_checksums, file_sha256, source_changed
+    from .prediction_cache import PredictionCache, make_cache_key
+    from .tree_evaluator import build_tree_evaluator
+    from .explanation_engine import ExplanationEngine
+    from .counterfactual_engine import CounterfactualEngine
+    from .health_monitor import health_monitor
+    from .scoring_metrics import scoring_metrics, NULL_TIMER
+    from .batch_result import (
+        BatchScoringResult, confidence_explanation, confidence_factors, confidence_level,
+        weighted_confidence, weighted_confidence_array
+    )
+except ImportError:
+    from model_registry import registry
+    from model_artifacts import read_manifest, verify_artifacts, manifest_checksums, file_sha256, source_changed
+    from prediction_cache import PredictionCache, make_cache_key
+    from tree_evaluator import build_tree_evaluator
+    from explanation_engine import ExplanationEngine
+    from counterfactual_engine import CounterfactualEngine
+    from health_monitor import health_monitor
+    from scoring_metrics import scoring_metrics, NULL_TIMER
+    from batch_result import (
+        BatchScoringResult, confidence_explanation, confidence_factors, confidence_level,
+        weighted_confidence, weighted_confidence_array
+    )
 
 # Simple DataProcessor replacement class
 class DataProcessor:
@@ -55,6 +88,28 @@ class CreditScorer:
         self.model_metadata = {}
         self.is_loaded = False
         
+        # Artifact provenance: checksums of the loaded files and where they came from
+        self.artifact_checksums = {}
+        self.artifact_source = None
+        self.feature_order = None
+        
+        # Scoring backend: 'xgboost' (default) or 'native' (NumPy tree evaluator for small requests)
+        self.scoring_backend = os.getenv('ML_SCORING_BACKEND', 'xgboost').lower()
+        self.native_max_rows = int(os.getenv('ML_NATIVE_EVALUATOR_MAX_ROWS', '64'))
+        self.tree_evaluator = None
+        
+        # Static model metadata, computed once per loaded model in _precompute_metadata()
+        self._feature_importance = []
+        self._global_importance = {}
+        self._model_performance = {}
+        self._confidence_metrics = None
+        self._model_version = '1.0'
+        
+        # Last health probe result; refreshed in the background by health_monitor
+        self._last_health = None
+        self._last_health_at = None
+        self._health_lock = threading.Lock()
+        
         # Model scaling parameters (determined from analysis)
         self.raw_score_min = 488.23  # Minimum raw prediction from model
         self.raw_score_max = 558.98  # Maximum raw prediction from model
@@ -70,61 +125,51 @@ class CreditScorer:
         }
     
     def load_model(self) -> bool:
-        """Load all model components and validate integrity."""
+        """
+        Load all model components and validate integrity.
+        
+        Uses the model manifest (native XGBoost booster plus checksums) when the
+        model directory has one, and the legacy pickle files otherwise. If the
+        manifest checksums match what is already loaded, nothing is reloaded.
+        A manifest whose source pickle has been redeployed since the export is
+        stale, so the legacy files are loaded instead.
+        """
         try:
             logger.info(f"Loading model from: {self.model_dir}")
             
-            # Load main model - try fixed model first, then fallback to original
-            model_path = os.path.join(self.model_dir, 'xgboost_credit_model_fixed.pkl')
-            if not os.path.exists(model_path):
-                model_path = os.path.join(self.model_dir, 'xgboost_credit_model.pkl')
-            if not os.path.exists(model_path):
-                model_path = os.path.join(self.model_dir, 'xgboost_credit_score_model.pkl')
-            if not os.path.exists(model_path):
-                model_path = os.path.join(self.model_dir, 'credit_model.pkl')
-            
-            with open(model_path, 'rb') as f:
-                self.model = pickle.load(f)
-            
-            # Load preprocessing components - try label encoders first
-            encoders_path = os.path.join(self.model_dir, 'label_encoders.pkl')
-            if os.path.exists(encoders_path):
-                with open(encoders_path, 'rb') as f:
-                    self.data_processor.label_encoders = pickle.load(f)
-            
-            # Fallback to old preprocessor format
-            preprocessor_path = os.path.join(self.model_dir, 'preprocessor.pkl')
-            if os.path.exists(preprocessor_path):
-                with open(preprocessor_path, 'rb') as f:
-                    self.data_processor.scaler = pickle.load(f)
-            
-            # Load home ownership encoding (old format)
-            encoding_path = os.path.join(self.model_dir, 'home_ownership_encoding.pkl')
-            if os.path.exists(encoding_path):
-                with open(encoding_path, 'rb') as f:
-                    self.data_processor.home_ownership_encoding = pickle.load(f)
-            
-            # Load model metadata - try fixed metrics first, then fallback
-            metadata_json_path = os.path.join(self.model_dir, 'xgboost_model_metrics_fixed.json')
-            if os.path.exists(metadata_json_path):
-                with open(metadata_json_path, 'r') as f:
-                    self.model_metadata = json.load(f)
-            else:
-                metadata_json_path = os.path.join(self.model_dir, 'xgboost_model_metrics.json')
-                if os.path.exists(metadata_json_path):
-                    with open(metadata_json_path, 'r') as f:
-                        self.model_metadata = json.load(f)
-                else:
-                    metadata_path = os.path.join(self.model_dir, 'model_metrics.pkl')
-                    if os.path.exists(metadata_path):
-                        with open(metadata_path, 'rb') as f:
-                            self.model_metadata = pickle.load(f)
+            manifest = None
+            try:
+                manifest = read_manifest(self.model_dir)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable model manifest: {e}")
+            
+            if manifest is not None and source_changed(manifest, self.model_dir):
+                logger.warning(
+                    f"{manifest['source']['file']} changed since the manifest was exported, "
+                    "loading legacy artifacts (re-run export_model_artifacts to refresh the manifest)"
+                )
+                manifest = None
+            
+            if manifest is not None:
+                if self.is_loaded and self.artifact_checksums == manifest_checksums(manifest):
+                    logger.info("Model artifacts unchanged, skipping reload")
+                    return True
+                try:
+                    self._load_from_manifest(manifest)
+                except Exception as e:
+                    logger.warning(f"Manifest load failed, falling back to legacy artifacts: {e}")
+                    manifest = None
+            
+            if manifest is None:
+                self._load_legacy_artifacts()
             
             # Validate model integrity
             self._validate_model_integrity()
+            self._configure_scoring_backend()
+            self._precompute_metadata()
             
             self.is_loaded = True
-            logger.info("Model loaded successfully")
+            logger.info(f"Model loaded successfully ({self.artifact_source})")
             return True
             
         except Exception as e:
@@ -132,6 +177,86 @@ class CreditScorer:
             self.is_loaded = False
             return False
     
+    def _load_from_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Load model components listed in a verified manifest."""
+        import xgboost as xgb
+        
+        checksums = verify_artifacts(manifest, self.model_dir)
+        
+        # Feature order must match what the preprocessor produces
+        if manifest['feature_order'] != final_preprocessor.EXPECTED_FEATURES:
+            raise ValueError("Manifest feature order does not match the preprocessor")
+        
+        booster = manifest['artifacts']['booster']
+        model = xgb.XGBRegressor()
+        model.load_model(os.path.join(self.model_dir, booster['file']))
+        
+        scaler = None
+        if 'preprocessor' in manifest['artifacts']:
+            with open(os.path.join(self.model_dir, manifest['artifacts']['preprocessor']['file']), 'rb') as f:
+                scaler = pickle.load(f)
+        
+        self.model = model
+        self.data_processor.scaler = scaler
+        self.data_processor.label_encoders = None
+        self.data_processor.home_ownership_encoding = manifest.get('home_ownership_encoding') or None
+        self.model_metadata = manifest.get('metadata', {})
+        self.feature_order = manifest['feature_order']
+        self.artifact_checksums = checksums
+        self.artifact_source = f"manifest {manifest.get('model_version', 'unknown')}"
+    
+    def _load_legacy_artifacts(self) -> None:
+        """Load model components by probing the legacy pickle file names."""
+        # Load main model - try fixed model first, then fallback to original
+        model_path = os.path.join(self.model_dir, 'xgboost_credit_model_fixed.pkl')
+        if not os.path.exists(model_path):
+            model_path = os.path.join(self.model_dir, 'xgboost_credit_model.pkl')
+        if not os.path.exists(model_path):
+            model_path = os.path.join(self.model_dir, 'xgboost_credit_score_model.pkl')
+        if not os.path.exists(model_path):
+            model_path = os.path.join(self.model_dir, 'credit_model.pkl')
+        
+        with open(model_path, 'rb') as f:
+            self.model = pickle.load(f)
+        
+        # Load preprocessing components - try label encoders first
+        encoders_path = os.path.join(self.model_dir, 'label_encoders.pkl')
+        if os.path.exists(encoders_path):
+            with open(encoders_path, 'rb') as f:
+                self.data_processor.label_encoders = pickle.load(f)
+        
+        # Fallback to old preprocessor format
+        preprocessor_path = os.path.join(self.model_dir, 'preprocessor.pkl')
+        if os.path.exists(preprocessor_path):
+            with open(preprocessor_path, 'rb') as f:
+                self.data_processor.scaler = pickle.load(f)
+        
+        # Load home ownership encoding (old format)
+        encoding_path = os.path.join(self.model_dir, 'home_ownership_encoding.pkl')
+        if os.path.exists(encoding_path):
+            with open(encoding_path, 'rb') as f:
+                self.data_processor.home_ownership_encoding = pickle.load(f)
+        
+        # Load model metadata - try fixed metrics first, then fallback
+        metadata_json_path = os.path.join(self.model_dir, 'xgboost_model_metrics_fixed.json')
+        if os.path.exists(metadata_json_path):
+            with open(metadata_json_path, 'r') as f:
+                self.model_metadata = json.load(f)
+        else:
+            metadata_json_path = os.path.join(self.model_dir, 'xgboost_model_metrics.json')
+            if os.path.exists(metadata_json_path):
+                with open(metadata_json_path, 'r') as f:
+                    self.model_metadata = json.load(f)
+            else:
+                metadata_path = os.path.join(self.model_dir, 'model_metrics.pkl')
+                if os.path.exists(metadata_path):
+                    with open(metadata_path, 'rb') as f:
+                        self.model_metadata = pickle.load(f)
+        
+        self.feature_order = None
+        self.artifact_checksums = {'booster': file_sha256(model_path)}
+        self.artifact_source = f"legacy {os.path.basename(model_path)}"
+    
     def _validate_model_integrity(self) -> None:
         """Validate that all model components are properly loaded."""
         if self.model is None:
@@ -149,6 +274,31 @@ class CreditScorer:
         except Exception as e:
             raise ValueError(f"Model integrity validation failed: {e}")
     
+    def _configure_scoring_backend(self) -> None:
+        """Build the native tree evaluator when selected, keeping it only if it matches XGBoost."""
+        self.tree_evaluator = None
+        if self.scoring_backend != 'native':
+            return
+        
+        evaluator = build_tree_evaluator(self.model)
+        if evaluator is None:
+            return
+        
+        sample = self._preprocess_single_application(self._get_sample_data()).iloc[:, :16]
+        expected = self.model.predict(sample)
+        if not np.array_equal(evaluator.predict(sample), expected):
+            logger.warning("Native tree evaluator does not match XGBoost predictions, using XGBoost predict")
+            return
+        
+        self.tree_evaluator = evaluator
+        logger.info(f"Native tree evaluator enabled ({evaluator.n_trees} trees, depth {evaluator.max_depth})")
+    
+    def _predict_raw(self, features: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """Raw model predictions; small inputs use the native evaluator when it is enabled."""
+        if self.tree_evaluator is not None and len(features) <= self.native_max_rows:
+            return self.tree_evaluator.predict(features)
+        return self.model.predict(features)
+    
     def _get_sample_data(self) -> Dict[str, Any]:
         """Get sample data for testing."""
         return {
@@ -170,17 +320,11 @@ class CreditScorer:
             'home_ownership': 'RENT'
         }
     
-    def _preprocess_single_application(self, data: Dict[str, Any]) -> pd.DataFrame:
-        """Preprocess a single application for prediction."""
+    def _preprocess_single_application(self, data: Dict[str, Any], context: Optional[FeatureContext] = None) -> pd.DataFrame:
+        """Preprocess a single application for prediction, reusing the feature context if given."""
         # Use fixed preprocessing that matches training data format
         try:
-            import sys
-            import os
-            parent_dir = os.path.dirname(os.path.dirname(__file__))
-            if parent_dir not in sys.path:
-                sys.path.append(parent_dir)
-            from final_preprocessor import preprocess_for_prediction_final
-            return preprocess_for_prediction_final(data, self.model_dir)
+            return final_preprocessor.preprocess_for_prediction_final(data, self.model_dir, context=context)
         except Exception as e:
             # Create minimal preprocessing as final fallback
             logger.warning(f"Using minimal preprocessing fallback: {e}")
@@ -228,12 +372,23 @@ class CreditScorer:
             
             return pd.DataFrame([processed_data])
     
-    def predict_credit_score(self, application_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _preprocess_batch(self, applications: Union[List[Dict[str, Any]], pd.DataFrame],
+                          include_ghana_features: bool = False) -> np.ndarray:
+        """Preprocess many applications into a single feature matrix."""
+        return final_preprocessor.preprocess_batch_final(applications, self.model_dir, include_ghana_features=include_ghana_features)
+    
+    def predict_credit_score(self, application_data: Dict[str, Any],
+                             context: Optional[FeatureContext] = None,
+                             use_cache: bool = True, record_metrics: bool = True) -> Dict[str, Any]:
         """
         Predict credit score from application data.
         
         Args:
             application_data: Dictionary containing application features
+            context: Optional FeatureContext for the application; it is filled
+                during preprocessing so callers can reuse the processed features
+            use_cache: Read and fill the shared prediction cache
+            record_metrics: Count the prediction in the scoring metrics
             
         Returns:
             Dictionary with prediction results and metadata
@@ -241,69 +396,123 @@ class CreditScorer:
         if not self.is_loaded:
             return self._error_response("Model not loaded. Call load_model() first.")
         
+        timer = scoring_metrics.start_request('single', self._model_version) if record_metrics else NULL_TIMER
         try:
             # Validate input data
-            is_valid, validation_errors = validate_single_application(application_data)
+            with timer.stage('validation'):
+                is_valid, validation_errors = validate_single_application(application_data)
             if not is_valid:
+                timer.finish('invalid')
                 return self._error_response(
                     "Input validation failed", 
                     validation_errors=validation_errors
                 )
             
-            # Preprocess data
-            processed_data = self._preprocess_single_application(application_data)
+            # Preprocess data; Ghana employment values are derived once on the context
+            with timer.stage('preprocessing'):
+                if context is None:
+                    context = FeatureContext(application_data)
+                processed_data = self._preprocess_single_application(application_data, context)
             
-            # Extract only the model features (first 16 columns) for prediction
-            model_features = processed_data.iloc[:, :16]  # First 16 features only
+            # Identical feature vectors under the same model version are served from cache
+            cache = self._get_prediction_cache() if use_cache else None
+            cache_key = None
+            if cache is not None:
+                with timer.stage('cache'):
+                    cache_key = self._prediction_cache_key(
+                        processed_data.to_numpy(dtype='float64')[0], application_data
+                    )
+                    cached_result = cache.get(cache_key)
+                if cached_result is not None:
+                    cached_result['prediction_timestamp'] = datetime.now().isoformat()
+                    timer.finish('cache_hit')
+                    return cached_result
             
-            # Make prediction
-            raw_prediction = self.model.predict(model_features)[0]
-            
-            # Scale raw prediction to proper credit score range (300-850)
-            credit_score = self._scale_raw_prediction_to_credit_score(raw_prediction)
-            
-            # Get category and risk level
-            category, risk_level = self._get_score_category_and_risk(credit_score)
+            with timer.stage('model_predict'):
+                # Extract only the model features (first 16 columns) for prediction
+                model_features = processed_data.iloc[:, :16]  # First 16 features only
+                
+                # Make prediction
+                raw_prediction = self._predict_raw(model_features)[0]
+                
+                # Scale raw prediction to proper credit score range (300-850)
+                credit_score = self._scale_raw_prediction_to_credit_score(raw_prediction)
+                
+                # Get category and risk level
+                category, risk_level = self._get_score_category_and_risk(credit_score)
             
             # Extract Ghana employment analysis from processed data
-            ghana_analysis = self._extract_ghana_employment_analysis(application_data, processed_data)
+            with timer.stage('ghana_analysis'):
+                ghana_analysis = self._extract_ghana_employment_analysis(application_data, processed_data, context)
             
             # Calculate comprehensive confidence
-            confidence_data = self._calculate_confidence(
-                score=credit_score,
-                processed_data=processed_data,
-                raw_prediction=float(raw_prediction)
+            with timer.stage('confidence'):
+                confidence_data = self._calculate_confidence(
+                    score=credit_score,
+                    processed_data=processed_data,
+                    raw_prediction=float(raw_prediction)
+                )
+            
+            result = self._build_prediction_result(
+                credit_score, category, risk_level, float(raw_prediction), confidence_data, ghana_analysis
             )
             
-            return {
-                'success': True,
-                'credit_score': credit_score,
-                'category': category,
-                'risk_level': risk_level,
-                'confidence': confidence_data['confidence_score'],
-                'confidence_level': confidence_data['confidence_level'],
-                'confidence_factors': confidence_data['confidence_factors'],
-                'confidence_explanation': confidence_data['confidence_explanation'],
-                'model_accuracy': confidence_data.get('model_accuracy'),
-                'model_metrics': confidence_data.get('model_metrics'),
-                'model_version': self.model_metadata.get('training_metadata', {}).get('model_version', '1.0'),
-                'prediction_timestamp': datetime.now().isoformat(),
-                'raw_prediction': float(raw_prediction),
-                'scaling_info': {
-                    'raw_score_range': f"{self.raw_score_min:.2f} - {self.raw_score_max:.2f}",
-                    'scaled_score_range': "300 - 850",
-                    'scale_factor': self.scale_factor
-                },
-                # Ghana employment analysis results
-                'job_category': ghana_analysis.get('job_category', 'N/A'),
-                'ghana_job_stability_score': ghana_analysis.get('job_stability_score', 0),
-                'ghana_employment_score': ghana_analysis.get('employment_score', 0)
-            }
+            if cache_key is not None:
+                cache.set(cache_key, result)
+            
+            timer.finish('success')
+            return result
             
         except Exception as e:
             logger.error(f"Prediction error: {e}")
+            timer.finish('error')
             return self._error_response(f"Prediction failed: {str(e)}")
     
+    def _get_prediction_cache(self) -> Optional[PredictionCache]:
+        """Shared prediction cache, or None when caching is disabled."""
+        cache = registry.get('prediction_cache')
+        return cache if cache.enabled else None
+    
+    def _prediction_cache_key(self, feature_row: np.ndarray, application_data: Dict[str, Any]) -> str:
+        """Cache key: loaded artifact checksums + preprocessed features + Ghana analysis inputs."""
+        return make_cache_key(
+            tuple(sorted(self.artifact_checksums.items())),
+            feature_row,
+            self._ghana_analysis_inputs(application_data)
+        )
+    
+    def _build_prediction_result(self, credit_score: int, category: str, risk_level: str, raw_prediction: float,
+                                 confidence_data: Dict[str, Any], ghana_analysis: Dict[str, Any],
+                                 model_version: str = None, prediction_timestamp: str = None) -> Dict[str, Any]:
+        """Assemble the response dictionary for a successful prediction."""
+        if model_version is None:
+            model_version = self.model_metadata.get('training_metadata', {}).get('model_version', '1.0')
+        
+        return {
+            'success': True,
+            'credit_score': credit_score,
+            'category': category,
+            'risk_level': risk_level,
+            'confidence': confidence_data['confidence_score'],
+            'confidence_level': confidence_data['confidence_level'],
+            'confidence_factors': confidence_data['confidence_factors'],
+            'confidence_explanation': confidence_data['confidence_explanation'],
+            'model_accuracy': confidence_data.get('model_accuracy'),
+            'model_metrics': confidence_data.get('model_metrics'),
+            'model_version': model_version,
+            'prediction_timestamp': prediction_timestamp or datetime.now().isoformat(),
+            'raw_prediction': raw_prediction,
+            'scaling_info': {
+                'raw_score_range': f"{self.raw_score_min:.2f} - {self.raw_score_max:.2f}",
+                'scaled_score_range': "300 - 850",
+                'scale_factor': self.scale_factor
+            },
+            # Ghana employment analysis results
+            'job_category': ghana_analysis.get('job_category', 'N/A'),
+            'ghana_job_stability_score': ghana_analysis.get('job_stability_score', 0),
+            'ghana_employment_score': ghana_analysis.get('employment_score', 0)
+        }
+    
     def _scale_raw_prediction_to_credit_score(self, raw_prediction: float) -> int:
         """
         Scale raw model prediction to proper credit score range (300-850).
@@ -343,6 +552,25 @@ class CreditScorer:
         Returns:
             Dictionary containing confidence score and factors
         """
+        metrics = self._get_confidence_metrics()
+        
+        return self._build_confidence(
+            score=score,
+            metrics=metrics,
+            score_confidence=self._calculate_score_range_confidence(score),
+            stability_confidence=self._calculate_prediction_stability(score, raw_prediction, metrics['rmse'], metrics['mae']),
+            feature_confidence=self._calculate_feature_completeness(processed_data),
+            ghana_employment_confidence=self._calculate_ghana_employment_confidence(processed_data)
+        )
+    
+    def _get_confidence_metrics(self) -> Dict[str, float]:
+        """Get the model performance metrics used by the confidence calculation."""
+        if self._confidence_metrics is None:
+            self._confidence_metrics = self._build_confidence_metrics()
+        return self._confidence_metrics
+    
+    def _build_confidence_metrics(self) -> Dict[str, float]:
+        """Derive the confidence metrics from the model metadata."""
         # Get model performance metrics - check both nested and direct format
         if 'test_metrics' in self.model_metadata:
             test_metrics = self.model_metadata['test_metrics']
@@ -360,74 +588,38 @@ class CreditScorer:
             mae = raw_mae * self.scale_factor if isinstance(raw_mae, (int, float)) else 14.2
             training_r2 = self.model_metadata.get('train_r2', base_r2)
         
-        model_accuracy_percent = round(base_r2 * 100, 2)
-        
-        confidence_factors = {}
-        
-        # 1. Base model performance confidence (35% weight)
-        model_confidence = base_r2 * 100
-        confidence_factors['model_performance'] = {
-            'score': round(model_confidence, 2),
-            'weight': 0.35,
-            'description': f"Model accuracy: {model_accuracy_percent}% (R² = {base_r2:.4f})",
-            'display_accuracy': model_accuracy_percent
-        }
-        
-        # 2. Score range confidence (25% weight)
-        score_confidence = self._calculate_score_range_confidence(score)
-        confidence_factors['score_range'] = {
-            'score': score_confidence,
-            'weight': 0.25,
-            'description': f"Credit score {score} in typical range"
-        }
-        
-        # 3. Prediction stability confidence (20% weight)
-        stability_confidence = self._calculate_prediction_stability(score, raw_prediction, rmse, mae)
-        confidence_factors['prediction_stability'] = {
-            'score': stability_confidence,
-            'weight': 0.20,
-            'description': "Based on model prediction error metrics"
-        }
-        
-        # 4. Feature completeness confidence (15% weight)
-        feature_confidence = self._calculate_feature_completeness(processed_data)
-        confidence_factors['feature_completeness'] = {
-            'score': feature_confidence,
-            'weight': 0.15,
-            'description': "Based on input data quality and completeness"
-        }
-        
-        # 5. Ghana employment feature confidence (15% weight - new)
-        ghana_employment_confidence = self._calculate_ghana_employment_confidence(processed_data)
-        confidence_factors['ghana_employment'] = {
-            'score': ghana_employment_confidence,
-            'weight': 0.15,
-            'description': "Based on Ghana-specific employment analysis"
+        return {
+            'base_r2': base_r2,
+            'rmse': rmse,
+            'mae': mae,
+            'training_r2': training_r2,
+            'model_accuracy_percent': round(base_r2 * 100, 2)
         }
-        
-        # Calculate weighted confidence
-        weighted_confidence = sum(
-            factor['score'] * factor['weight'] 
-            for factor in confidence_factors.values()
+    
+    def _build_confidence(self, score: int, metrics: Dict[str, float], score_confidence: float,
+                          stability_confidence: float, feature_confidence: float,
+                          ghana_employment_confidence: float) -> Dict[str, Any]:
+        """Combine the individual confidence factor scores into the confidence result."""
+        # Model performance 35%, score range 25%, stability 20%, features 15%, Ghana employment 15%
+        factors = confidence_factors(
+            score, metrics, score_confidence, stability_confidence,
+            feature_confidence, ghana_employment_confidence
         )
         
-        # Apply final adjustments and cap at 99.9%
-        final_confidence = round(min(weighted_confidence, 99.9), 2)
-        
-        # Determine confidence level
-        confidence_level = self._get_confidence_level(final_confidence)
+        # Weighted confidence, capped at 99.9%
+        final_confidence = weighted_confidence(factors)
         
         return {
             'confidence_score': final_confidence,
-            'confidence_level': confidence_level,
-            'confidence_factors': confidence_factors,
-            'confidence_explanation': self._generate_confidence_explanation(final_confidence, confidence_factors),
-            'model_accuracy': model_accuracy_percent,
+            'confidence_level': confidence_level(final_confidence),
+            'confidence_factors': factors,
+            'confidence_explanation': confidence_explanation(final_confidence, factors),
+            'model_accuracy': metrics['model_accuracy_percent'],
             'model_metrics': {
-                'r2_score': base_r2,
-                'rmse': rmse,
-                'mae': mae,
-                'training_r2': training_r2
+                'r2_score': metrics['base_r2'],
+                'rmse': metrics['rmse'],
+                'mae': metrics['mae'],
+                'training_r2': metrics['training_r2']
             }
         }
     
@@ -522,30 +714,15 @@ class CreditScorer:
         except Exception:
             return 75.0  # Default if analysis fails
     
-    def _extract_ghana_employment_analysis(self, application_data: Dict[str, Any], processed_data: pd.DataFrame) -> Dict[str, Any]:
-        """Extract Ghana employment analysis results from processed data and application data."""
+    def _extract_ghana_employment_analysis(self, application_data: Dict[str, Any], processed_data: pd.DataFrame,
+                                           context: Optional[FeatureContext] = None) -> Dict[str, Any]:
+        """Extract Ghana employment analysis results from the application's feature context."""
         try:
-            # Import Ghana employment processor
-            try:
-                from ..ghana_employment_processor import categorize_ghana_job_title, calculate_ghana_employment_score
-            except ImportError:
-                import sys
-                import os
-                parent_dir = os.path.dirname(os.path.dirname(__file__))
-                if parent_dir not in sys.path:
-                    sys.path.append(parent_dir)
-                from ghana_employment_processor import categorize_ghana_job_title, calculate_ghana_employment_score
-            
-            # Get job title from application data
-            emp_title = application_data.get('emp_title', 'Other')
-            emp_length = application_data.get('emp_length', '5 years')
-            annual_income = application_data.get('annual_inc', 50000)
-            
-            # Categorize job title
-            job_category = categorize_ghana_job_title(emp_title)
-            
-            # Calculate employment score
-            employment_analysis = calculate_ghana_employment_score(emp_length, job_category, annual_income)
+            if context is None:
+                context = FeatureContext(application_data)
+            
+            # Job category and employment score, shared with preprocessing when a title was given
+            emp_title, job_category, employment_analysis = context.employment_analysis()
             
             logger.info(f"🇬🇭 Ghana Analysis: Job='{emp_title}' → Category='{job_category}' → Stability={employment_analysis.get('job_stability_score', 0)}")
             
@@ -567,33 +744,11 @@ class CreditScorer:
 
     def _get_confidence_level(self, confidence_score: float) -> str:
         """Convert confidence score to descriptive level."""
-        if confidence_score >= 90:
-            return "Very High"
-        elif confidence_score >= 80:
-            return "High"
-        elif confidence_score >= 70:
-            return "Medium"
-        elif confidence_score >= 60:
-            return "Low"
-        else:
-            return "Very Low"
+        return confidence_level(confidence_score)
     
     def _generate_confidence_explanation(self, confidence_score: float, factors: Dict) -> str:
         """Generate human-readable confidence explanation."""
-        level = self._get_confidence_level(confidence_score)
-        
-        # Find the highest contributing factor
-        max_contribution = max(factors.values(), key=lambda x: x['score'] * x['weight'])
-        
-        explanations = {
-            "Very High": f"Very high confidence ({confidence_score}%) due to excellent model performance and stable prediction.",
-            "High": f"High confidence ({confidence_score}%) with good model reliability. Primary factor: {max_contribution['description']}",
-            "Medium": f"Medium confidence ({confidence_score}%). Consider reviewing input data quality for better reliability.",
-            "Low": f"Low confidence ({confidence_score}%). Prediction may be less reliable due to data limitations or extreme values.",
-            "Very Low": f"Very low confidence ({confidence_score}%). Use this prediction with caution."
-        }
-        
-        return explanations.get(level, f"Confidence: {confidence_score}%")
+        return confidence_explanation(confidence_score, factors)
     
     def _error_response(self, error_message: str, validation_errors: List[str] = None) -> Dict[str, Any]:
         """Generate standardized error response."""
@@ -616,10 +771,102 @@ class CreditScorer:
         return response
     
     def batch_predict(self, applications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Predict credit scores for multiple applications."""
-        results = []
+        """
+        Predict credit scores for multiple applications.
+        
+        Valid applications are preprocessed into one feature matrix and scored
+        with a single model call; scaling, categories and confidence factors are
+        computed over the whole batch. Applications that fail validation or
+        cannot be converted cleanly go through predict_credit_score on their
+        own, so each row still gets its own success or error result.
+        
+        Returns one predict_credit_score-style dict per application; use
+        batch_predict_compact to skip building them for large batches.
+        """
+        return self.batch_predict_compact(applications).to_dicts()
+    
+    def batch_predict_compact(self, applications: List[Dict[str, Any]]) -> BatchScoringResult:
+        """
+        Predict credit scores for multiple applications as a compact result.
+        
+        Same scoring as batch_predict, but per-row values are kept in column
+        arrays and model-level metadata once per batch, so large batches are
+        not expanded into one nested dict per row unless asked for.
+        """
+        if not self.is_loaded or not applications:
+            return BatchScoringResult.from_rows(self._batch_predict_per_row(applications))
+        
+        timer = scoring_metrics.start_request('batch', self._model_version)
+        rows = {}
+        valid_indices = []
+        with timer.stage('validation'):
+            for i, application in enumerate(applications):
+                try:
+                    is_valid, _ = validate_single_application(application)
+                except Exception:
+                    is_valid = False
+                if is_valid:
+                    valid_indices.append(i)
+        
+        try:
+            with timer.stage('preprocessing'):
+                valid_applications = [applications[i] for i in valid_indices]
+                features = self._preprocess_batch(valid_applications, include_ghana_features=True)
+            
+            # Rows with unconvertible values take the single-row path for its exact error handling
+            clean_rows = ~np.isnan(features).any(axis=1)
+            batch_indices = [i for i, clean in zip(valid_indices, clean_rows) if clean]
+            features = features[clean_rows]
+            
+            # Serve cached rows, score the rest
+            cache = self._get_prediction_cache()
+            cache_keys = {}
+            if cache is not None and batch_indices:
+                cache_start = time.perf_counter()
+                timestamp = datetime.now().isoformat()
+                miss_rows = []
+                for row, i in enumerate(batch_indices):
+                    cache_keys[i] = self._prediction_cache_key(features[row], applications[i])
+                    cached_result = cache.get(cache_keys[i])
+                    if cached_result is not None:
+                        cached_result['prediction_timestamp'] = timestamp
+                        cached_result['batch_index'] = i
+                        rows[i] = cached_result
+                    else:
+                        miss_rows.append(row)
+                batch_indices = [batch_indices[row] for row in miss_rows]
+                features = features[miss_rows]
+                timer.add_stage('cache', time.perf_counter() - cache_start)
+            
+            result = self._score_feature_matrix(
+                features, [applications[i] for i in batch_indices], timer,
+                indices=batch_indices, size=len(applications)
+            )
+            result.rows = rows
+            for i in batch_indices:
+                if i in cache_keys:
+                    entry = result.to_dict(i)
+                    del entry['batch_index']
+                    cache.set(cache_keys[i], entry)
+        except Exception as e:
+            logger.warning(f"Batched prediction failed, falling back to per-row scoring: {e}")
+            timer.finish('error', rows=len(applications))
+            return BatchScoringResult.from_rows(self._batch_predict_per_row(applications))
+        
+        # Rows finished here are recorded as single requests by predict_credit_score
+        timer.finish('success', rows=len(batch_indices) + len(rows))
         
         for i, application in enumerate(applications):
+            if not result.is_scored(i) and i not in rows:
+                rows[i] = self._batch_predict_per_row([application], start_index=i)[0]
+        
+        return result
+    
+    def _batch_predict_per_row(self, applications: List[Dict[str, Any]], start_index: int = 0) -> List[Dict[str, Any]]:
+        """Predict applications one at a time, isolating errors per row."""
+        results = []
+        
+        for i, application in enumerate(applications, start=start_index):
             try:
                 result = self.predict_credit_score(application)
                 result['batch_index'] = i
@@ -631,9 +878,178 @@ class CreditScorer:
         
         return results
     
+    def _score_feature_matrix(self, features: np.ndarray, applications: List[Dict[str, Any]],
+                              timer: Any = NULL_TIMER, indices: Optional[List[int]] = None,
+                              size: Optional[int] = None) -> BatchScoringResult:
+        """
+        Score a preprocessed feature matrix with one model call.
+        
+        Args:
+            features: Matrix from preprocess_batch_final with Ghana columns included
+            applications: Raw application data for each matrix row
+            timer: Request timer receiving the stage timings
+            indices: Batch index of each matrix row (defaults to 0..n-1)
+            size: Total batch size the indices refer to (defaults to the row count)
+            
+        Returns:
+            BatchScoringResult holding the scored rows as columns
+        """
+        indices = list(range(len(applications))) if indices is None else indices
+        size = len(applications) if size is None else size
+        
+        with timer.stage('model_predict'):
+            raw_predictions = self._predict_raw(features[:, :16]) if len(features) else np.empty(0, dtype='float32')
+            
+            # Same linear scaling as _scale_raw_prediction_to_credit_score, over the whole batch
+            scaled_scores = 300 + (raw_predictions - self.raw_score_min) * self.scale_factor
+            credit_scores = np.rint(np.clip(scaled_scores, 300, 850)).astype(int)
+            
+            categories = np.full(len(credit_scores), "Invalid Score", dtype=object)
+            risk_levels = np.full(len(credit_scores), "Unknown Risk", dtype=object)
+            for (min_score, max_score), (category, risk_level) in reversed(list(self.score_categories.items())):
+                in_range = (credit_scores >= min_score) & (credit_scores <= max_score)
+                categories[in_range] = category
+                risk_levels[in_range] = risk_level
+        
+        with timer.stage('ghana_analysis'):
+            ghana_cache = {}
+            ghana_analyses = [self._cached_ghana_analysis(application, ghana_cache) for application in applications]
+        
+        with timer.stage('confidence'):
+            metrics = self._get_confidence_metrics()
+            raw_float = raw_predictions.astype('float64')
+            score_confidence = self._score_range_confidence_array(credit_scores).astype('float64')
+            stability_confidence = self._prediction_stability_array(
+                credit_scores, raw_float, metrics['rmse'], metrics['mae']
+            ).astype('float64')
+            feature_confidence = self._feature_completeness_array(features).astype('float64')
+            ghana_confidence = self._ghana_employment_confidence_array(features).astype('float64')
+            confidence = weighted_confidence_array(
+                metrics, score_confidence, stability_confidence, feature_confidence, ghana_confidence
+            )
+        
+        # Scatter the scored rows into batch-sized columns
+        columns = {'scored': np.zeros(size, dtype=bool)}
+        columns['scored'][indices] = True
+        for name, values, dtype in (
+            ('credit_score', credit_scores, 'int64'),
+            ('raw_prediction', raw_float, 'float64'),
+            ('confidence', np.asarray(confidence, dtype='float64'), 'float64'),
+            ('score_confidence', score_confidence, 'float64'),
+            ('stability_confidence', stability_confidence, 'float64'),
+            ('feature_confidence', feature_confidence, 'float64'),
+            ('ghana_confidence', ghana_confidence, 'float64'),
+            ('category', categories, object),
+            ('risk_level', risk_levels, object),
+            ('confidence_level', np.array([confidence_level(value) for value in confidence], dtype=object), object),
+            ('job_category', np.array([a.get('job_category', 'N/A') for a in ghana_analyses], dtype=object), object),
+            ('ghana_job_stability_score', np.array([a.get('job_stability_score', 0) for a in ghana_analyses], dtype=object), object),
+            ('ghana_employment_score', np.array([a.get('employment_score', 0) for a in ghana_analyses], dtype=object), object),
+        ):
+            column = np.zeros(size, dtype=dtype) if dtype != object else np.full(size, None, dtype=object)
+            column[indices] = values
+            columns[name] = column
+        
+        metadata = {
+            'model_version': self.model_metadata.get('training_metadata', {}).get('model_version', '1.0'),
+            'prediction_timestamp': datetime.now().isoformat(),
+            'model_accuracy': metrics['model_accuracy_percent'],
+            'model_metrics': {
+                'r2_score': metrics['base_r2'],
+                'rmse': metrics['rmse'],
+                'mae': metrics['mae'],
+                'training_r2': metrics['training_r2']
+            },
+            'scaling_info': {
+                'raw_score_range': f"{self.raw_score_min:.2f} - {self.raw_score_max:.2f}",
+                'scaled_score_range': "300 - 850",
+                'scale_factor': self.scale_factor
+            }
+        }
+        return BatchScoringResult(size, metadata, columns, confidence_metrics=metrics)
+    
+    def _ghana_analysis_inputs(self, application_data: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Raw inputs used by _extract_ghana_employment_analysis, normalized for hashing."""
+        return (
+            str(application_data.get('emp_title', 'Other')),
+            str(application_data.get('emp_length', '5 years')),
+            repr(application_data.get('annual_inc', 50000))
+        )
+    
+    def _cached_ghana_analysis(self, application_data: Dict[str, Any], cache: Dict) -> Dict[str, Any]:
+        """Ghana employment analysis, reused across rows with the same employment inputs."""
+        key = self._ghana_analysis_inputs(application_data)
+        if key not in cache:
+            cache[key] = self._extract_ghana_employment_analysis(application_data, None)
+        return dict(cache[key])
+    
+    def _score_range_confidence_array(self, scores: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_score_range_confidence."""
+        return np.select(
+            [
+                (scores >= 580) & (scores <= 750),
+                ((scores >= 520) & (scores <= 580)) | ((scores >= 750) & (scores <= 800)),
+                ((scores >= 450) & (scores <= 520)) | ((scores >= 800) & (scores <= 820)),
+                (scores < 450) | (scores > 820)
+            ],
+            [95.0, 90.0, 85.0, 75.0],
+            default=80.0
+        )
+    
+    def _prediction_stability_array(self, scores: np.ndarray, raw_predictions: np.ndarray,
+                                    rmse: float, mae: float) -> np.ndarray:
+        """Vectorized _calculate_prediction_stability."""
+        prediction_diff = np.abs(scores - raw_predictions)
+        return np.select(
+            [prediction_diff <= mae, prediction_diff <= rmse * 2],
+            [95.0, 85.0],
+            default=70.0
+        )
+    
+    def _feature_completeness_array(self, features: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_feature_completeness over a preprocessed matrix."""
+        critical_columns = features[:, [0, 1, 2, 3]]  # annual_inc, dti, int_rate, revol_util
+        missing_critical = (np.isnan(critical_columns) | (critical_columns == 0)).sum(axis=1)
+        return np.select(
+            [missing_critical == 0, missing_critical <= 1, missing_critical <= 2],
+            [95.0, 85.0, 75.0],
+            default=65.0
+        )
+    
+    def _ghana_employment_confidence_array(self, features: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_ghana_employment_confidence (Ghana columns always present)."""
+        employment_score = features[:, 16]
+        stability_score = features[:, 17]
+        return np.select(
+            [
+                (employment_score >= 80) & (stability_score >= 70),
+                (employment_score >= 60) & (stability_score >= 50),
+                employment_score >= 40
+            ],
+            [95.0, 85.0, 75.0],
+            default=65.0
+        )
+    
+    def _precompute_metadata(self) -> None:
+        """Build the metadata views served by the getters once per loaded model."""
+        self._feature_importance = self._build_feature_importance()
+        self._global_importance = {item['feature']: item['importance'] for item in self._feature_importance}
+        self._model_performance = self._build_model_performance()
+        self._confidence_metrics = self._build_confidence_metrics()
+        self._model_version = str(self.model_metadata.get('training_metadata', {}).get('model_version', '1.0'))
+        with self._health_lock:
+            self._last_health = None
+            self._last_health_at = None
+    
     def get_feature_importance(self) -> List[Dict[str, Union[str, float]]]:
         """Get feature importance for model interpretability."""
-        if not self.is_loaded or 'feature_importance' not in self.model_metadata:
+        if not self.is_loaded:
+            return []
+        return [dict(item) for item in self._feature_importance]
+    
+    def _build_feature_importance(self) -> List[Dict[str, Union[str, float]]]:
+        """Normalize the feature importance stored in the model metadata."""
+        if 'feature_importance' not in self.model_metadata:
             return []
         
         # Handle different formats of feature importance data
@@ -662,6 +1078,10 @@ class CreditScorer:
     
     def get_model_performance(self) -> Dict[str, Any]:
         """Get model performance metrics."""
+        return copy.deepcopy(self._model_performance)
+    
+    def _build_model_performance(self) -> Dict[str, Any]:
+        """Collect the performance metrics stored in the model metadata."""
         if not self.model_metadata:
             return {}
         
@@ -700,8 +1120,36 @@ class CreditScorer:
         
         return performance
     
-    def health_check(self) -> Dict[str, Any]:
-        """Perform comprehensive health check."""
+    def health_check(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Latest health check result.
+        
+        Probes run in the background every ML_HEALTH_CHECK_INTERVAL seconds,
+        so polling does not run a sample prediction per request. A probe
+        runs inline when there is no result yet, when the result is older
+        than max_age seconds, or when background probing is disabled.
+        """
+        if not self.is_loaded or not health_monitor.enabled:
+            return self.run_health_probe()
+        
+        health_monitor.watch(self)
+        with self._health_lock:
+            result, checked_at = self._last_health, self._last_health_at
+        if result is None or (max_age is not None and time.monotonic() - checked_at > max_age):
+            result = self.run_health_probe()
+        return copy.deepcopy(result)
+    
+    def run_health_probe(self) -> Dict[str, Any]:
+        """Perform comprehensive health check and store the result."""
+        result = self._health_probe()
+        if self.is_loaded:
+            with self._health_lock:
+                self._last_health = result
+                self._last_health_at = time.monotonic()
+        return result
+    
+    def _health_probe(self) -> Dict[str, Any]:
+        """Check the loaded components and run a sample prediction."""
         try:
             if not self.is_loaded:
                 return {
@@ -714,9 +1162,9 @@ class CreditScorer:
                     }
                 }
             
-            # Test prediction with sample data
+            # Test prediction with sample data; a cached result or a counted request would hide a broken model
             sample_data = self._get_sample_data()
-            result = self.predict_credit_score(sample_data)
+            result = self.predict_credit_score(sample_data, use_cache=False, record_metrics=False)
             
             return {
                 'status': 'healthy' if result['success'] else 'unhealthy',
@@ -743,60 +1191,220 @@ class CreditScorer:
                 'last_check': datetime.now().isoformat()
             }
     
+    def _get_explanation_engine(self) -> ExplanationEngine:
+        """Explanation engine for this scorer, sharing the prediction cache."""
+        return ExplanationEngine(self, cache=self._get_prediction_cache())
+    
     def explain_prediction(self, application_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Provide explanation for a credit score prediction."""
+        """
+        Provide explanation for a credit score prediction.
+        
+        Top factors are this application's own feature contributions (TreeSHAP
+        values from the booster), ranked by magnitude; score_impact is the
+        contribution in credit score points.
+        """
         try:
-            # Get prediction
-            prediction = self.predict_credit_score(application_data)
+            # Get prediction; the context keeps the processed features for the explanation
+            context = FeatureContext(application_data)
+            prediction = self.predict_credit_score(application_data, context=context)
             if not prediction['success']:
                 return prediction
             
-            # Get feature importance
-            feature_importance = self.get_feature_importance()
-            
-            # Analyze key factors
-            processed_data = self._preprocess_single_application(application_data)
-            feature_values = processed_data.iloc[0].to_dict()
-            
-            # Identify top contributing factors
-            top_factors = []
-            for feature_info in feature_importance[:10]:  # Top 10 features
-                feature_name = feature_info['feature']
-                if feature_name in feature_values:
-                    top_factors.append({
-                        'feature': feature_name,
-                        'value': feature_values[feature_name],
-                        'importance': feature_info['importance'],
-                        'contribution': 'positive' if feature_values[feature_name] > 0 else 'negative'
-                    })
+            processed_data = context.processed_data
+            if processed_data is None:
+                processed_data = self._preprocess_single_application(application_data, context)
+            
+            contributions = self._get_explanation_engine().explain_features(
+                processed_data.iloc[:, :16].to_numpy(dtype='float64')
+            )[0]
             
             explanation = prediction.copy()
             explanation.update({
-                'explanation': {
-                    'top_factors': top_factors,
-                    'total_features_used': len(feature_values),
-                    'model_confidence': prediction['confidence']
-                }
+                'explanation': self._format_explanation(contributions, len(processed_data.columns), prediction['confidence'])
             })
             
             return explanation
             
         except Exception as e:
             return self._error_response(f"Explanation failed: {str(e)}")
+    
+    def explain_batch(self, applications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Per-feature contributions for many applications with one booster call.
+        
+        Returns one result per application, in order: {'success': True,
+        'explanation': ...} for valid applications and an error response for
+        the others. Scores are not recomputed; use batch_predict for those.
+        """
+        if not self.is_loaded:
+            return [self._error_response("Model not loaded. Call load_model() first.") for _ in applications]
+        
+        results = [None] * len(applications)
+        valid_indices = []
+        for i, application in enumerate(applications):
+            try:
+                is_valid, validation_errors = validate_single_application(application)
+            except Exception as e:
+                is_valid, validation_errors = False, [str(e)]
+            if is_valid:
+                valid_indices.append(i)
+            else:
+                results[i] = self._error_response("Input validation failed", validation_errors=validation_errors)
+        
+        if valid_indices:
+            try:
+                features = self._preprocess_batch([applications[i] for i in valid_indices])
+                clean_rows = ~np.isnan(features).any(axis=1)
+                clean_indices = [i for i, clean in zip(valid_indices, clean_rows) if clean]
+                explanations = self._get_explanation_engine().explain_features(features[clean_rows])
+                for i, contributions in zip(clean_indices, explanations):
+                    results[i] = {
+                        'success': True,
+                        'explanation': self._format_explanation(contributions, features.shape[1])
+                    }
+            except Exception as e:
+                logger.error(f"Batch explanation failed: {e}")
+                for i in valid_indices:
+                    results[i] = self._error_response(f"Explanation failed: {str(e)}")
+        
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = self._error_response("Explanation failed: input could not be converted to model features")
+            results[i]['batch_index'] = i
+        
+        return results
+    
+    def counterfactuals_batch(self, applications: List[Dict[str, Any]], max_scenarios: int = 3) -> List[Dict[str, Any]]:
+        """
+        Smallest feature changes that move each application into the next score category.
+        
+        The candidate grids of all applications are scored with one model
+        call. Returns one result per application, in order: {'success': True,
+        'credit_score': ..., 'counterfactuals': [...]} for valid applications
+        and an error response for the others.
+        """
+        if not self.is_loaded:
+            return [self._error_response("Model not loaded. Call load_model() first.") for _ in applications]
+        
+        results = [None] * len(applications)
+        valid_indices = []
+        for i, application in enumerate(applications):
+            try:
+                is_valid, validation_errors = validate_single_application(application)
+            except Exception as e:
+                is_valid, validation_errors = False, [str(e)]
+            if is_valid:
+                valid_indices.append(i)
+            else:
+                results[i] = self._error_response("Input validation failed", validation_errors=validation_errors)
+        
+        if valid_indices:
+            try:
+                features = self._preprocess_batch([applications[i] for i in valid_indices])[:, :16]
+                clean_rows = ~np.isnan(features).any(axis=1)
+                clean_indices = [i for i, clean in zip(valid_indices, clean_rows) if clean]
+                engine = CounterfactualEngine(self, max_scenarios=max_scenarios)
+                scores = engine.to_scores(self._predict_raw(features[clean_rows]))
+                scenarios = engine.generate(features[clean_rows], scores)
+                for i, score, counterfactuals in zip(clean_indices, scores, scenarios):
+                    results[i] = {
+                        'success': True,
+                        'credit_score': int(score),
+                        'counterfactuals': counterfactuals
+                    }
+            except Exception as e:
+                logger.error(f"Counterfactual search failed: {e}")
+                for i in valid_indices:
+                    results[i] = self._error_response(f"Counterfactual search failed: {str(e)}")
+        
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = self._error_response("Counterfactual search failed: input could not be converted to model features")
+            results[i]['batch_index'] = i
+        
+        return results
+    
+    def _format_explanation(self, contributions: Dict[str, Any], total_features_used: int,
+                            model_confidence: float = None) -> Dict[str, Any]:
+        """Explanation payload from an ExplanationEngine result."""
+        global_importance = self._global_importance
+        top_factors = [
+            dict(factor, importance=global_importance[factor['feature']])
+            if factor['feature'] in global_importance else dict(factor)
+            for factor in contributions['feature_contributions'][:10]  # Top 10 features
+        ]
+        
+        explanation = {
+            'top_factors': top_factors,
+            'feature_contributions': contributions['feature_contributions'],
+            'base_value': contributions['base_value'],
+            'base_score': contributions['base_score'],
+            'total_features_used': total_features_used
+        }
+        if model_confidence is not None:
+            explanation['model_confidence'] = model_confidence
+        return explanation
+
+
+def _load_credit_scorer(model_dir: Optional[str] = None) -> CreditScorer:
+    """Create and load a credit scorer for the model registry."""
+    scorer = CreditScorer(model_dir)
+    if not scorer.load_model():
+        raise RuntimeError("Failed to load credit scoring model")
+    return scorer
+
+
+def model_version_token(model_dir: Optional[str] = None) -> tuple:
+    """
+    Cheap version token for the artifacts in a model directory.
+    
+    Uses the checksums recorded in the manifest when there is one, otherwise
+    the size and modification time of the legacy model pickles. The manifest
+    token also covers the legacy file it was exported from, so redeploying
+    that pickle is detected too.
+    """
+    if model_dir is None:
+        model_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'models')
+    
+    manifest = read_manifest(model_dir)
+    if manifest is not None:
+        token = ['manifest'] + sorted(manifest_checksums(manifest).items())
+        filenames = [manifest['source']['file']] if manifest.get('source') else []
+    else:
+        token = ['legacy']
+        filenames = ['xgboost_credit_model_fixed.pkl', 'xgboost_credit_model.pkl',
+                     'xgboost_credit_score_model.pkl', 'credit_model.pkl']
+    
+    for filename in filenames:
+        path = os.path.join(model_dir, filename)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            token.append((filename, stat.st_size, stat.st_mtime_ns))
+    return tuple(token)
+
+
+def _registry_name(model_dir: Optional[str] = None) -> str:
+    """Registry name for the scorer of a model directory."""
+    return 'credit_scorer' if model_dir is None else f'credit_scorer:{os.path.abspath(model_dir)}'
 
 
-# Global scorer instance for efficient reuse
-_scorer_instance = None
+# Default scorer is registered at import so warmup hooks can preload it
+registry.register(_registry_name(), _load_credit_scorer, version=model_version_token)
+
+# Shared across scorers; keys include the model checksums, so hot-swapped models never hit stale entries
+registry.register('prediction_cache', PredictionCache.from_env)
 
 
 def get_credit_scorer(model_dir: Optional[str] = None) -> CreditScorer:
-    """Get singleton credit scorer instance."""
-    global _scorer_instance
-    if _scorer_instance is None:
-        _scorer_instance = CreditScorer(model_dir)
-        if not _scorer_instance.load_model():
-            raise RuntimeError("Failed to load credit scoring model")
-    return _scorer_instance
+    """Get shared credit scorer instance from the model registry."""
+    name = _registry_name(model_dir)
+    if not registry.is_registered(name):
+        registry.register(
+            name,
+            lambda: _load_credit_scorer(model_dir),
+            version=lambda: model_version_token(model_dir)
+        )
+    return registry.get(name)
 
 
 def predict_credit_score(application_data: Dict[str, Any], model_dir: Optional[str] = None) -> Dict[str, Any]:
@@ -814,7 +1422,23 @@ def predict_credit_score(application_data: Dict[str, Any], model_dir: Optional[s
     return scorer.predict_credit_score(application_data)
 
 
-def batch_predict_credit_scores(applications: List[Dict[str, Any]], model_dir: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Batch prediction for multiple applications."""
+def batch_predict_credit_scores(applications: List[Dict[str, Any]], model_dir: Optional[str] = None,
+                                workers: int = 1, chunk_size: int = 500) -> List[Dict[str, Any]]:
+    """
+    Batch prediction for multiple applications.
+    
+    Args:
+        applications: Application data dictionaries
+        model_dir: Optional model directory path
+        workers: Worker processes for large offline batches (1 scores in-process)
+        chunk_size: Applications per worker task when workers > 1
+    """
+    if workers != 1:
+        try:
+            from .parallel_scoring import parallel_batch_predict
+        except ImportError:
+            from parallel_scoring import parallel_batch_predict
+        return parallel_batch_predict(applications, workers=workers, chunk_size=chunk_size, model_dir=model_dir)
+    
     scorer = get_credit_scorer(model_dir)
     return scorer.batch_predict(applications)
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+Explanation Engine for RiskGuard System
+Per-prediction feature contributions from the booster's native SHAP output
+"""
+
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+
+try:
+    from .prediction_cache import make_cache_key
+except ImportError:
+    from prediction_cache import make_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+class ExplanationEngine:
+    """
+    Batched per-row feature contributions for a loaded CreditScorer.
+
+    Contributions come from XGBoost's pred_contribs output (exact TreeSHAP
+    values): for each row the bias plus the per-feature contributions add
+    up to the raw model prediction. Contributions are converted to credit
+    score points with the scorer's linear scale factor, so score_impact
+    shows how far each feature moved the score from the model's baseline.
+    Results are cached per model version and feature vector in the shared
+    prediction cache.
+    """
+
+    def __init__(self, scorer: Any, cache: Any = None):
+        self.scorer = scorer
+        self.cache = cache
+
+    def _cache_key(self, feature_row: np.ndarray) -> str:
+        """Cache key: explanation namespace + loaded artifact checksums + model features."""
+        return make_cache_key(
+            ('contributions', tuple(sorted(self.scorer.artifact_checksums.items()))),
+            feature_row
+        )
+
+    def contributions(self, features: np.ndarray) -> np.ndarray:
+        """
+        Raw SHAP contributions for a model feature matrix in one booster call.
+
+        Returns:
+            Array of shape (n_rows, n_features + 1); the last column is the bias
+        """
+        import xgboost as xgb
+
+        booster = self.scorer.model.get_booster()
+        matrix = xgb.DMatrix(np.asarray(features, dtype='float32'), feature_names=booster.feature_names)
+        return booster.predict(matrix, pred_contribs=True)
+
+    def explain_features(self, features: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Explain each row of a model feature matrix (EXPECTED_FEATURES order).
+
+        Cached rows are served from the cache; the rest are computed with a
+        single pred_contribs call.
+        """
+        features = np.asarray(features, dtype='float64')
+        contributions = np.empty((len(features), features.shape[1] + 1), dtype='float64')
+        keys = {}
+        misses = []
+
+        # Cache entries hold the bare contribution vector; explanations are rebuilt on the way out
+        for row in range(len(features)):
+            if self.cache is not None:
+                keys[row] = self._cache_key(features[row])
+                cached = self.cache.get(keys[row])
+                if cached is not None:
+                    contributions[row] = cached['contributions']
+                    continue
+            misses.append(row)
+
+        if misses:
+            contributions[misses] = self.contributions(features[misses])
+            if self.cache is not None:
+                for row in misses:
+                    self.cache.set(keys[row], {'contributions': contributions[row].tolist()})
+
+        feature_names = self.scorer.model.get_booster().feature_names
+        return [
+            self._build_explanation(feature_names, features[row], contributions[row])
+            for row in range(len(features))
+        ]
+
+    def _build_explanation(self, feature_names: List[str], feature_row: np.ndarray,
+                           row_contributions: np.ndarray) -> Dict[str, Any]:
+        """Turn one row of contributions into a ranked explanation."""
+        scale_factor = self.scorer.scale_factor
+        base_value = float(row_contributions[-1])
+
+        factors = []
+        for feature, value, contribution in zip(feature_names, feature_row, row_contributions[:-1]):
+            contribution = float(contribution)
+            factors.append({
+                'feature': feature,
+                'value': float(value),
+                'contribution': round(contribution, 6),
+                'score_impact': round(contribution * scale_factor, 2),
+                'direction': 'positive' if contribution > 0 else 'negative' if contribution < 0 else 'neutral'
+            })
+        factors.sort(key=lambda factor: abs(factor['contribution']), reverse=True)
+
+        return {
+            'base_value': round(base_value, 6),
+            'base_score': round(300 + (base_value - self.scorer.raw_score_min) * scale_factor, 2),
+            'raw_prediction': round(base_value + float(np.sum(row_contributions[:-1])), 6),
+            'feature_contributions': factors
+        }
@@ -0,0 +1,101 @@
+"""
+Health Monitor for RiskGuard System
+Runs model health probes on a background interval so health polling reads a cached result
+"""
+
+import os
+import threading
+import logging
+import weakref
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+    """
+    Background health prober for loaded credit scorers.
+
+    Scorers register themselves on their first health_check(). A daemon
+    thread then calls run_health_probe() on every registered scorer each
+    interval seconds, and health_check() returns the last probe result
+    instead of running a sample prediction per request. Scorers are held
+    weakly, so hot-swapped models drop out once nothing uses them. Like
+    the registry watcher, the thread starts lazily in each process so a
+    pre-fork master does not start a thread its workers would lose.
+    """
+
+    def __init__(self, interval: float = 30.0):
+        """
+        Args:
+            interval: Seconds between probes; 0 or less disables background
+                probing and health_check() probes inline on every call
+        """
+        self.interval = interval
+        self._scorers = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._stop_event = threading.Event()
+
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork_in_child)
+
+    @classmethod
+    def from_env(cls) -> 'HealthMonitor':
+        """Monitor configured from ML_HEALTH_CHECK_INTERVAL (seconds, default 30)."""
+        return cls(float(os.getenv('ML_HEALTH_CHECK_INTERVAL', '30')))
+
+    @property
+    def enabled(self) -> bool:
+        """Whether probes run in the background."""
+        return self.interval > 0
+
+    def _after_fork_in_child(self) -> None:
+        """Reset process-local state in a freshly forked worker."""
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._stop_event = threading.Event()
+
+    def watch(self, scorer: Any) -> None:
+        """Probe a scorer in the background from now on."""
+        if not self.enabled:
+            return
+        self._scorers.add(scorer)
+        self._ensure_running()
+
+    def _ensure_running(self) -> None:
+        """Start the probe thread for this process if not running."""
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='model-health-monitor', daemon=True)
+            self._pid = pid
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Probe loop: refresh the cached health of every watched scorer."""
+        while not self._stop_event.wait(self.interval):
+            for scorer in list(self._scorers):
+                try:
+                    scorer.run_health_probe()
+                except Exception as e:
+                    logger.error(f"Background health probe failed: {e}")
+
+    def stop(self) -> None:
+        """Stop the probe thread (used on shutdown and in tests)."""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self._thread = None
+        self._pid = None
+
+
+# Shared by every scorer in the process
+health_monitor = HealthMonitor.from_env()
@@ -0,0 +1,170 @@
+"""
+Micro-Batching for RiskGuard Inference Server
+Collects concurrent single predictions and scores them in one model call
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queued by stop(); everything queued before it is still scored
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batcher for an asyncio server.
+
+    Requests submitted concurrently are queued. The collector takes the first
+    waiting request, then keeps collecting until either max_batch_size rows
+    are queued or max_wait_ms has passed since the first one, and hands the
+    batch to score_batch in an executor so the event loop never blocks on the
+    model. The wait bound caps the extra latency a request can pick up from
+    batching.
+    """
+
+    def __init__(self, score_batch: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+                 executor: Executor, max_batch_size: int = 32, max_wait_ms: float = 5.0,
+                 max_concurrent_batches: int = 2):
+        """
+        Args:
+            score_batch: Scores a list of items and returns one result per item, in order
+            executor: Thread or process pool the scoring runs in
+            max_batch_size: Most items scored in one call
+            max_wait_ms: Longest time the first item of a batch waits for company
+            max_concurrent_batches: Batches allowed to score at the same time
+        """
+        self.score_batch = score_batch
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._max_concurrent_batches = max_concurrent_batches
+        self._pending: set = set()
+        self._accepting = False
+        self._stats = {'batches': 0, 'items': 0, 'max_batch_seen': 0, 'total_score_seconds': 0.0}
+
+    async def start(self) -> None:
+        """Start the collector task on the running event loop."""
+        if self._collector is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self._max_concurrent_batches)
+        self._accepting = True
+        self._collector = asyncio.create_task(self._collect())
+
+    async def stop(self) -> None:
+        """
+        Stop accepting items, score everything already queued and wait for it.
+
+        Items still queued when the collector cannot finish (e.g. it was
+        cancelled) fail with RuntimeError rather than leaving callers waiting.
+        """
+        if self._collector is None:
+            return
+        self._accepting = False
+        self._queue.put_nowait(_STOP)
+        try:
+            await self._collector
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Micro-batch collector failed: {e}")
+        self._collector = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+        while not self._queue.empty():
+            entry = self._queue.get_nowait()
+            if entry is not _STOP and not entry[1].done():
+                entry[1].set_exception(RuntimeError("MicroBatcher stopped"))
+
+    async def submit(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue one item and wait for its result."""
+        if not self._accepting:
+            raise RuntimeError("MicroBatcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _collect(self) -> None:
+        """Group queued items into batches bounded by size and wait time, until stop() is queued."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        batch = []
+        try:
+            while not stopping:
+                entry = await self._queue.get()
+                if entry is _STOP:
+                    break
+                batch = [entry]
+                deadline = loop.time() + self.max_wait
+
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        entry = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if entry is _STOP:
+                        stopping = True
+                        break
+                    batch.append(entry)
+
+                await self._slots.acquire()
+                task = asyncio.create_task(self._score(batch))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+                batch = []
+        finally:
+            # Only set when the collector is cancelled between taking items and scoring them
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("MicroBatcher stopped"))
+
+    async def _score(self, batch: List[tuple]) -> None:
+        """Score one batch in the executor and resolve each waiting request."""
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+        try:
+            start_time = time.perf_counter()
+            results = await loop.run_in_executor(self.executor, self.score_batch, items)
+            elapsed = time.perf_counter() - start_time
+
+            self._stats['batches'] += 1
+            self._stats['items'] += len(items)
+            self._stats['max_batch_seen'] = max(self._stats['max_batch_seen'], len(items))
+            self._stats['total_score_seconds'] += elapsed
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            logger.error(f"Micro-batch scoring failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Batching counters: batches scored, items, average batch size."""
+        batches = self._stats['batches']
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+            'batches': batches,
+            'items': self._stats['items'],
+            'max_batch_seen': self._stats['max_batch_seen'],
+            'avg_batch_size': round(self._stats['items'] / batches, 2) if batches else 0.0,
+            'avg_score_ms': round(self._stats['total_score_seconds'] * 1000 / batches, 3) if batches else 0.0,
+            'queued': self._queue.qsize() if self._queue is not None else 0
+        }
@@ -0,0 +1,143 @@
+"""
+Model Artifact Manifest for RiskGuard System
+Versioned description of the files that make up one trained model
+"""
+
+import hashlib
+import json
+import os
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'model_manifest.json'
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 checksum of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(model_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the model manifest from a model directory.
+
+    Returns:
+        Manifest dictionary, or None if the directory has no manifest
+    """
+    manifest_path = os.path.join(model_dir, MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return None
+
+    with open(manifest_path, 'r') as f:
+        manifest = json.load(f)
+
+    if manifest.get('manifest_version') != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version: {manifest.get('manifest_version')}")
+    if 'booster' not in manifest.get('artifacts', {}):
+        raise ValueError("Manifest does not list a booster artifact")
+
+    return manifest
+
+
+def verify_artifacts(manifest: Dict[str, Any], model_dir: str) -> Dict[str, str]:
+    """
+    Check every artifact listed in the manifest against its recorded checksum.
+
+    Returns:
+        Mapping of artifact name to verified checksum
+
+    Raises:
+        ValueError: If an artifact is missing or its checksum does not match
+    """
+    checksums = {}
+    for name, artifact in manifest['artifacts'].items():
+        path = os.path.join(model_dir, artifact['file'])
+        if not os.path.exists(path):
+            raise ValueError(f"Artifact '{name}' not found: {artifact['file']}")
+        actual = file_sha256(path)
+        if actual != artifact['sha256']:
+            raise ValueError(f"Checksum mismatch for artifact '{name}' ({artifact['file']})")
+        checksums[name] = actual
+    return checksums
+
+
+def manifest_checksums(manifest: Dict[str, Any]) -> Dict[str, str]:
+    """Get the checksums recorded in a manifest, keyed by artifact name."""
+    return {name: artifact['sha256'] for name, artifact in manifest['artifacts'].items()}
+
+
+def source_changed(manifest: Dict[str, Any], model_dir: str) -> bool:
+    """
+    Check whether the legacy file a manifest was exported from has changed since.
+
+    A redeployed legacy pickle is not reflected in the manifest checksums, so
+    the manifest would keep serving the old booster until it is re-exported.
+    """
+    source = manifest.get('source')
+    if not source:
+        return False
+    path = os.path.join(model_dir, source['file'])
+    if not os.path.exists(path):
+        return False
+    return file_sha256(path) != source['sha256']
+
+
+def build_manifest(model_dir: str, artifacts: Dict[str, Dict[str, str]], feature_order: List[str],
+                   model_version: str, metadata: Dict[str, Any] = None,
+                   home_ownership_encoding: Dict[str, float] = None,
+                   source: Dict[str, str] = None) -> Dict[str, Any]:
+    """
+    Build a manifest for artifacts that already exist in the model directory.
+
+    Args:
+        model_dir: Directory containing the artifact files
+        artifacts: Artifact name -> {'file': filename, 'format': format}
+        feature_order: Model input features in training order
+        model_version: Version label for this model
+        metadata: Model metrics stored alongside the artifacts
+        home_ownership_encoding: Category encoding stored alongside the artifacts
+        source: Legacy file the artifacts were exported from, with its checksum
+
+    Returns:
+        Manifest dictionary
+    """
+    manifest_artifacts = {}
+    for name, artifact in artifacts.items():
+        path = os.path.join(model_dir, artifact['file'])
+        manifest_artifacts[name] = {
+            'file': artifact['file'],
+            'format': artifact['format'],
+            'sha256': file_sha256(path),
+            'size_bytes': os.path.getsize(path)
+        }
+
+    manifest = {
+        'manifest_version': MANIFEST_VERSION,
+        'model_version': model_version,
+        'created_at': datetime.now().isoformat(),
+        'feature_order': list(feature_order),
+        'artifacts': manifest_artifacts,
+        'metadata': metadata or {},
+        'home_ownership_encoding': home_ownership_encoding or {}
+    }
+    if source:
+        manifest['source'] = source
+
+    return manifest
+
+
+def write_manifest(model_dir: str, manifest: Dict[str, Any]) -> str:
+    """Write the manifest to the model directory and return its path."""
+    manifest_path = os.path.join(model_dir, MANIFEST_FILENAME)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    logger.info(f"Model manifest written: {manifest_path}")
+    return manifest_path
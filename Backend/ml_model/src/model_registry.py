@@ -0,0 +1,353 @@
+"""
+Model Registry for RiskGuard System
+Loads model artifacts once per process tree and shares them with forked workers
+"""
+
+import gc
+import os
+import sys
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def get_process_memory() -> Dict[str, Any]:
+    """Get resident memory for the current process in MB."""
+    memory = {'pid': os.getpid(), 'rss_mb': None, 'peak_rss_mb': None}
+
+    # Current RSS from /proc (Linux); second field of statm is resident pages
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        memory['rss_mb'] = round(resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 2)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    # Peak RSS from getrusage (kilobytes on Linux, bytes on macOS)
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        memory['peak_rss_mb'] = round(peak / divisor, 2)
+    except (ImportError, OSError):
+        pass
+
+    return memory
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of loaded model artifacts.
+
+    Loaders are registered by name and run at most once per process tree.
+    Calling warmup() in a pre-fork master (gunicorn --preload, the celery
+    main process) loads everything before workers fork, so workers share the
+    loaded artifacts copy-on-write instead of each paying the load cost on
+    their first request. Anything not warmed up is still loaded lazily on
+    first get().
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._version_sources: Dict[str, List[Callable[[], Any]]] = {}
+        self._models: Dict[str, Any] = {}
+        self._versions: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._frozen = False
+        self._warming_up = False
+
+        # Hot reload watcher (one per process; threads do not survive fork)
+        self._watch_interval: Optional[float] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_pid: Optional[int] = None
+        self._wake_event = threading.Event()
+
+        # A lock held by another thread at fork time would stay locked forever in the child
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork_in_child)
+
+    def _after_fork_in_child(self) -> None:
+        """Reset process-local state in a freshly forked worker."""
+        self._lock = threading.RLock()
+        self._watcher = None
+        self._watcher_pid = None
+        self._wake_event = threading.Event()
+
+    def register(self, name: str, loader: Callable[[], Any],
+                 version: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Register a loader for a named model.
+
+        The first registration for a name wins, so modules imported under
+        more than one path do not replace an already loaded model.
+
+        Args:
+            name: Registry name
+            loader: Callable returning the loaded model
+            version: Optional cheap callable returning a version token for the
+                artifacts on disk; a changed token triggers a hot reload
+        """
+        with self._lock:
+            if name not in self._loaders:
+                self._loaders[name] = loader
+                if version is not None:
+                    self._version_sources.setdefault(name, []).insert(0, version)
+
+    def add_version_source(self, name: str, source: Callable[[], Any]) -> None:
+        """
+        Add another version token source for a model (e.g. the active model
+        version recorded in the database). Any change triggers a hot reload.
+        """
+        with self._lock:
+            sources = self._version_sources.setdefault(name, [])
+            if source not in sources:
+                sources.append(source)
+                # Re-baseline an already loaded model so the new source alone does not trigger a reload
+                if name in self._models:
+                    self._versions[name] = self.current_version(name)
+
+    def current_version(self, name: str) -> Optional[tuple]:
+        """Compute the current version token for a model from its sources."""
+        sources = self._version_sources.get(name)
+        if not sources:
+            return None
+        token = []
+        for source in sources:
+            try:
+                token.append(source())
+            except Exception as e:
+                logger.warning(f"Version source failed for '{name}': {e}")
+                token.append(None)
+        return tuple(token)
+
+    def is_registered(self, name: str) -> bool:
+        """Check whether a loader exists for the given name."""
+        return name in self._loaders
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether the named model is loaded in this process."""
+        return name in self._models
+
+    def get(self, name: str) -> Any:
+        """
+        Get a loaded model, loading it on first use.
+
+        Callers should fetch the model per request rather than holding on to
+        it, so hot-swapped versions are picked up. A request that already
+        holds a model keeps using it until it finishes.
+        """
+        if self._watch_interval is not None and not self._warming_up:
+            self._ensure_watcher()
+
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        with self._lock:
+            if name in self._models:
+                return self._models[name]
+            if name not in self._loaders:
+                raise KeyError(f"No model registered under '{name}'")
+
+            # Token is taken before loading so a change during the load is not missed
+            version = self.current_version(name)
+            memory_before = get_process_memory()
+            start_time = time.perf_counter()
+            model = self._loaders[name]()
+            load_time = time.perf_counter() - start_time
+            memory_after = get_process_memory()
+
+            self._models[name] = model
+            self._versions[name] = version
+            rss_delta = None
+            if memory_before['rss_mb'] is not None and memory_after['rss_mb'] is not None:
+                rss_delta = round(memory_after['rss_mb'] - memory_before['rss_mb'], 2)
+            self._stats[name] = {
+                'load_time_seconds': round(load_time, 4),
+                'loaded_at': datetime.now().isoformat(),
+                'loaded_in_pid': os.getpid(),
+                'rss_delta_mb': rss_delta,
+                'reloads': 0
+            }
+            logger.info(f"Loaded model '{name}' in {load_time:.3f}s (pid {os.getpid()})")
+            return model
+
+    def reload_if_changed(self, name: str) -> bool:
+        """
+        Reload a loaded model if its version token changed.
+
+        The new model is loaded without holding the registry lock, then
+        swapped in with a single assignment. Requests that already hold the
+        old model finish on it; the next get() returns the new one. If the
+        new version fails to load, the old model stays in service.
+
+        Returns:
+            True if a new model was swapped in
+        """
+        if name not in self._models or name not in self._version_sources:
+            return False
+
+        version = self.current_version(name)
+        if version == self._versions.get(name):
+            return False
+
+        logger.info(f"Model '{name}' changed on disk, reloading in background (pid {os.getpid()})")
+        start_time = time.perf_counter()
+        try:
+            model = self._loaders[name]()
+        except Exception as e:
+            logger.error(f"Hot reload failed for '{name}', keeping current model: {e}")
+            # Remember the failed version so a broken deploy is not retried in a loop
+            self._versions[name] = version
+            return False
+        load_time = time.perf_counter() - start_time
+
+        with self._lock:
+            self._models[name] = model
+            self._versions[name] = version
+            stats = self._stats.setdefault(name, {})
+            stats['reloads'] = stats.get('reloads', 0) + 1
+            stats['last_reload_at'] = datetime.now().isoformat()
+            stats['last_reload_seconds'] = round(load_time, 4)
+            stats['loaded_in_pid'] = os.getpid()
+
+        logger.info(f"Swapped in new version of '{name}' after {load_time:.3f}s")
+        return True
+
+    def check_for_updates(self) -> List[str]:
+        """Reload every loaded model whose version changed; return reloaded names."""
+        return [name for name in list(self._models.keys()) if self.reload_if_changed(name)]
+
+    def enable_hot_reload(self, interval: float = 30.0) -> None:
+        """
+        Watch loaded models for new versions every interval seconds.
+
+        The watcher thread starts lazily on the first get() in each process,
+        so a pre-fork master does not start threads its workers would lose.
+        """
+        self._watch_interval = interval
+
+    def in_watcher_thread(self) -> bool:
+        """Check whether the caller runs on this process's watcher thread."""
+        return self._watcher is not None and threading.current_thread() is self._watcher
+
+    def wake_watcher(self) -> None:
+        """Ask the watcher in this process to check for updates now."""
+        self._wake_event.set()
+
+    def _ensure_watcher(self) -> None:
+        """Start the hot reload watcher for this process if not running."""
+        pid = os.getpid()
+        if self._watcher_pid == pid and self._watcher is not None and self._watcher.is_alive():
+            return
+        with self._lock:
+            if self._watcher_pid == pid and self._watcher is not None and self._watcher.is_alive():
+                return
+            self._watcher = threading.Thread(target=self._watch, name='model-registry-watcher', daemon=True)
+            self._watcher_pid = pid
+            self._watcher.start()
+
+    def _watch(self) -> None:
+        """Watcher loop: poll version tokens and hot-swap changed models."""
+        while True:
+            self._wake_event.wait(self._watch_interval)
+            self._wake_event.clear()
+            try:
+                self.check_for_updates()
+            except Exception as e:
+                logger.error(f"Model watcher error: {e}")
+
+    def unload(self, name: str) -> None:
+        """Drop a loaded model so the next get() loads it again."""
+        with self._lock:
+            self._models.pop(name, None)
+            self._versions.pop(name, None)
+            self._stats.pop(name, None)
+
+    def warmup(self, names: Optional[List[str]] = None, freeze: bool = True) -> Dict[str, Any]:
+        """
+        Load registered models ahead of the first request.
+
+        Args:
+            names: Models to load (defaults to every registered model)
+            freeze: Move loaded objects to the permanent GC generation so that
+                collections in forked workers do not touch (and copy) their pages
+
+        Returns:
+            Dictionary with per-model load status and process stats
+        """
+        names = list(self._loaders.keys()) if names is None else names
+        results = {}
+
+        self._warming_up = True
+        try:
+            for name in names:
+                try:
+                    self.get(name)
+                    results[name] = {'loaded': True}
+                except Exception as e:
+                    logger.warning(f"Model warmup failed for '{name}': {e}")
+                    results[name] = {'loaded': False, 'error': str(e)}
+        finally:
+            self._warming_up = False
+
+        if freeze and hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+            self._frozen = True
+
+        return {
+            'models': results,
+            'process': self.stats()
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Report load time per model and memory for the current process."""
+        pid = os.getpid()
+        models = {}
+        for name in self._loaders:
+            model_stats = dict(self._stats.get(name, {}))
+            model_stats['loaded'] = name in self._models
+            # Loaded in another pid means it was inherited from the pre-fork master
+            model_stats['inherited_from_parent'] = (
+                model_stats['loaded'] and model_stats.get('loaded_in_pid') != pid
+            )
+            models[name] = model_stats
+
+        return {
+            'memory': get_process_memory(),
+            'gc_frozen': self._frozen,
+            'hot_reload': {
+                'enabled': self._watch_interval is not None,
+                'interval_seconds': self._watch_interval,
+                'watcher_running': (
+                    self._watcher_pid == pid and self._watcher is not None and self._watcher.is_alive()
+                )
+            },
+            'models': models
+        }
+
+
+def _shared_registry() -> ModelRegistry:
+    """
+    Reuse the registry if this module was already imported under its other name.
+
+    The module is importable as ml_model.src.model_registry, as
+    src.model_registry (ml_model on sys.path) and as model_registry (the
+    credit_scorer import fallback, with src on sys.path); all must see the
+    same models.
+    """
+    for module_name in ('ml_model.src.model_registry', 'src.model_registry', 'model_registry'):
+        module = sys.modules.get(module_name)
+        if module is not None and module.__name__ != __name__ and hasattr(module, 'registry'):
+            return module.registry
+    return ModelRegistry()
+
+
+# Global registry instance
+registry = _shared_registry()
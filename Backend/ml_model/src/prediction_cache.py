@@ -0,0 +1,159 @@
+"""
+Prediction Cache for RiskGuard System
+Content-addressed cache of credit score results keyed by preprocessed features
+"""
+
+import hashlib
+import json
+import os
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model_version: Any, features: np.ndarray, extra: Any = None) -> str:
+    """
+    Build a cache key from the model version and a preprocessed feature vector.
+
+    Args:
+        model_version: Anything identifying the loaded model (e.g. artifact checksums);
+            a new model version therefore never sees results cached for the old one
+        features: Preprocessed feature row
+        extra: Raw inputs that affect the result but are not model features
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(repr(model_version).encode('utf-8'))
+    digest.update(np.ascontiguousarray(features, dtype='float64').tobytes())
+    if extra is not None:
+        digest.update(repr(extra).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class PredictionCache:
+    """
+    Two-tier prediction cache.
+
+    An in-process LRU bounded by max_size sits in front of an optional shared
+    Redis tier with a TTL. Both tiers count hits and misses. Only the top-level
+    dict is copied on the way in and out, so callers may set keys on a result
+    but must treat nested values as read-only.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: int = 3600, redis_url: Optional[str] = None,
+                 key_prefix: str = 'ml_prediction:'):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'redis_hits': 0, 'redis_errors': 0, 'evictions': 0}
+        self._redis = None
+
+        if redis_url:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.1, socket_connect_timeout=0.1)
+            except Exception as e:
+                logger.warning(f"Prediction cache Redis tier disabled: {e}")
+
+    @classmethod
+    def from_env(cls) -> 'PredictionCache':
+        """
+        Create a cache configured from environment variables.
+
+        ML_PREDICTION_CACHE_SIZE: in-process entries (0 disables caching, default 10000)
+        ML_PREDICTION_CACHE_TTL: Redis entry lifetime in seconds (default 3600)
+        ML_PREDICTION_CACHE_REDIS_URL: enables the shared Redis tier when set
+        """
+        return cls(
+            max_size=int(os.getenv('ML_PREDICTION_CACHE_SIZE', '10000')),
+            ttl=int(os.getenv('ML_PREDICTION_CACHE_TTL', '3600')),
+            redis_url=os.getenv('ML_PREDICTION_CACHE_REDIS_URL') or None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.max_size > 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result, checking the local tier before Redis."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+                return dict(value)
+
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(self.key_prefix + key)
+            except Exception as e:
+                raw = None
+                self._counters['redis_errors'] += 1
+                logger.debug(f"Prediction cache Redis get failed: {e}")
+            if raw is not None:
+                value = json.loads(raw)
+                self._store_local(key, value)
+                with self._lock:
+                    self._counters['hits'] += 1
+                    self._counters['redis_hits'] += 1
+                return dict(value)
+
+        with self._lock:
+            self._counters['misses'] += 1
+        return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a result in both tiers."""
+        if not self.enabled:
+            return
+
+        value = dict(value)
+        self._store_local(key, value)
+
+        if self._redis is not None:
+            try:
+                self._redis.set(self.key_prefix + key, json.dumps(value, default=str), ex=self.ttl)
+            except Exception as e:
+                self._counters['redis_errors'] += 1
+                logger.debug(f"Prediction cache Redis set failed: {e}")
+
+    def _store_local(self, key: str, value: Dict[str, Any]) -> None:
+        """Insert into the LRU, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def clear(self) -> None:
+        """Drop all in-process entries (Redis entries expire through their TTL)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                'enabled': self.enabled,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'redis_enabled': self._redis is not None,
+                'ttl_seconds': self.ttl,
+                'hit_rate': round(self._counters['hits'] / lookups, 4) if lookups else 0.0,
+                **self._counters
+            }
@@ -0,0 +1,295 @@
+"""
+Scoring Metrics for RiskGuard System
+Stage-level latency histograms and per-model-version request counters for CreditScorer
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond single rows to multi-second batches
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus semantics)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one value (the caller holds the metrics lock)."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        """Counts of values <= each bucket bound, ending with +Inf."""
+        totals = []
+        running = 0
+        for count in self.counts:
+            running += count
+            totals.append(running)
+        return totals
+
+
+class MetricsSink(ABC):
+    """
+    Destination for finished scoring requests.
+
+    Sinks receive one call per request with its stage timings, so they can
+    aggregate (Prometheus) or forward (logs) without touching the hot path.
+    """
+
+    @abstractmethod
+    def record_request(self, mode: str, model_version: str, outcome: str, rows: int,
+                       total_seconds: float, stages: Dict[str, float]) -> None:
+        """Record one finished request."""
+
+
+class PrometheusSink(MetricsSink):
+    """In-process histograms and counters rendered in the Prometheus text format."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._stage_histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._request_histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._rows: Dict[Tuple[str, str], int] = {}
+
+    def record_request(self, mode: str, model_version: str, outcome: str, rows: int,
+                       total_seconds: float, stages: Dict[str, float]) -> None:
+        with self._lock:
+            for stage, seconds in stages.items():
+                histogram = self._stage_histograms.get((mode, stage))
+                if histogram is None:
+                    histogram = self._stage_histograms[(mode, stage)] = Histogram(self.buckets)
+                histogram.observe(seconds)
+            histogram = self._request_histograms.get((mode, model_version))
+            if histogram is None:
+                histogram = self._request_histograms[(mode, model_version)] = Histogram(self.buckets)
+            histogram.observe(total_seconds)
+            key = (mode, model_version, outcome)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._rows[(mode, model_version)] = self._rows.get((mode, model_version), 0) + rows
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict view of the collected metrics (for status endpoints)."""
+        with self._lock:
+            return {
+                'stages': {
+                    f'{mode}:{stage}': {
+                        'count': h.count,
+                        'mean_ms': round(h.sum / h.count * 1000, 4) if h.count else None
+                    }
+                    for (mode, stage), h in sorted(self._stage_histograms.items())
+                },
+                'requests': [
+                    {'mode': mode, 'model_version': version, 'outcome': outcome, 'count': count}
+                    for (mode, version, outcome), count in sorted(self._requests.items())
+                ],
+                'rows': [
+                    {'mode': mode, 'model_version': version, 'count': count}
+                    for (mode, version), count in sorted(self._rows.items())
+                ]
+            }
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        with self._lock:
+            lines += ['# HELP ml_scoring_stage_seconds Time spent in each scoring stage.',
+                      '# TYPE ml_scoring_stage_seconds histogram']
+            for (mode, stage), histogram in sorted(self._stage_histograms.items()):
+                lines += _histogram_lines('ml_scoring_stage_seconds', {'mode': mode, 'stage': stage}, histogram)
+
+            lines += ['# HELP ml_scoring_request_seconds Total scoring time per request.',
+                      '# TYPE ml_scoring_request_seconds histogram']
+            for (mode, version), histogram in sorted(self._request_histograms.items()):
+                lines += _histogram_lines('ml_scoring_request_seconds', {'mode': mode, 'model_version': version},
+                                          histogram)
+
+            lines += ['# HELP ml_scoring_requests_total Scoring requests by model version and outcome.',
+                      '# TYPE ml_scoring_requests_total counter']
+            for (mode, version, outcome), count in sorted(self._requests.items()):
+                labels = _format_labels({'mode': mode, 'model_version': version, 'outcome': outcome})
+                lines.append(f'ml_scoring_requests_total{labels} {count}')
+
+            lines += ['# HELP ml_scoring_rows_total Applications scored by model version.',
+                      '# TYPE ml_scoring_rows_total counter']
+            for (mode, version), count in sorted(self._rows.items()):
+                lines.append(f'ml_scoring_rows_total{_format_labels({"mode": mode, "model_version": version})} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """Drop all collected metrics."""
+        with self._lock:
+            self._stage_histograms.clear()
+            self._request_histograms.clear()
+            self._requests.clear()
+            self._rows.clear()
+
+
+class LogSink(MetricsSink):
+    """Writes one structured JSON log record per scoring request."""
+
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self.log = log or logging.getLogger('ml_model.scoring')
+        self.level = level
+
+    def record_request(self, mode: str, model_version: str, outcome: str, rows: int,
+                       total_seconds: float, stages: Dict[str, float]) -> None:
+        if not self.log.isEnabledFor(self.level):
+            return
+        self.log.log(self.level, json.dumps({
+            'event': 'ml_scoring_request',
+            'mode': mode,
+            'model_version': model_version,
+            'outcome': outcome,
+            'rows': rows,
+            'total_ms': round(total_seconds * 1000, 3),
+            'stages_ms': {stage: round(seconds * 1000, 3) for stage, seconds in stages.items()}
+        }))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Prometheus label set with escaped values."""
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{key}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+def _histogram_lines(name: str, labels: Dict[str, str], histogram: Histogram) -> List[str]:
+    """Bucket, sum and count lines for one labelled histogram."""
+    lines = []
+    for bound, count in zip(list(histogram.buckets) + ['+Inf'], histogram.cumulative_counts()):
+        lines.append(f'{name}_bucket{_format_labels(dict(labels, le=bound))} {count}')
+    lines.append(f'{name}_sum{_format_labels(labels)} {histogram.sum}')
+    lines.append(f'{name}_count{_format_labels(labels)} {histogram.count}')
+    return lines
+
+
+class RequestTimer:
+    """Stage timings for one scoring request, using the monotonic perf counter."""
+
+    __slots__ = ('metrics', 'mode', 'model_version', 'stages', 'start')
+
+    def __init__(self, metrics: 'ScoringMetrics', mode: str, model_version: str):
+        self.metrics = metrics
+        self.mode = mode
+        self.model_version = model_version
+        self.stages: Dict[str, float] = {}
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block as one stage; repeated stages accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        """Record a stage measured by the caller."""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def finish(self, outcome: str, rows: int = 1) -> None:
+        """Hand the request to the sinks."""
+        self.metrics.record(self, outcome, rows, time.perf_counter() - self.start)
+
+
+class _NullTimer:
+    """Timer used when metrics are disabled."""
+
+    __slots__ = ()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        yield
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        pass
+
+    def finish(self, outcome: str, rows: int = 1) -> None:
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class ScoringMetrics:
+    """
+    Pluggable metrics surface for CreditScorer.
+
+    Each scoring request gets a RequestTimer; stage timings are collected
+    locally and handed to every registered sink when the request finishes,
+    so the hot path takes no locks. The Prometheus sink is always present;
+    more sinks (the structured log sink, or an adapter to another metrics
+    backend) can be added with add_sink().
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.prometheus = PrometheusSink()
+        self.sinks: List[MetricsSink] = [self.prometheus]
+
+    @classmethod
+    def from_env(cls) -> 'ScoringMetrics':
+        """
+        Create metrics configured from environment variables.
+
+        ML_METRICS_ENABLED: collect scoring metrics (default true)
+        ML_METRICS_LOG: also write one structured log record per request (default false)
+        """
+        metrics = cls(enabled=os.getenv('ML_METRICS_ENABLED', 'True').lower() == 'true')
+        if os.getenv('ML_METRICS_LOG', 'False').lower() == 'true':
+            metrics.add_sink(LogSink())
+        return metrics
+
+    def add_sink(self, sink: MetricsSink) -> None:
+        """Register another sink for finished requests."""
+        self.sinks.append(sink)
+
+    def start_request(self, mode: str, model_version: str) -> Any:
+        """Timer for one request ('single' or 'batch')."""
+        if not self.enabled:
+            return NULL_TIMER
+        return RequestTimer(self, mode, model_version)
+
+    def record(self, timer: RequestTimer, outcome: str, rows: int, total_seconds: float) -> None:
+        """Send a finished request to every sink; sink failures never affect scoring."""
+        for sink in self.sinks:
+            try:
+                sink.record_request(timer.mode, timer.model_version, outcome, rows, total_seconds, timer.stages)
+            except Exception as e:
+                logger.warning(f"Metrics sink {type(sink).__name__} failed: {e}")
+
+    def render_prometheus(self) -> str:
+        """Current metrics in the Prometheus text format."""
+        return self.prometheus.render()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics as a plain dictionary."""
+        return self.prometheus.snapshot()
+
+
+# Shared by every scorer in the process
+scoring_metrics = ScoringMetrics.from_env()
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
@@ -0,0 +1,171 @@
+"""
+NumPy Tree Evaluator for RiskGuard System
+Scores small batches straight from flat node arrays exported from the XGBoost booster
+"""
+
+import json
+import logging
+from typing import Any, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class NumpyTreeEvaluator:
+    """
+    Pure NumPy evaluator for a gradient boosted tree regressor.
+
+    Every tree of the booster is flattened into shared node arrays (split
+    feature, float32 threshold, children, default direction, leaf value).
+    Rows are evaluated for all trees at once, one tree level per step, which
+    avoids XGBoost's DMatrix construction and thread dispatch for one-row
+    requests. Numerics follow XGBoost's CPU predictor: inputs and thresholds
+    are float32, a row goes left when value < threshold, missing values take
+    the default direction, and leaf values are added to base_score in tree
+    order in float32.
+    """
+
+    def __init__(self, feature_names: List[str], base_score: float, roots: np.ndarray,
+                 split_index: np.ndarray, split_condition: np.ndarray, left: np.ndarray,
+                 right: np.ndarray, default_left: np.ndarray, is_leaf: np.ndarray, max_depth: int):
+        self.feature_names = list(feature_names)
+        self.base_score = np.float32(base_score)
+        self.roots = roots
+        self.split_index = split_index
+        self.split_condition = split_condition
+        self.left = left
+        self.right = right
+        self.default_left = default_left
+        self.is_leaf = is_leaf
+        self.max_depth = max_depth
+
+    @classmethod
+    def from_booster(cls, booster: Any) -> 'NumpyTreeEvaluator':
+        """
+        Export a booster (or XGBRegressor) into flat node arrays.
+
+        Raises:
+            ValueError: For models the evaluator cannot reproduce exactly
+                (non-tree boosters, categorical splits, multi-output, dart)
+        """
+        if hasattr(booster, 'get_booster'):
+            booster = booster.get_booster()
+
+        model = json.loads(booster.save_raw(raw_format='json'))
+        learner = model['learner']
+        objective = learner['objective']['name']
+        if objective not in ('reg:squarederror', 'reg:linear', 'reg:absoluteerror'):
+            raise ValueError(f"Unsupported objective for native evaluation: {objective}")
+        if learner['gradient_booster']['name'] != 'gbtree':
+            raise ValueError(f"Unsupported booster for native evaluation: {learner['gradient_booster']['name']}")
+        if int(learner['learner_model_param'].get('num_target', '1')) != 1:
+            raise ValueError("Multi-output models are not supported by the native evaluator")
+
+        trees = learner['gradient_booster']['model']['trees']
+        roots, split_index, split_condition, left, right, default_left = [], [], [], [], [], []
+        max_depth = 0
+        offset = 0
+        for tree in trees:
+            if tree['categories_nodes'] or any(tree['split_type']):
+                raise ValueError("Categorical splits are not supported by the native evaluator")
+
+            tree_left = np.asarray(tree['left_children'], dtype='int64')
+            tree_right = np.asarray(tree['right_children'], dtype='int64')
+            leaf = tree_left == -1
+            # Leaves point at themselves so extra traversal steps stay put
+            own = np.arange(len(tree_left), dtype='int64')
+            roots.append(offset)
+            left.append(np.where(leaf, own, tree_left) + offset)
+            right.append(np.where(leaf, own, tree_right) + offset)
+            split_index.append(np.where(leaf, 0, tree['split_indices']))
+            split_condition.append(tree['split_conditions'])
+            default_left.append(tree['default_left'])
+            max_depth = max(max_depth, cls._tree_depth(tree_left, tree_right))
+            offset += len(tree_left)
+
+        left = np.concatenate(left)
+        return cls(
+            feature_names=booster.feature_names or learner.get('feature_names') or [],
+            base_score=cls.parse_base_score(learner['learner_model_param']['base_score']),
+            roots=np.asarray(roots, dtype='int64'),
+            split_index=np.concatenate(split_index).astype('int64'),
+            split_condition=np.concatenate(split_condition).astype('float32'),
+            left=left,
+            right=np.concatenate(right),
+            default_left=np.concatenate(default_left).astype(bool),
+            is_leaf=left == np.arange(len(left)),
+            max_depth=max_depth
+        )
+
+    @staticmethod
+    def parse_base_score(value: Any) -> float:
+        """
+        Read base_score from a saved model or config.
+
+        XGBoost 2.x stores it as a bracketed vector string such as "[5.2E2]";
+        older versions store a plain number string.
+        """
+        return float(str(value).strip().strip('[]'))
+
+    @staticmethod
+    def _tree_depth(left: np.ndarray, right: np.ndarray) -> int:
+        """Number of splits on the longest root-to-leaf path."""
+        depth = 0
+        level = [0]
+        while True:
+            level = [child for node in level if left[node] != -1 for child in (left[node], right[node])]
+            if not level:
+                return depth
+            depth += 1
+
+    @property
+    def n_trees(self) -> int:
+        """Number of trees in the ensemble."""
+        return len(self.roots)
+
+    def predict(self, features: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+        """
+        Predict raw model outputs, matching XGBRegressor.predict.
+
+        Args:
+            features: Matrix in training feature order, or a DataFrame with
+                the training feature names
+
+        Returns:
+            float32 array with one prediction per row
+        """
+        if isinstance(features, pd.DataFrame):
+            if self.feature_names and list(features.columns) != self.feature_names:
+                features = features[self.feature_names]
+            features = features.to_numpy()
+        features = np.asarray(features, dtype='float32')
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+
+        n_rows = features.shape[0]
+        rows = np.arange(n_rows)[:, None]
+        nodes = np.broadcast_to(self.roots, (n_rows, self.n_trees)).copy()
+
+        for _ in range(self.max_depth):
+            values = features[rows, self.split_index[nodes]]
+            missing = np.isnan(values)
+            with np.errstate(invalid='ignore'):
+                go_left = np.where(missing, self.default_left[nodes], values < self.split_condition[nodes])
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        # Leaf values live in split_condition; add them tree by tree in float32 like XGBoost
+        contributions = np.empty((n_rows, self.n_trees + 1), dtype='float32')
+        contributions[:, 0] = self.base_score
+        contributions[:, 1:] = self.split_condition[nodes]
+        return np.cumsum(contributions, axis=1, dtype='float32')[:, -1]
+
+
+def build_tree_evaluator(model: Any) -> Optional[NumpyTreeEvaluator]:
+    """Build an evaluator for a model, or None (with a warning) if it is not supported."""
+    try:
+        return NumpyTreeEvaluator.from_booster(model)
+    except Exception as e:
+        logger.warning(f"Native tree evaluator unavailable, using XGBoost predict: {e}")
+        return None
@@ -1,15 +1,22 @@
 from django.conf import settings
+from django.db import transaction
 from applications.models import CreditApplication
-from risk.models import RiskAssessment, RiskFactor, Decision
+from risk.models import RiskAssessment, RiskFactor, Decision, RiskExplanation, CounterfactualExplanation
 import numpy as np
 import pandas as pd
 import joblib
 from datetime import date, datetime
+from ml_model.src.model_registry import registry
+
+# Artifacts are loaded once per process tree through the model registry
+registry.register('risk_model', lambda: joblib.load(settings.RISK_MODEL_PATH))
+registry.register('risk_scaler', lambda: joblib.load(settings.SCALER_PATH))
+registry.register('decision_model', lambda: joblib.load(settings.DECISION_MODEL_PATH))
 
 class RiskEngine:
     def __init__(self):
-        self.model = joblib.load(settings.RISK_MODEL_PATH)
-        self.scaler = joblib.load(settings.SCALER_PATH)
+        self.model = registry.get('risk_model')
+        self.scaler = registry.get('risk_scaler')
         self.features = settings.RISK_MODEL_FEATURES
         
     def calculate_risk(self, application):
@@ -114,7 +121,7 @@ class RiskEngine:
 
 class DecisionEngine:
     def __init__(self):
-        self.decision_model = joblib.load(settings.DECISION_MODEL_PATH)
+        self.decision_model = registry.get('decision_model')
         self.policy_rules = settings.DECISION_POLICY_RULES
     
     def make_decision(self, application):
@@ -213,4 +220,172 @@ class DecisionEngine:
             'interest_rate': interest_rate if decision in ['APPROVE', 'CONDITIONAL'] else None,
             'term_months': application.loan_term if decision in ['APPROVE', 'CONDITIONAL'] else None,
             'conditions': "\n".join(conditions) if conditions else None
-        }
\ No newline at end of file
+        }
+
+
+class ExplanationService:
+    """Writes per-application ML score explanations in bulk at scoring time."""
+
+    FEATURE_LABELS = {
+        'annual_inc': 'Annual income',
+        'dti': 'Debt-to-income ratio',
+        'int_rate': 'Interest rate',
+        'revol_util': 'Revolving credit utilization',
+        'delinq_2yrs': 'Delinquencies (2 years)',
+        'inq_last_6mths': 'Credit inquiries (6 months)',
+        'open_acc': 'Open accounts',
+        'collections_12_mths_ex_med': 'Collections (12 months)',
+        'loan_amnt': 'Loan amount',
+        'max_bal_bc': 'Maximum bankcard balance',
+        'total_acc': 'Total accounts',
+        'open_rv_12m': 'Revolving accounts opened (12 months)',
+        'pub_rec': 'Public records',
+        'credit_history_length': 'Credit history length',
+        'emp_length_encoded': 'Employment length',
+        'home_ownership_encoded': 'Home ownership',
+    }
+
+    def save_explanations(self, applications, ml_inputs, predictions=None):
+        """
+        Explain and store RiskExplanation rows for many applications at once.
+
+        Contributions for all applications come from one booster call, and
+        existing explanations are replaced with a single delete and
+        bulk_create.
+
+        Args:
+            applications: CreditApplication instances
+            ml_inputs: ML input dictionaries, one per application
+            predictions: Optional prediction results, used for the summary
+
+        Returns:
+            List of created RiskExplanation instances
+        """
+        # Imported here so loading risk.services does not pull in the scoring stack
+        from ml_model.src.credit_scorer import get_credit_scorer
+
+        predictions = predictions or [None] * len(applications)
+        explanations = get_credit_scorer().explain_batch(ml_inputs)
+
+        rows = []
+        for application, result, prediction in zip(applications, explanations, predictions):
+            if not result.get('success'):
+                continue
+            explanation = result['explanation']
+            rows.append(RiskExplanation(
+                application=application,
+                summary=self._build_summary(explanation, prediction),
+                key_factors=self._build_key_factors(explanation),
+                visualizations=self._build_visualizations(explanation)
+            ))
+
+        if not rows:
+            return []
+
+        with transaction.atomic():
+            RiskExplanation.objects.filter(application_id__in=[row.application_id for row in rows]).delete()
+            return RiskExplanation.objects.bulk_create(rows)
+
+    def _build_key_factors(self, explanation):
+        """Per-feature contributions; importance is the signed impact in score points."""
+        return {
+            factor['feature']: {
+                'label': self.FEATURE_LABELS.get(factor['feature'], factor['feature']),
+                'value': factor['value'],
+                'importance': factor['score_impact'],
+                'contribution': factor['contribution'],
+                'direction': factor['direction']
+            }
+            for factor in explanation['feature_contributions']
+        }
+
+    def _build_visualizations(self, explanation):
+        """Waterfall chart from the model baseline to the final score."""
+        return {
+            'waterfall': {
+                'base_score': explanation['base_score'],
+                'steps': [
+                    {
+                        'feature': factor['feature'],
+                        'label': self.FEATURE_LABELS.get(factor['feature'], factor['feature']),
+                        'score_impact': factor['score_impact']
+                    }
+                    for factor in explanation['feature_contributions']
+                ]
+            }
+        }
+
+    def _build_summary(self, explanation, prediction=None):
+        """Plain-language summary naming the strongest factors on each side."""
+        factors = explanation['feature_contributions']
+        raised = [f for f in factors if f['score_impact'] > 0][:2]
+        lowered = [f for f in factors if f['score_impact'] < 0][:2]
+
+        parts = []
+        if prediction and prediction.get('success'):
+            parts.append(f"Credit score {prediction['credit_score']} ({prediction['category']}).")
+        if raised:
+            parts.append("Raised most by " + ", ".join(
+                f"{self.FEATURE_LABELS.get(f['feature'], f['feature']).lower()} (+{f['score_impact']:.0f} points)"
+                for f in raised
+            ) + ".")
+        if lowered:
+            parts.append("Lowered most by " + ", ".join(
+                f"{self.FEATURE_LABELS.get(f['feature'], f['feature']).lower()} ({f['score_impact']:.0f} points)"
+                for f in lowered
+            ) + ".")
+        return " ".join(parts)
+
+
+class CounterfactualService:
+    """Writes "what-if" scenarios for scored applications in bulk."""
+
+    def __init__(self, max_scenarios=3):
+        self.max_scenarios = max_scenarios
+
+    def save_counterfactuals(self, applications, ml_inputs):
+        """
+        Search and store CounterfactualExplanation rows for many applications at once.
+
+        The candidate grids of all applications are scored with one model
+        call, and existing counterfactuals are replaced with a single delete
+        and bulk_create.
+
+        Args:
+            applications: CreditApplication instances
+            ml_inputs: ML input dictionaries, one per application
+
+        Returns:
+            List of created CounterfactualExplanation instances
+        """
+        from ml_model.src.credit_scorer import get_credit_scorer
+
+        results = get_credit_scorer().counterfactuals_batch(ml_inputs, max_scenarios=self.max_scenarios)
+
+        searched = []
+        rows = []
+        for application, result in zip(applications, results):
+            if not result.get('success'):
+                continue
+            searched.append(application.pk)
+            for counterfactual in result['counterfactuals']:
+                rows.append(CounterfactualExplanation(
+                    application=application,
+                    scenario=counterfactual['scenario'][:255],
+                    original_score=counterfactual['original_score'],
+                    projected_score=counterfactual['projected_score'],
+                    probability_change=self._probability_change(counterfactual),
+                    required_changes=counterfactual['required_changes'],
+                    explanation=counterfactual['explanation']
+                ))
+
+        if not searched:
+            return []
+
+        with transaction.atomic():
+            CounterfactualExplanation.objects.filter(application_id__in=searched).delete()
+            return CounterfactualExplanation.objects.bulk_create(rows)
+
+    def _probability_change(self, counterfactual):
+        """Default probability change on RiskEngine's score scale (score = 850 - probability * 550)."""
+        return round((counterfactual['original_score'] - counterfactual['projected_score']) / 550, 4)
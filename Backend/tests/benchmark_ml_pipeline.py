@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the ML credit scoring pipeline
+Measures throughput, latency percentiles and peak memory of each scoring stage
+against the models in ml_model/models, and compares runs with a saved baseline.
+
+Per-application stages (validation, preprocessing, job title categorization,
+single predictions) are called once per application, so a batch size of N
+means N sequential calls and latency is per call. batch_predict is called
+with the whole batch, so latency is per batch.
+
+Each stage and batch size runs in a fresh process, because peak RSS is a
+process-lifetime high-water mark: peak_rss_mb is the peak of a process that
+loaded the model and ran only that stage at that size, and peak_rss_delta_mb
+is how far it rose above the RSS after loading and warmup. --in-process runs
+everything in one process (faster, but the peaks then only ever grow).
+
+Usage:
+    python tests/benchmark_ml_pipeline.py [--sizes 1 10 100 1000 10000] [--output PATH]
+    python tests/benchmark_ml_pipeline.py --baseline tests/benchmarks/ml_pipeline_baseline.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Benchmarks measure the model, not the prediction cache
+if '--with-cache' not in sys.argv:
+    os.environ['ML_PREDICTION_CACHE_SIZE'] = '0'
+
+import numpy as np
+
+# Add the Backend directory to the Python path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from ml_model.final_preprocessor import preprocess_for_prediction_final, validate_single_application
+from ml_model.ghana_employment_processor import categorize_ghana_job_title, _categorize_normalized_title
+from ml_model.src.credit_scorer import CreditScorer
+from ml_model.src.model_registry import get_process_memory
+
+DEFAULT_SIZES = [1, 10, 100, 1000, 10000]
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'ml_pipeline_benchmark.json')
+
+JOB_TITLES = ['Bank Manager', 'Teacher', 'Software Engineer', 'Nurse', 'Uber Driver', 'Cocoa Farmer',
+              'Trader', 'Security Guard', 'Accountant', 'Medical Officer', 'Civil Servant', 'Seamstress',
+              'Mechanic', 'Pharmacist', 'Lecturer', 'Police Officer', 'Market Woman', 'Clerk', '']
+EMP_LENGTHS = ['< 1 year', '1 year', '2 years', '3 years', '5 years', '7 years', '10+ years']
+HOME_OWNERSHIP = ['RENT', 'OWN', 'MORTGAGE', 'OTHER']
+
+
+def generate_applications(n_rows, seed=42):
+    """Deterministic synthetic applications covering the model's input ranges."""
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            'annual_inc': float(rng.uniform(12000, 250000)),
+            'dti': float(rng.uniform(0, 45)),
+            'int_rate': float(rng.uniform(5, 30)),
+            'revol_util': float(rng.uniform(0, 100)),
+            'delinq_2yrs': int(rng.integers(0, 4)),
+            'inq_last_6mths': int(rng.integers(0, 7)),
+            'emp_length': str(rng.choice(EMP_LENGTHS)),
+            'emp_title': str(rng.choice(JOB_TITLES)),
+            'open_acc': int(rng.integers(1, 30)),
+            'collections_12_mths_ex_med': int(rng.integers(0, 2)),
+            'loan_amnt': float(rng.uniform(1000, 40000)),
+            'credit_history_length': float(rng.uniform(1, 30)),
+            'max_bal_bc': float(rng.uniform(0, 20000)),
+            'total_acc': int(rng.integers(2, 60)),
+            'open_rv_12m': int(rng.integers(0, 6)),
+            'pub_rec': int(rng.integers(0, 2)),
+            'home_ownership': str(rng.choice(HOME_OWNERSHIP))
+        }
+        for _ in range(n_rows)
+    ]
+
+
+def _summarize(stage, batch_size, latencies, rows_processed, total_seconds, rss_before_mb):
+    """Throughput, latency percentiles and memory for one stage and batch size."""
+    latencies_ms = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    memory = get_process_memory()
+    return {
+        'stage': stage,
+        'batch_size': batch_size,
+        'calls': len(latencies),
+        'rows_processed': rows_processed,
+        'total_seconds': round(total_seconds, 4),
+        'throughput_rows_per_sec': round(rows_processed / total_seconds, 2) if total_seconds > 0 else None,
+        'p50_ms': round(float(p50), 4),
+        'p95_ms': round(float(p95), 4),
+        'p99_ms': round(float(p99), 4),
+        'rss_mb': memory['rss_mb'],
+        'peak_rss_mb': memory['peak_rss_mb'],
+        'peak_rss_delta_mb': (round(memory['peak_rss_mb'] - rss_before_mb, 2)
+                              if memory['peak_rss_mb'] is not None and rss_before_mb is not None else None)
+    }
+
+
+def _time_per_call(func, items):
+    """Call func once per item; return per-call latencies and total time."""
+    latencies = np.empty(len(items))
+    start_time = time.perf_counter()
+    for i, item in enumerate(items):
+        call_start = time.perf_counter()
+        func(item)
+        latencies[i] = time.perf_counter() - call_start
+    return latencies, time.perf_counter() - start_time
+
+
+def run_benchmarks(scorer, sizes, seed=42, repeats=None, stages=None):
+    """
+    Run every stage at every batch size.
+
+    Args:
+        scorer: Loaded CreditScorer
+        sizes: Batch sizes to measure
+        seed: Seed for the synthetic applications
+        repeats: batch_predict calls per size (default: enough for ~20k rows, 3 to 200 calls)
+        stages: Stage names to run (default: all)
+
+    Returns:
+        List of per-stage, per-size result dictionaries
+    """
+    applications = generate_applications(max(sizes), seed)
+    titles = [application['emp_title'] for application in applications]
+
+    per_call_stages = {
+        'validate_single_application': lambda app: validate_single_application(app),
+        'preprocess_for_prediction_final': lambda app: preprocess_for_prediction_final(app, scorer.model_dir),
+        'categorize_ghana_job_title': categorize_ghana_job_title,
+        'predict_credit_score': scorer.predict_credit_score,
+    }
+    selected = stages or list(per_call_stages) + ['batch_predict']
+
+    # Warm up the selected code paths once so one-time setup is not measured
+    for name in per_call_stages:
+        if name in selected:
+            per_call_stages[name](titles[0] if name == 'categorize_ghana_job_title' else applications[0])
+    if 'batch_predict' in selected:
+        scorer.batch_predict(applications[:10])
+    rss_before_mb = get_process_memory()['rss_mb']
+
+    results = []
+    for size in sizes:
+        batch = applications[:size]
+        for name, func in per_call_stages.items():
+            if name not in selected:
+                continue
+            items = titles[:size] if name == 'categorize_ghana_job_title' else batch
+            if name == 'categorize_ghana_job_title':
+                # Measure lookups starting cold, the way a fresh worker sees them
+                _categorize_normalized_title.cache_clear()
+            latencies, total = _time_per_call(func, items)
+            results.append(_summarize(name, size, latencies, size, total, rss_before_mb))
+            _print_result(results[-1])
+
+        if 'batch_predict' in selected:
+            calls = repeats or max(3, min(200, 20000 // size))
+            latencies, total = _time_per_call(scorer.batch_predict, [batch] * calls)
+            results.append(_summarize('batch_predict', size, latencies, size * calls, total, rss_before_mb))
+            _print_result(results[-1])
+
+    return results
+
+
+def _load_scorer():
+    """Load the credit scorer for the models in ml_model/models."""
+    scorer = CreditScorer()
+    if not scorer.load_model():
+        raise RuntimeError("Failed to load credit scoring model")
+    return scorer
+
+
+def _run_one(size, stage, seed, repeats):
+    """Child process entry point: load the model and run one stage at one batch size."""
+    return run_benchmarks(_load_scorer(), [size], seed, repeats, [stage])
+
+
+def run_isolated_benchmarks(sizes, seed=42, repeats=None, stages=None):
+    """
+    Run every stage at every batch size, each in its own fresh process.
+
+    Same arguments and results as run_benchmarks, except that memory
+    figures belong to the one stage and size measured.
+    """
+    selected = stages or ['validate_single_application', 'preprocess_for_prediction_final',
+                          'categorize_ghana_job_title', 'predict_credit_score', 'batch_predict']
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for size in sizes:
+        for stage in selected:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results += executor.submit(_run_one, size, stage, seed, repeats).result()
+    return results
+
+
+def _print_result(result):
+    """Print one result row."""
+    print(f"{result['stage']:34} {result['batch_size']:>6} {result['throughput_rows_per_sec']:>12.1f} "
+          f"{result['p50_ms']:>10.3f} {result['p95_ms']:>10.3f} {result['p99_ms']:>10.3f} "
+          f"{result['peak_rss_mb'] or 0:>10.1f}")
+
+
+def environment_metadata(scorer, seed):
+    """Versions and hardware recorded with every run so baselines stay comparable."""
+    import pandas as pd
+    import xgboost as xgb
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'xgboost': xgb.__version__,
+        'scoring_backend': scorer.scoring_backend,
+        'prediction_cache': os.environ.get('ML_PREDICTION_CACHE_SIZE', 'default'),
+        'model_checksums': scorer.artifact_checksums,
+        'seed': seed
+    }
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """
+    Compare results with a baseline run.
+
+    A stage regresses when its p50 latency grows, or its throughput drops,
+    by more than the tolerance.
+
+    Returns:
+        List of regression descriptions (empty when none)
+    """
+    baseline_results = {(r['stage'], r['batch_size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        previous = baseline_results.get((result['stage'], result['batch_size']))
+        if previous is None:
+            continue
+        if result['p50_ms'] > previous['p50_ms'] * (1 + tolerance):
+            regressions.append(
+                f"{result['stage']} @ {result['batch_size']}: p50 {previous['p50_ms']:.3f}ms -> {result['p50_ms']:.3f}ms"
+            )
+        if previous['throughput_rows_per_sec'] and result['throughput_rows_per_sec'] < previous['throughput_rows_per_sec'] * (1 - tolerance):
+            regressions.append(
+                f"{result['stage']} @ {result['batch_size']}: throughput "
+                f"{previous['throughput_rows_per_sec']:.1f} -> {result['throughput_rows_per_sec']:.1f} rows/s"
+            )
+    return regressions
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description='Benchmark the ML credit scoring pipeline')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Batch sizes to measure')
+    parser.add_argument('--repeats', type=int, default=None, help='batch_predict calls per batch size')
+    parser.add_argument('--stages', nargs='+', default=None, help='Only run these stages')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the synthetic applications')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Where to save the results as JSON')
+    parser.add_argument('--baseline', default=None, help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative slowdown before failing')
+    parser.add_argument('--with-cache', action='store_true', help='Keep the prediction cache enabled')
+    parser.add_argument('--in-process', action='store_true',
+                        help='Run all stages in this process instead of one fresh process each')
+    args = parser.parse_args()
+
+    print(f"{'stage':34} {'batch':>6} {'rows/s':>12} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'peak MB':>10}")
+    scorer = _load_scorer()
+    if args.in_process:
+        results = run_benchmarks(scorer, sorted(args.sizes), args.seed, args.repeats, args.stages)
+    else:
+        results = run_isolated_benchmarks(sorted(args.sizes), args.seed, args.repeats, args.stages)
+
+    report = {'metadata': environment_metadata(scorer, args.seed), 'results': results}
+    report['metadata']['isolated_runs'] = not args.in_process
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('metadata', {}).get('model_checksums') != report['metadata']['model_checksums']:
+            print("Note: baseline was recorded with different model artifacts")
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regressions beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return False
+        print(f"\n✓ No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,40 @@
+"""
+Redis client for tests of the ML job lease
+Uses fakeredis (with Lua support) when it is installed, otherwise the Redis
+server at ML_JOBS_TEST_REDIS_URL. Tests that need the lease are skipped
+when neither is available.
+"""
+
+import os
+
+ML_JOBS_TEST_REDIS_URL = os.getenv('ML_JOBS_TEST_REDIS_URL', 'redis://localhost:6379/15')
+
+
+def _fake_client():
+    try:
+        import fakeredis
+        client = fakeredis.FakeRedis()
+        client.eval('return 1', 0)  # Lua scripts need fakeredis[lua]
+        return client
+    except Exception:
+        return None
+
+
+def _server_client():
+    try:
+        import redis
+        client = redis.Redis.from_url(ML_JOBS_TEST_REDIS_URL, socket_connect_timeout=1)
+        client.ping()
+        return client
+    except Exception:
+        return None
+
+
+LEASE_CLIENT = _fake_client() or _server_client()
+
+
+def fresh_lease_client():
+    """The test Redis client with every lease removed, or None without one."""
+    if LEASE_CLIENT is not None:
+        LEASE_CLIENT.flushdb()
+    return LEASE_CLIENT
@@ -0,0 +1,13 @@
+"""
+Shared helpers for the ML scoring tests
+Import after the Backend directory is on the Python path.
+"""
+
+from ml_model.src.credit_scorer import CreditScorer
+
+
+def load_scorer():
+    """A fresh CreditScorer with the deployed model loaded."""
+    scorer = CreditScorer()
+    assert scorer.load_model(), "Model failed to load"
+    return scorer
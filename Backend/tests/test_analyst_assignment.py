@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for automatic risk analyst assignment
+Checks that the workload query does not grow with the number of analysts
+
+Run with: python manage.py test tests -p test_analyst_assignment.py
+"""
+
+import os
+import sys
+from datetime import timedelta
+
+import django
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+django.setup()
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from applications.models import CreditApplication
+from applications.signals import auto_assign_risk_analyst
+from users.models import Role, User
+
+
+@override_settings(ML_AUTO_TRIGGER_ON_SUBMIT=False)
+class AnalystAssignmentTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Role.objects.create(name='Client User')
+        Role.objects.create(name='Risk Analyst')
+        cls.client_user = User.objects.create_user(
+            'applicant@example.com', 'Str0ng-passw0rd', first_name='Ama', last_name='Mensah', user_type='CLIENT'
+        )
+
+    def create_analysts(self, count, start=0):
+        return [
+            User.objects.create_user(f'analyst{i}@example.com', 'Str0ng-passw0rd', first_name='Risk',
+                                     last_name=f'Analyst{i}', user_type='ANALYST')
+            for i in range(start, start + count)
+        ]
+
+    def create_application(self, **kwargs):
+        # Drafts are not auto-assigned on save, so tests call auto_assign_risk_analyst themselves
+        return CreditApplication.objects.create(applicant=self.client_user, status='DRAFT', **kwargs)
+
+    def count_assignment_queries(self):
+        application = self.create_application()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertIsNotNone(auto_assign_risk_analyst(application))
+        return len(queries)
+
+    def test_query_count_does_not_depend_on_analyst_count(self):
+        self.create_analysts(2)
+        few = self.count_assignment_queries()
+        self.create_analysts(10, start=2)
+        many = self.count_assignment_queries()
+        self.assertEqual(few, many)
+
+    def test_assignment_selects_row_with_skip_locked(self):
+        self.create_analysts(3)
+        application = self.create_application()
+        with CaptureQueriesContext(connection) as queries:
+            auto_assign_risk_analyst(application)
+        selects = [q['sql'] for q in queries if q['sql'].lstrip().upper().startswith('SELECT')]
+        if connection.features.has_select_for_update_skip_locked:
+            self.assertTrue(any('SKIP LOCKED' in sql.upper() for sql in selects))
+
+    def test_least_loaded_analyst_is_chosen(self):
+        busy, idle = self.create_analysts(2)
+        for _ in range(2):
+            self.create_application(status='UNDER_REVIEW', assigned_analyst=busy)
+        self.assertEqual(auto_assign_risk_analyst(self.create_application()), idle)
+
+    def test_ties_go_to_the_analyst_assigned_longest_ago(self):
+        recent, earlier = self.create_analysts(2)
+        now = timezone.now()
+        recent_application = self.create_application(status='APPROVED', assigned_analyst=recent)
+        earlier_application = self.create_application(status='APPROVED', assigned_analyst=earlier)
+        CreditApplication.objects.filter(pk=recent_application.pk).update(assigned_at=now)
+        CreditApplication.objects.filter(pk=earlier_application.pk).update(assigned_at=now - timedelta(days=3))
+        self.assertEqual(auto_assign_risk_analyst(self.create_application()), earlier)
+
+    def test_rotation_uses_assignment_time_not_submission_date(self):
+        reassigned, other = self.create_analysts(2)
+        now = timezone.now()
+        other_application = self.create_application(status='APPROVED', assigned_analyst=other,
+                                                     submission_date=now - timedelta(days=1))
+        CreditApplication.objects.filter(pk=other_application.pk).update(assigned_at=now - timedelta(days=1))
+        # Submitted long ago, but handed to this analyst just now
+        backlogged = self.create_application(status='APPROVED', submission_date=now - timedelta(days=30))
+        backlogged.assigned_analyst = reassigned
+        backlogged.save(update_fields=['assigned_analyst'])
+
+        backlogged.refresh_from_db()
+        self.assertGreaterEqual(backlogged.assigned_at, now)
+        self.assertEqual(auto_assign_risk_analyst(self.create_application()), other)
+
+    def test_assignment_records_assigned_at(self):
+        analyst, = self.create_analysts(1)
+        application = self.create_application()
+        before = timezone.now()
+        auto_assign_risk_analyst(application)
+        application.refresh_from_db()
+        self.assertEqual(application.assigned_analyst, analyst)
+        self.assertGreaterEqual(application.assigned_at, before)
+
+    def test_no_analysts(self):
+        self.assertIsNone(auto_assign_risk_analyst(self.create_application()))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for CreditApplication change tracking
+Checks old_value()/has_changed() against the snapshot taken at load time
+
+Run with: python manage.py test tests -p test_application_change_tracking.py
+"""
+
+import os
+import sys
+from decimal import Decimal
+
+import django
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+django.setup()
+
+from django.test import TestCase, override_settings
+
+from applications.models import ApplicationStatusHistory, CreditApplication
+from users.models import Role, User
+
+
+@override_settings(ML_AUTO_TRIGGER_ON_SUBMIT=False)
+class ChangeTrackingTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Role.objects.create(name='Client User')
+        Role.objects.create(name='Risk Analyst')
+        cls.client_user = User.objects.create_user(
+            'applicant@example.com', 'Str0ng-passw0rd', first_name='Ama', last_name='Mensah', user_type='CLIENT'
+        )
+
+    def create_application(self, **kwargs):
+        fields = dict(applicant=self.client_user, status='DRAFT', annual_income=Decimal('85000'),
+                      loan_amount=Decimal('20000'), employment_length='5 years', job_title='Teacher')
+        fields.update(kwargs)
+        return CreditApplication.objects.create(**fields)
+
+    def test_load_modify_save(self):
+        pk = self.create_application().pk
+        application = CreditApplication.objects.get(pk=pk)
+
+        # The snapshot comes with the load; comparing needs no queries
+        with self.assertNumQueries(0):
+            application.annual_income = Decimal('99000')
+            self.assertTrue(application.has_changed('annual_income'))
+            self.assertEqual(application.old_value('annual_income'), Decimal('85000'))
+            self.assertFalse(application.has_changed('job_title'))
+
+        application.save()
+        self.assertFalse(application.has_changed('annual_income'))
+        self.assertEqual(application.old_value('annual_income'), Decimal('99000'))
+
+    def test_save_with_update_fields_only_refreshes_those_fields(self):
+        application = CreditApplication.objects.get(pk=self.create_application().pk)
+        application.status = 'UNDER_REVIEW'
+        application.job_title = 'Nurse'
+        application.save(update_fields=['status'])
+
+        self.assertEqual(application.old_value('status'), 'UNDER_REVIEW')
+        self.assertFalse(application.has_changed('status'))
+        self.assertEqual(application.old_value('job_title'), 'Teacher')
+        self.assertTrue(application.has_changed('job_title'))
+        self.assertTrue(ApplicationStatusHistory.objects.filter(
+            application=application, previous_status='DRAFT', new_status='UNDER_REVIEW'
+        ).exists())
+
+    def test_deferred_load_reads_missing_values_in_one_query(self):
+        pk = self.create_application().pk
+        application = CreditApplication.objects.only('id', 'status').get(pk=pk)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(application.old_value('annual_income'), Decimal('85000'))
+            self.assertEqual(application.old_value('job_title'), 'Teacher')
+            self.assertEqual(application.old_value('status'), 'DRAFT')
+
+    def test_unsaved_application_has_no_old_values(self):
+        application = CreditApplication(applicant=self.client_user, job_title='Teacher')
+        with self.assertNumQueries(0):
+            self.assertIsNone(application.old_value('job_title'))
+            self.assertTrue(application.has_changed('job_title'))
+        with self.assertRaises(ValueError):
+            application.old_value('notes')
+
+    def test_nested_save_from_post_save_handler(self):
+        analyst = User.objects.create_user(
+            'analyst@example.com', 'Str0ng-passw0rd', first_name='Kofi', last_name='Boateng', user_type='ANALYST'
+        )
+        # Creating a submitted application runs auto_assign_risk_analyst from post_save,
+        # which saves the same instance again with update_fields=['assigned_analyst']
+        application = self.create_application(status='SUBMITTED')
+
+        self.assertEqual(application.assigned_analyst, analyst)
+        self.assertEqual(CreditApplication.objects.get(pk=application.pk).assigned_analyst_id, analyst.pk)
+        # The nested save did not see a status change
+        self.assertFalse(ApplicationStatusHistory.objects.filter(application=application).exists())
+        with self.assertNumQueries(0):
+            self.assertEqual(application.old_value('status'), 'SUBMITTED')
+            self.assertFalse(application.has_changed('status'))
+            self.assertEqual(application.old_value('annual_income'), Decimal('85000'))
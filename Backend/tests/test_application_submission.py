@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the application submission flow
+Checks that one submission produces one background job, which stores the
+ML assessment, the risk assessment and the audit note
+
+Run with: python manage.py test tests -p test_application_submission.py
+"""
+
+import os
+import sys
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+import django
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+django.setup()
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from applications import tasks
+from applications.services import prepare_ml_input_data
+from applications.models import ApplicationNote, CreditApplication, MLCreditAssessment
+from applications.views import ApplicationSubmitView
+from risk.models import RiskAssessment
+from users.models import Role, User
+from ml_job_leases import LEASE_CLIENT, fresh_lease_client
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                            'LOCATION': 'application-submission-tests'}}
+
+
+class FakeRiskEngine:
+    """Stands in for the trained risk model, which needs the full applicant profile."""
+
+    def calculate_risk(self, application):
+        return RiskAssessment.objects.create(application=application, risk_score=520, probability_of_default=0.12)
+
+
+@override_settings(CACHES=LOCMEM_CACHE, ML_AUTO_TRIGGER_ON_SUBMIT=True, ML_PROVISIONAL_SCORE_ON_SUBMIT=True,
+                   ML_EXPLANATIONS_ON_SCORING=False, ML_COUNTERFACTUALS_ON_SCORING=False)
+class ApplicationSubmissionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Role.objects.create(name='Client User')
+        cls.client_user = User.objects.create_user(
+            'applicant@example.com', 'Str0ng-passw0rd', first_name='Ama', last_name='Mensah', user_type='CLIENT'
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.application = CreditApplication.objects.create(
+            applicant=self.client_user, status='DRAFT',
+            annual_income=Decimal('85000'), debt_to_income_ratio=Decimal('18.5'), interest_rate=Decimal('11.0'),
+            revolving_utilization=Decimal('35.0'), delinquencies_2yr=0, inquiries_6mo=1,
+            employment_length='5 years', open_accounts=9, collections_12mo=0, loan_amount=Decimal('20000'),
+            credit_history_length=Decimal('8.0'), max_bankcard_balance=Decimal('4000'), total_accounts=18,
+            revolving_accounts_12mo=2, public_records=0, home_ownership='RENT', job_title='Teacher'
+        )
+        for target, replacement in [
+            ('applications.tasks._lease_client', mock.Mock(return_value=fresh_lease_client())),
+            ('applications.tasks.RiskEngine', FakeRiskEngine),
+            ('applications.tasks.ml_notification_service', mock.Mock()),
+        ]:
+            patcher = mock.patch(target, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(tasks.process_ml_credit_assessment, 'apply_async')
+        self.apply_async = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def submit(self):
+        request = APIRequestFactory().post(f'/api/applications/{self.application.pk}/submit/',
+                                           {'confirm': True}, format='json')
+        force_authenticate(request, user=self.client_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            return ApplicationSubmitView.as_view()(request, pk=self.application.pk)
+
+    @unittest.skipIf(LEASE_CLIENT is None, 'needs fakeredis[lua] or a Redis server at ML_JOBS_TEST_REDIS_URL')
+    def test_submit_runs_one_job_with_all_submission_steps(self):
+        response = self.submit()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['assessment_queued'])
+        self.assertTrue(response.data['ml_prediction']['provisional'])
+        self.assertEqual(self.apply_async.call_count, 1)
+        # Nothing is stored before the job runs
+        self.assertFalse(MLCreditAssessment.objects.filter(application=self.application).exists())
+
+        args, kwargs = self.apply_async.call_args[0]
+        self.assertTrue(kwargs['on_submission'])
+        result = tasks.process_ml_credit_assessment.apply(args, kwargs).get()
+
+        self.assertEqual(result['status'], 'completed')
+        assessment = MLCreditAssessment.objects.get(application=self.application)
+        self.assertEqual(assessment.credit_score, response.data['ml_prediction']['credit_score'])
+        self.assertEqual(RiskAssessment.objects.filter(application=self.application).count(), 1)
+        notes = ApplicationNote.objects.filter(application=self.application,
+                                               note__startswith='Automatic ML Credit Score Generation')
+        self.assertEqual(notes.count(), 1)
+        self.assertEqual(self.apply_async.call_count, 1)
+
+    def test_incomplete_application_scored_with_background_defaults(self):
+        self.application.employment_length = ''
+        self.application.job_title = ''
+        self.application.open_accounts = None
+        self.application.total_accounts = None
+        self.application.max_bankcard_balance = None
+        self.application.save()
+
+        self.submit()
+        args, kwargs = self.apply_async.call_args[0]
+        ml_input = kwargs['provisional_result']['ml_input']
+        # Same input as the background job, so its defaults replace the old submit-time ones
+        self.assertEqual(ml_input, prepare_ml_input_data(self.application))
+        self.assertEqual(ml_input['emp_length'], '5 years')
+        self.assertEqual(ml_input['open_acc'], 8)
+        self.assertEqual(ml_input['total_acc'], 15)
+        self.assertEqual(ml_input['max_bal_bc'], 5000.0)
+        self.assertNotIn('emp_title', ml_input)
+
+    @override_settings(ML_AUTO_TRIGGER_ON_SUBMIT=False)
+    def test_submit_without_auto_trigger_stores_assessment_inline(self):
+        with mock.patch('applications.tasks.save_risk_explanations') as explanations, \
+                mock.patch('applications.tasks.save_counterfactual_explanations') as counterfactuals:
+            response = self.submit()
+        # Only the persistence steps run within the request
+        explanations.assert_not_called()
+        counterfactuals.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['assessment_queued'])
+        self.assertEqual(self.apply_async.call_count, 0)
+
+        assessment = MLCreditAssessment.objects.get(application=self.application)
+        self.assertEqual(assessment.credit_score, response.data['ml_prediction']['credit_score'])
+        self.assertEqual(RiskAssessment.objects.filter(application=self.application).count(), 1)
+        notes = ApplicationNote.objects.filter(application=self.application,
+                                               note__startswith='Automatic ML Credit Score Generation')
+        self.assertEqual(notes.count(), 1)
+
+    @override_settings(ML_AUTO_TRIGGER_ON_SUBMIT=False)
+    def test_submit_without_auto_trigger_assesses_risk_when_scoring_fails(self):
+        with mock.patch('applications.tasks.get_credit_scorer', side_effect=RuntimeError('model unavailable')), \
+                mock.patch('applications.views.ApplicationSubmitView._provisional_credit_score',
+                           return_value=({'success': False, 'status': 'pending'}, None)):
+            response = self.submit()
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(MLCreditAssessment.objects.filter(application=self.application).exists())
+        self.assertEqual(RiskAssessment.objects.filter(application=self.application).count(), 1)
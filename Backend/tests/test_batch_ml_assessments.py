@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk ML assessment scoring and saving
+Checks skip handling, bulk create/update and timestamps in assess_applications
+and save_ml_assessments, and the streaming mode of process_ml_assessments
+
+Run with: python manage.py test tests -p test_batch_ml_assessments.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+import django
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+django.setup()
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from applications.models import CreditApplication, MLCreditAssessment
+from applications.tasks import assess_applications, save_counterfactual_explanations, save_ml_assessments
+from users.models import Role, User
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                            'LOCATION': 'batch-ml-assessment-tests'}}
+
+PREDICTION = {'success': True, 'credit_score': 712, 'category': 'Good', 'risk_level': 'Medium Risk',
+              'confidence': 81.5, 'model_version': '2.0.0'}
+
+
+@override_settings(CACHES=LOCMEM_CACHE, ML_AUTO_TRIGGER_ON_SUBMIT=False,
+                   ML_EXPLANATIONS_ON_SCORING=False, ML_COUNTERFACTUALS_ON_SCORING=False)
+class BatchAssessmentTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Role.objects.create(name='Client User')
+        cls.client_user = User.objects.create_user(
+            'applicant@example.com', 'Str0ng-passw0rd', first_name='Ama', last_name='Mensah', user_type='CLIENT'
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def create_application(self, income='85000', job_title='Teacher'):
+        return CreditApplication.objects.create(
+            applicant=self.client_user, status='DRAFT', annual_income=Decimal(income),
+            debt_to_income_ratio=Decimal('18.5'), interest_rate=Decimal('11.0'), loan_amount=Decimal('20000'),
+            employment_length='5 years', job_title=job_title
+        )
+
+    def create_assessment(self, application, credit_score=600):
+        return MLCreditAssessment.objects.create(application=application, credit_score=credit_score,
+                                                 category='Fair', risk_level='High Risk', confidence=70.0)
+
+    def load(self, applications):
+        pks = [application.pk for application in applications]
+        loaded = CreditApplication.objects.select_related('ml_assessment').in_bulk(pks)
+        return [loaded[pk] for pk in pks]
+
+    def test_existing_and_locked_applications_are_skipped(self):
+        assessed, locked, new = (self.create_application() for _ in range(3))
+        self.create_assessment(assessed)
+        cache.set(f'ml_processing_{locked.id}', 'other-task')
+
+        results, saved = assess_applications(self.load([assessed, locked, new]))
+
+        self.assertEqual(results['skipped'], 2)
+        self.assertEqual(results['completed'], 1)
+        self.assertEqual([application.pk for application, _ in saved], [new.pk])
+        self.assertFalse(MLCreditAssessment.objects.filter(application=locked).exists())
+        self.assertEqual(MLCreditAssessment.objects.get(application=assessed).credit_score, 600)
+
+    def test_force_reprocess_updates_existing_and_creates_new(self):
+        existing_application, new_application = self.create_application(), self.create_application('42000')
+        existing = self.create_assessment(existing_application)
+
+        results, saved = assess_applications(self.load([existing_application, new_application]),
+                                             force_reprocess=True)
+
+        self.assertEqual(results['completed'], 2)
+        self.assertEqual(MLCreditAssessment.objects.count(), 2)
+        updated = MLCreditAssessment.objects.get(application=existing_application)
+        self.assertEqual(updated.pk, existing.pk)
+        self.assertEqual(updated.credit_score, saved[0][1].credit_score)
+        self.assertTrue(300 <= updated.credit_score <= 850)
+
+    def test_bulk_create_and_bulk_update_are_used(self):
+        applications = [self.create_application() for _ in range(4)]
+        for application in applications[:2]:
+            self.create_assessment(application)
+        manager = MLCreditAssessment.objects
+
+        with mock.patch.object(manager, 'bulk_create', wraps=manager.bulk_create) as bulk_create, \
+                mock.patch.object(manager, 'bulk_update', wraps=manager.bulk_update) as bulk_update:
+            save_ml_assessments(self.load(applications), [PREDICTION] * 4, [None] * 4, processing_time_ms=12)
+
+        bulk_create.assert_called_once()
+        self.assertEqual(len(bulk_create.call_args[0][0]), 2)
+        bulk_update.assert_called_once()
+        self.assertEqual(len(bulk_update.call_args[0][0]), 2)
+        self.assertEqual(set(MLCreditAssessment.objects.values_list('credit_score', flat=True)), {712})
+        self.assertEqual(set(MLCreditAssessment.objects.values_list('processing_time_ms', flat=True)), {12})
+
+    def test_timestamps_are_set_on_created_and_updated_assessments(self):
+        updated_application, created_application = self.create_application(), self.create_application()
+        old = self.create_assessment(updated_application)
+        long_ago = timezone.now() - timezone.timedelta(days=7)
+        MLCreditAssessment.objects.filter(pk=old.pk).update(prediction_timestamp=long_ago, last_updated=long_ago)
+        before = timezone.now()
+
+        save_ml_assessments(self.load([updated_application, created_application]), [PREDICTION] * 2, [None] * 2)
+
+        for application in (updated_application, created_application):
+            assessment = MLCreditAssessment.objects.get(application=application)
+            self.assertGreaterEqual(assessment.prediction_timestamp, before)
+            self.assertGreaterEqual(assessment.last_updated, before)
+
+    def test_assessment_created_concurrently_is_updated(self):
+        application = self.create_application()
+        loaded = self.load([application])
+        # Another task stores an assessment after this batch loaded the application
+        concurrent = self.create_assessment(application)
+
+        assessments = save_ml_assessments(loaded, [PREDICTION], [None])
+
+        self.assertEqual(assessments[0].pk, concurrent.pk)
+        self.assertEqual(MLCreditAssessment.objects.filter(application=application).count(), 1)
+        self.assertEqual(MLCreditAssessment.objects.get(application=application).credit_score, 712)
+
+    def test_parallel_command_saves_through_save_ml_assessments(self):
+        from applications.management.commands import process_ml_assessments
+
+        existing_application, new_application = self.create_application(), self.create_application()
+        self.create_assessment(existing_application)
+        applications = CreditApplication.objects.filter(pk__in=[existing_application.pk, new_application.pk])
+        command = process_ml_assessments.Command(stdout=StringIO())
+
+        with mock.patch('ml_model.src.parallel_scoring.iter_parallel_predictions',
+                        side_effect=lambda inputs, **kwargs: iter([PREDICTION] * len(inputs))), \
+                mock.patch.object(process_ml_assessments, 'save_ml_assessments',
+                                  wraps=save_ml_assessments) as save:
+            command.process_in_parallel(applications, {'force': True, 'chunk_size': 10, 'workers': 2})
+
+        save.assert_called_once()
+        self.assertEqual(len(save.call_args[0][0]), 2)
+        self.assertEqual(MLCreditAssessment.objects.count(), 2)
+        self.assertEqual(set(MLCreditAssessment.objects.values_list('credit_score', flat=True)), {712})
+
+    def test_counterfactuals_are_off_unless_enabled(self):
+        application = self.create_application()
+        with mock.patch('applications.tasks.CounterfactualService') as service:
+            with self.settings():
+                del settings.ML_COUNTERFACTUALS_ON_SCORING
+                self.assertEqual(save_counterfactual_explanations([application], [{}]), 0)
+            service.assert_not_called()
+
+            service.return_value.save_counterfactuals.return_value = ['scenario']
+            with self.settings(ML_COUNTERFACTUALS_ON_SCORING=True):
+                self.assertEqual(save_counterfactual_explanations([application], [{}]), 1)
+            service.return_value.save_counterfactuals.assert_called_once_with([application], [{}])
+
+
+@override_settings(CACHES=LOCMEM_CACHE, ML_AUTO_TRIGGER_ON_SUBMIT=False,
+                   ML_EXPLANATIONS_ON_SCORING=False, ML_COUNTERFACTUALS_ON_SCORING=False)
+class StreamingCommandTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Role.objects.create(name='Client User')
+        client_user = User.objects.create_user(
+            'applicant@example.com', 'Str0ng-passw0rd', first_name='Ama', last_name='Mensah', user_type='CLIENT'
+        )
+        for income in ('42000', '55000', '68000', '85000', '120000'):
+            CreditApplication.objects.create(
+                applicant=client_user, status='DRAFT', annual_income=Decimal(income),
+                debt_to_income_ratio=Decimal('18.5'), interest_rate=Decimal('11.0'), loan_amount=Decimal('20000'),
+                employment_length='5 years', job_title='Teacher'
+            )
+        cls.pks = list(CreditApplication.objects.order_by('pk').values_list('pk', flat=True))
+
+    def setUp(self):
+        cache.clear()
+        self.checkpoint = os.path.join(tempfile.mkdtemp(), 'ml-stream.json')
+
+    def stream(self, **options):
+        from applications.management.commands import process_ml_assessments
+        with mock.patch.object(process_ml_assessments, 'assess_applications', wraps=assess_applications) as assess:
+            call_command('process_ml_assessments', stream=True, chunk_size=2, checkpoint=self.checkpoint,
+                         stdout=StringIO(), **options)
+        return assess
+
+    def test_pages_are_assessed_in_key_order(self):
+        assess = self.stream()
+
+        self.assertEqual([[application.pk for application in call[0][0]] for call in assess.call_args_list],
+                         [self.pks[0:2], self.pks[2:4], self.pks[4:]])
+        self.assertEqual(MLCreditAssessment.objects.count(), 5)
+        # A finished run leaves no checkpoint behind
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_interrupted_run_resumes_after_checkpoint(self):
+        from applications.management.commands import process_ml_assessments
+        calls = []
+
+        def fail_on_second_page(applications, force_reprocess=False):
+            calls.append(applications)
+            if len(calls) == 2:
+                raise RuntimeError('worker killed')
+            return assess_applications(applications, force_reprocess)
+
+        with mock.patch.object(process_ml_assessments, 'assess_applications', side_effect=fail_on_second_page):
+            with self.assertRaises(RuntimeError):
+                call_command('process_ml_assessments', stream=True, chunk_size=2, checkpoint=self.checkpoint,
+                             stdout=StringIO())
+
+        with open(self.checkpoint) as f:
+            checkpoint = json.load(f)
+        self.assertEqual(checkpoint['last_id'], str(self.pks[1]))
+        self.assertEqual(checkpoint['processed'], 2)
+        self.assertEqual(checkpoint['completed'], 2)
+
+        assess = self.stream(resume=True)
+
+        self.assertEqual([application.pk for application in assess.call_args_list[0][0][0]], self.pks[2:4])
+        self.assertEqual(assess.call_count, 2)
+        self.assertEqual(MLCreditAssessment.objects.count(), 5)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    def test_resume_requires_checkpoint(self):
+        from applications.management.commands import process_ml_assessments
+        out = StringIO()
+        with mock.patch.object(process_ml_assessments, 'assess_applications') as assess:
+            call_command('process_ml_assessments', stream=True, resume=True, stdout=out)
+
+        assess.assert_not_called()
+        self.assertIn('--resume requires --checkpoint', out.getvalue())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for batched inference in CreditScorer.batch_predict
+Checks one model call per batch, per-row error isolation and the per-row fallback
+"""
+
+import os
+import sys
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring_helpers import load_scorer
+
+
+def _uncached_scorer():
+    """Loaded scorer that bypasses the shared prediction cache."""
+    scorer = load_scorer()
+    scorer._get_prediction_cache = lambda: None
+    return scorer
+
+
+def _count_model_calls(scorer):
+    """Wrap _predict_raw on the instance and return the list of batch sizes it saw."""
+    calls = []
+    predict_raw = scorer._predict_raw
+
+    def counting_predict_raw(features):
+        calls.append(len(features))
+        return predict_raw(features)
+
+    scorer._predict_raw = counting_predict_raw
+    return calls
+
+
+def _applications(scorer, count=20):
+    sample = scorer._get_sample_data()
+    return [dict(sample, annual_inc=20000 + 5000 * i, dti=5.0 + i, emp_title=title)
+            for i, title in zip(range(count), ['Teacher', 'Nurse', 'Cocoa Farmer', 'Software Engineer'] * count)]
+
+
+def test_valid_rows_share_one_model_call():
+    """A batch of valid applications is scored with a single model call."""
+    scorer = _uncached_scorer()
+    applications = _applications(scorer)
+    calls = _count_model_calls(scorer)
+
+    results = scorer.batch_predict(applications)
+
+    assert calls == [len(applications)]
+    assert all(result['success'] for result in results)
+    assert [result['batch_index'] for result in results] == list(range(len(applications)))
+
+
+def test_batch_scores_match_single_predictions():
+    """Each batched score equals the score of predicting that application alone."""
+    scorer = _uncached_scorer()
+    applications = _applications(scorer)
+    results = scorer.batch_predict(applications)
+
+    for i, application in enumerate(applications):
+        single = scorer.predict_credit_score(application, use_cache=False)
+        assert results[i]['credit_score'] == single['credit_score'], f"row {i}"
+        assert results[i]['category'] == single['category'], f"row {i}"
+        assert abs(results[i]['raw_prediction'] - single['raw_prediction']) < 1e-6, f"row {i}"
+
+
+def test_invalid_rows_get_their_own_errors():
+    """Rows failing validation get error results in place; the others are still batch scored."""
+    scorer = _uncached_scorer()
+    applications = _applications(scorer, count=4)
+    applications.insert(1, {'annual_inc': 50000})
+    calls = _count_model_calls(scorer)
+
+    results = scorer.batch_predict(applications)
+
+    assert [result['success'] for result in results] == [True, False, True, True, True]
+    assert results[1]['batch_index'] == 1 and results[1]['error']
+    assert calls == [4]
+
+
+def test_batch_failure_falls_back_to_per_row_scoring():
+    """If the batched model call fails, every row is scored on its own."""
+    scorer = _uncached_scorer()
+    applications = _applications(scorer, count=3)
+    expected = [scorer.predict_credit_score(application, use_cache=False)['credit_score']
+                for application in applications]
+
+    def broken(*args, **kwargs):
+        raise RuntimeError('booster unavailable')
+
+    scorer._score_feature_matrix = broken
+    results = scorer.batch_predict(applications)
+
+    assert [result['credit_score'] for result in results] == expected
+    assert [result['batch_index'] for result in results] == [0, 1, 2]
+
+
+def test_unloaded_scorer_returns_error_rows():
+    """Without a loaded model every row reports an error instead of raising."""
+    scorer = _uncached_scorer()
+    applications = _applications(scorer, count=2)
+    scorer.is_loaded = False
+    scorer.model = None
+
+    results = scorer.batch_predict(applications)
+
+    assert len(results) == 2
+    assert not any(result['success'] for result in results)
+
+
+def main():
+    """Run all batch prediction tests"""
+    tests = [
+        test_valid_rows_share_one_model_call,
+        test_batch_scores_match_single_predictions,
+        test_invalid_rows_get_their_own_errors,
+        test_batch_failure_falls_back_to_per_row_scoring,
+        test_unloaded_scorer_returns_error_rows,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
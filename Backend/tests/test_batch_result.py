@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for compact batch scoring results
+Checks that the column-oriented result reproduces the legacy per-row dicts
+"""
+
+import json
+import os
+import pickle
+import sys
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.src.batch_result import BatchScoringResult
+from scoring_helpers import load_scorer
+
+
+def _applications(scorer):
+    sample = scorer._get_sample_data()
+    return [
+        sample,
+        dict(sample, annual_inc=25000, dti=40.0, emp_title='Cocoa Farmer'),
+        {'annual_inc': 50000},  # fails validation
+        dict(sample, revol_util=95.0, delinq_2yrs=3, emp_title='Teacher'),
+    ]
+
+
+def _without_timestamp(result):
+    return {key: value for key, value in result.items() if key != 'prediction_timestamp'}
+
+
+def test_compact_matches_per_row_results():
+    """to_dicts() gives the same rows as scoring each application on its own."""
+    scorer = load_scorer()
+    applications = _applications(scorer)
+    result = scorer.batch_predict_compact(applications)
+
+    assert len(result) == len(applications)
+    assert [row['batch_index'] for row in result] == list(range(len(applications)))
+    for i, application in enumerate(applications):
+        single = scorer.predict_credit_score(application)
+        row = result.to_dict(i)
+        assert row['success'] == single['success']
+        if single['success']:
+            row = dict(row)
+            row.pop('batch_index')
+            assert _without_timestamp(row) == _without_timestamp(single), f"row {i} differs"
+
+
+def test_value_and_columns_match_dicts():
+    """value(), confidence_factors() and to_columns() agree with the full dicts."""
+    scorer = load_scorer()
+    result = scorer.batch_predict_compact(_applications(scorer))
+    rows = result.to_dicts()
+    columns = result.to_columns()
+
+    for i, row in enumerate(rows):
+        for name in BatchScoringResult.COLUMN_NAMES:
+            assert result.value(i, name) == row.get(name), f"value({i}, {name!r})"
+            assert columns[name][i] == row.get(name), f"to_columns()[{name!r}][{i}]"
+        assert result.confidence_factors(i) == row.get('confidence_factors')
+    assert not result.value(2, 'success') and result.value(2, 'error')
+    assert isinstance(result.value(0, 'credit_score'), int)
+    # Plain Python values, as the old batch_predict returned
+    assert type(rows[0]['confidence']) is float
+
+
+def test_json_and_pickle_round_trip():
+    """The compact form is JSON-serializable and the result pickles for worker processes."""
+    scorer = load_scorer()
+    result = scorer.batch_predict_compact(_applications(scorer))
+
+    decoded = json.loads(result.to_json())
+    assert decoded['count'] == len(result)
+    assert decoded['columns'] == result.to_columns()
+    assert decoded['metadata']['model_version'] == result.metadata['model_version']
+
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored.to_dicts() == result.to_dicts()
+
+
+def test_batch_predict_keeps_legacy_format():
+    """batch_predict still returns a list of dicts."""
+    scorer = load_scorer()
+    results = scorer.batch_predict(_applications(scorer))
+    assert isinstance(results, list) and all(isinstance(row, dict) for row in results)
+    assert scorer.batch_predict([]) == []
+
+
+def main():
+    """Run all batch result tests"""
+    tests = [test_compact_matches_per_row_results, test_value_and_columns_match_dicts,
+             test_json_and_pickle_round_trip, test_batch_predict_keeps_legacy_format]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
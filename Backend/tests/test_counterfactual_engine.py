@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched counterfactual search
+Checks projected scores against per-application predictions on the deployed model
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring_helpers import load_scorer
+
+
+def _applications(scorer, n_rows=60, seed=5):
+    """Sample applications with varied actionable features."""
+    rng = np.random.default_rng(seed)
+    applications = []
+    for _ in range(n_rows):
+        application = dict(scorer._get_sample_data())
+        application.update({
+            'dti': float(rng.uniform(5, 45)),
+            'revol_util': float(rng.uniform(5, 95)),
+            'loan_amnt': float(rng.uniform(2000, 40000)),
+            'int_rate': float(rng.uniform(5, 30)),
+            'inq_last_6mths': int(rng.integers(0, 6)),
+            'delinq_2yrs': int(rng.integers(0, 3)),
+        })
+        applications.append(application)
+    return applications
+
+
+def test_projected_scores_match_single_predictions():
+    """Every scenario's projected score equals scoring the changed application on its own."""
+    scorer = load_scorer()
+    applications = _applications(scorer)
+    results = scorer.counterfactuals_batch(applications)
+
+    assert any(result['counterfactuals'] for result in results)
+    for application, result in zip(applications, results):
+        assert result['success']
+        assert result['credit_score'] == scorer.predict_credit_score(application)['credit_score']
+        features = scorer._preprocess_single_application(application).iloc[:, :16]
+        for counterfactual in result['counterfactuals']:
+            changed = features.copy()
+            for feature, change in counterfactual['required_changes'].items():
+                changed[feature] = change['target']
+            projected = scorer._scale_raw_prediction_to_credit_score(float(scorer.model.predict(changed)[0]))
+            assert projected == counterfactual['projected_score']
+
+
+def test_scenarios_reach_next_category():
+    """Scenarios land in the next category and no kept scenario contains another."""
+    scorer = load_scorer()
+    category_floors = {category: min_score for (min_score, _), (category, _) in scorer.score_categories.items()}
+    for result in scorer.counterfactuals_batch(_applications(scorer)):
+        feature_sets = [set(c['required_changes']) for c in result['counterfactuals']]
+        for counterfactual in result['counterfactuals']:
+            assert counterfactual['target_category'] != scorer._get_score_category_and_risk(result['credit_score'])[0]
+            assert counterfactual['projected_score'] >= category_floors[counterfactual['target_category']]
+        for i, first in enumerate(feature_sets):
+            assert not any(j != i and second < first for j, second in enumerate(feature_sets))
+
+
+def test_invalid_applications_keep_their_position():
+    """Invalid input gets an error response at its own batch index."""
+    scorer = load_scorer()
+    applications = _applications(scorer, n_rows=3)
+    applications[1] = {'annual_inc': 'not a number'}
+    results = scorer.counterfactuals_batch(applications)
+
+    assert [result['batch_index'] for result in results] == [0, 1, 2]
+    assert results[0]['success'] and results[2]['success']
+    assert not results[1]['success']
+
+
+def main():
+    """Run all counterfactual tests"""
+    tests = [test_projected_scores_match_single_predictions, test_scenarios_reach_next_category,
+             test_invalid_applications_keep_their_position]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the inference server metrics endpoints
+Checks that scoring metrics are only served with the ML_METRICS_TOKEN bearer token
+"""
+
+import os
+import sys
+
+# Add the Backend and ml_model directories to the Python path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'ml_model'))
+
+from fastapi.testclient import TestClient
+
+import fastapi_integration
+
+# No context manager: the startup event (model load) is not needed for these routes
+client = TestClient(fastapi_integration.app)
+
+
+def _with_token(token):
+    """Set (or with None, unset) ML_METRICS_TOKEN and return the previous value."""
+    previous = os.environ.get('ML_METRICS_TOKEN')
+    if token is None:
+        os.environ.pop('ML_METRICS_TOKEN', None)
+    else:
+        os.environ['ML_METRICS_TOKEN'] = token
+    return previous
+
+
+def test_metrics_require_bearer_token():
+    """/metrics answers 401 without the token and serves Prometheus text with it."""
+    previous = _with_token('scrape-secret')
+    try:
+        assert client.get('/metrics').status_code == 401
+        assert client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+        response = client.get('/metrics', headers={'Authorization': 'Bearer scrape-secret'})
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('text/plain')
+    finally:
+        _with_token(previous)
+
+
+def test_metrics_disabled_without_configured_token():
+    """With no ML_METRICS_TOKEN set, nobody can read the metrics."""
+    previous = _with_token(None)
+    try:
+        assert client.get('/metrics', headers={'Authorization': 'Bearer '}).status_code == 401
+    finally:
+        _with_token(previous)
+
+
+def test_status_omits_scoring_metrics():
+    """The unauthenticated status payload carries no request counters or timings."""
+    response = client.get('/api/v1/status')
+    assert response.status_code == 200
+    assert 'scoring_metrics' not in response.json()
+
+
+def main():
+    """Run all metrics endpoint tests"""
+    tests = [test_metrics_require_bearer_token, test_metrics_disabled_without_configured_token,
+             test_status_omits_scoring_metrics]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-application feature context
+Checks that Ghana employment values are derived once per prediction and
+match what preprocessing and the reported analysis use
+"""
+
+import os
+import sys
+from unittest import mock
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model import final_preprocessor
+from ml_model.final_preprocessor import FeatureContext, GHANA_FEATURES, preprocess_for_prediction_final
+from scoring_helpers import load_scorer
+
+
+def _application(**overrides):
+    application = {
+        'annual_inc': 72000, 'dti': 18.5, 'int_rate': 11.2, 'revol_util': 35.0, 'delinq_2yrs': 0,
+        'inq_last_6mths': 1, 'emp_length': '5 years', 'emp_title': 'Teacher', 'open_acc': 9,
+        'collections_12_mths_ex_med': 0, 'loan_amnt': 20000, 'credit_history_length': 8.0,
+        'max_bal_bc': 4000, 'total_acc': 18, 'open_rv_12m': 2, 'pub_rec': 0, 'home_ownership': 'RENT'
+    }
+    application.update(overrides)
+    return application
+
+
+def _counting_ghana_functions():
+    """Patch the Ghana helpers used by FeatureContext with call-counting wrappers."""
+    return (
+        mock.patch.object(final_preprocessor, 'categorize_ghana_job_title',
+                          wraps=final_preprocessor.categorize_ghana_job_title),
+        mock.patch.object(final_preprocessor, 'calculate_ghana_employment_score',
+                          wraps=final_preprocessor.calculate_ghana_employment_score)
+    )
+
+
+def test_ghana_values_are_computed_once():
+    """Repeated access to the category, score and features reuses the first computation."""
+    categorize_patch, employment_patch = _counting_ghana_functions()
+    with categorize_patch as categorize, employment_patch as employment:
+        context = FeatureContext(_application())
+        for _ in range(3):
+            context.job_category
+            context.employment
+            context.ghana_features
+            context.employment_analysis()
+
+    assert categorize.call_count == 1
+    assert employment.call_count == 1
+
+
+def test_preprocessing_uses_and_keeps_the_context():
+    """Preprocessing with a context matches preprocessing without one and stores the frame."""
+    application = _application(emp_title='Bank Manager')
+    context = FeatureContext(application)
+    processed = preprocess_for_prediction_final(application, None, context=context)
+
+    assert context.processed_data is processed
+    assert processed.equals(preprocess_for_prediction_final(application, None))
+    for feature in GHANA_FEATURES:
+        assert processed[feature].iloc[0] == context.ghana_features[feature]
+
+
+def test_missing_title_is_reported_as_other():
+    """Without emp_title the reported analysis uses 'Other' while the features use the empty title."""
+    application = _application()
+    del application['emp_title']
+    context = FeatureContext(application)
+
+    emp_title, job_category, employment = context.employment_analysis()
+    assert emp_title == 'Other'
+    assert job_category == final_preprocessor.categorize_ghana_job_title('Other')
+    assert context.emp_title == ''
+    assert context.job_category == final_preprocessor.categorize_ghana_job_title('')
+    assert employment == final_preprocessor.calculate_ghana_employment_score('5 years', job_category, 72000)
+
+
+def test_given_title_shares_the_feature_analysis():
+    """With emp_title set, the reported analysis is the one behind the features."""
+    context = FeatureContext(_application())
+    emp_title, job_category, employment = context.employment_analysis()
+    assert emp_title == 'Teacher'
+    assert job_category == context.job_category
+    assert employment is context.employment
+
+
+def test_prediction_derives_ghana_values_once():
+    """One prediction categorizes the job title and scores employment a single time."""
+    scorer = load_scorer()
+    application = _application(emp_title='Software Engineer')
+    categorize_patch, employment_patch = _counting_ghana_functions()
+    with categorize_patch as categorize, employment_patch as employment:
+        result = scorer.predict_credit_score(application, use_cache=False)
+
+    assert result['success']
+    assert categorize.call_count == 1
+    assert employment.call_count == 1
+    context = FeatureContext(application)
+    assert result['job_category'] == context.job_category
+    assert result['ghana_employment_score'] == context.employment['total_employment_score']
+
+
+def main():
+    """Run all feature context tests"""
+    tests = [
+        test_ghana_values_are_computed_once,
+        test_preprocessing_uses_and_keeps_the_context,
+        test_missing_title_is_reported_as_other,
+        test_given_title_shares_the_feature_analysis,
+        test_prediction_derives_ghana_values_once,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the batch preprocessing path
+Checks preprocess_batch_final against preprocess_for_prediction_final row by row
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.final_preprocessor import (
+    EXPECTED_FEATURES,
+    GHANA_FEATURES,
+    preprocess_batch_final,
+    preprocess_for_prediction_final
+)
+
+
+def _application(**overrides):
+    application = {
+        'annual_inc': 72000, 'dti': 18.5, 'int_rate': 11.2, 'revol_util': 35.0, 'delinq_2yrs': 0,
+        'inq_last_6mths': 1, 'emp_length': '5 years', 'emp_title': 'Teacher', 'open_acc': 9,
+        'collections_12_mths_ex_med': 0, 'loan_amnt': 20000, 'credit_history_length': 8.0,
+        'max_bal_bc': 4000, 'total_acc': 18, 'open_rv_12m': 2, 'pub_rec': 0, 'home_ownership': 'RENT'
+    }
+    application.update(overrides)
+    return application
+
+
+def _single_rows(records):
+    columns = EXPECTED_FEATURES + GHANA_FEATURES
+    return np.vstack([preprocess_for_prediction_final(record, None)[columns].to_numpy(dtype='float64')
+                      for record in records])
+
+
+def _assert_parity(records):
+    batch = preprocess_batch_final(records, include_ghana_features=True)
+    single = _single_rows(records)
+    assert np.array_equal(batch, single, equal_nan=True), np.argwhere(~np.isclose(batch, single, equal_nan=True))
+
+
+def test_batch_matches_single_rows():
+    """Complete and partially missing applications give the same features in both paths."""
+    records = [
+        _application(),
+        _application(emp_title='Bank Manager', emp_length='10+ years', home_ownership='OWN'),
+        _application(annual_inc=None, dti=None, emp_length='< 1 year'),
+        {key: value for key, value in _application().items() if key not in ('emp_title', 'emp_length')},
+    ]
+    _assert_parity(records)
+
+
+def test_missing_titles_are_not_confused_with_their_strings():
+    """None/'None' and NaN/'nan' are separate inputs, whichever comes first in the batch."""
+    titles = [None, 'None', float('nan'), 'nan', '', 'Teacher']
+    lengths = [None, 'None', '5 years', 'nan', '2 years', None]
+    records = [_application(emp_title=title, emp_length=length) for title, length in zip(titles, lengths)]
+    _assert_parity(records)
+    _assert_parity(records[::-1])
+
+
+def main():
+    """Run all parity tests"""
+    tests = [test_batch_matches_single_rows, test_missing_titles_are_not_confused_with_their_strings]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the columnar Ghana employment feature processor
+Checks process_ghana_employment_features against calculate_ghana_employment_score row by row
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.ghana_employment_processor import (
+    calculate_ghana_employment_score,
+    categorize_ghana_job_title,
+    get_ghana_job_stability_score,
+    process_ghana_employment_features
+)
+
+
+def _sample_frame(n_rows=5000, seed=7):
+    """Mixed titles, lengths and incomes including missing values."""
+    rng = np.random.default_rng(seed)
+    titles = np.array(['Bank Manager', 'Teacher', 'Uber Driver', '', 'Medical Officer', 'Cocoa Farmer',
+                       'Security Guard', 'House Help', 'Clerk', None, np.nan], dtype=object)
+    lengths = np.array(['< 1 year', '1 year', '3 years', '5 years', '7 years', '9 years',
+                        '10+ years', 'n/a', None, np.nan], dtype=object)
+    df = pd.DataFrame({
+        'emp_title': rng.choice(titles, n_rows),
+        'emp_length': rng.choice(lengths, n_rows),
+        'annual_inc': rng.uniform(0, 400000, n_rows)
+    })
+    df.loc[::37, 'annual_inc'] = np.nan
+    return df
+
+
+def _expected_columns(df):
+    """Per-row reference built from the scalar functions."""
+    n_rows = len(df)
+    titles = df['emp_title'].tolist() if 'emp_title' in df.columns else None
+    categories = [categorize_ghana_job_title(t) for t in titles] if titles is not None else ['Other Services'] * n_rows
+    lengths = df['emp_length'].tolist() if 'emp_length' in df.columns else ['5 years'] * n_rows
+    incomes = df['annual_inc'].tolist() if 'annual_inc' in df.columns else [None] * n_rows
+
+    scores = [calculate_ghana_employment_score(length, category, income)
+              for length, category, income in zip(lengths, categories, incomes)]
+    expected = {f'ghana_{key}': [score[key] for score in scores]
+                for key in scores[0] if key != 'expected_income_range_monthly'}
+    return expected
+
+
+def test_columns_match_scalar_scores():
+    """Every generated column equals the scalar calculation for each row."""
+    df = _sample_frame()
+    for frame in [df, df.drop(columns='annual_inc'), df.drop(columns='emp_title'), df.drop(columns='emp_length'),
+                  df.assign(annual_inc=df['annual_inc'].astype(object).where(df.index % 5 != 0, None))]:
+        result = process_ghana_employment_features(frame)
+        for column, values in _expected_columns(frame).items():
+            assert result[column].tolist() == values, column
+
+
+def test_original_columns_preserved():
+    """Input columns and index are kept and the input frame is not modified."""
+    df = _sample_frame(n_rows=200).set_index(pd.RangeIndex(1000, 1200))
+    before = df.copy()
+    result = process_ghana_employment_features(df)
+
+    pd.testing.assert_frame_equal(df, before)
+    pd.testing.assert_frame_equal(result[df.columns], df)
+    assert result['ghana_job_category'].map(get_ghana_job_stability_score).notna().all()
+
+
+def main():
+    """Run all parity tests"""
+    tests = [test_columns_match_scalar_scores, test_original_columns_preserved]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
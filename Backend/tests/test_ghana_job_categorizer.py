@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the compiled Ghana job title categorizer
+Checks categorize_ghana_job_title and categorize_ghana_job_titles against the
+original sequential keyword scans
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.ghana_employment_processor import (
+    GHANA_JOB_CATEGORY_KEYWORDS,
+    categorize_ghana_job_title,
+    categorize_ghana_job_titles
+)
+
+
+def legacy_categorize_ghana_job_title(title: str) -> str:
+    """Sequential keyword scans the compiled matcher replaced, kept as the parity reference."""
+    if pd.isna(title) or title == '':
+        return 'Unknown'
+    
+    title = str(title).lower().strip()
+    
+    # HIGH-INCOME PROFESSIONAL SECTORS (Most stable)
+    # Banking & Financial Services (Very developed in Ghana)
+    if any(word in title for word in ['bank', 'finance', 'financial', 'accounting', 'accountant', 'auditor', 'treasury']):
+        return 'Banking & Finance'
+    
+    # Mining & Oil/Gas (Major economic drivers)
+    if any(word in title for word in ['mining', 'mine', 'gold', 'oil', 'gas', 'petroleum', 'drilling', 'exploration']):
+        return 'Mining & Energy'
+    
+    # Telecommunications (Strong sector in Ghana)
+    if any(word in title for word in ['telecom', 'telecommunications', 'network', 'mtn', 'vodafone', 'airtel']):
+        return 'Telecommunications'
+    
+    # Medical & Healthcare
+    if any(word in title for word in ['doctor', 'physician', 'surgeon', 'dentist', 'pharmacist', 'medical officer']):
+        return 'Medical Professional'
+    elif any(word in title for word in ['nurse', 'midwife', 'medical', 'health', 'clinical']):
+        return 'Healthcare Worker'
+    
+    # Legal & Professional Services
+    if any(word in title for word in ['lawyer', 'attorney', 'barrister', 'solicitor', 'legal', 'counsel']):
+        return 'Legal Professional'
+    
+    # Engineering & Technical (Infrastructure development focus)
+    if any(word in title for word in ['engineer', 'engineering', 'technical', 'architect', 'surveyor']):
+        return 'Engineering & Technical'
+    
+    # GOVERNMENT & PUBLIC SECTOR (Very stable in Ghana)
+    if any(word in title for word in ['government', 'civil service', 'ministry', 'assembly', 'municipal', 'district', 'public service', 'ghana revenue', 'immigration', 'customs']):
+        return 'Government Worker'
+    
+    # EDUCATION SECTOR
+    if any(word in title for word in ['teacher', 'lecturer', 'professor', 'educator', 'principal', 'headmaster', 'university', 'polytechnic']):
+        return 'Education Professional'
+    
+    # MANAGEMENT & EXECUTIVE ROLES
+    if any(word in title for word in ['manager', 'director', 'executive', 'president', 'ceo', 'managing director', 'general manager']):
+        return 'Management Executive'
+    elif any(word in title for word in ['supervisor', 'team lead', 'coordinator', 'assistant manager']):
+        return 'Supervisory Role'
+    
+    # BUSINESS & ENTREPRENEURSHIP (Very common in Ghana)
+    if any(word in title for word in ['owner', 'entrepreneur', 'business owner', 'proprietor', 'trader', 'merchant']):
+        return 'Business Owner/Trader'
+    
+    # AGRICULTURE & AGRIBUSINESS (21% of GDP)
+    if any(word in title for word in ['farmer', 'agriculture', 'agric', 'cocoa', 'plantation', 'farming', 'fisherman', 'fishing']):
+        return 'Agriculture & Fishing'
+    
+    # MANUFACTURING & INDUSTRY
+    if any(word in title for word in ['manufacturing', 'factory', 'production', 'assembly', 'industrial', 'brewery', 'textiles']):
+        return 'Manufacturing'
+    
+    # CONSTRUCTION & REAL ESTATE (Growing sector)
+    if any(word in title for word in ['construction', 'contractor', 'builder', 'real estate', 'property', 'estate']):
+        return 'Construction & Real Estate'
+    
+    # SKILLED TRADES
+    if any(word in title for word in ['electrician', 'plumber', 'mechanic', 'welder', 'carpenter', 'mason', 'technician']):
+        return 'Skilled Trades'
+    
+    # TRANSPORTATION (Important due to logistics)
+    if any(word in title for word in ['driver', 'transport', 'logistics', 'delivery', 'truck', 'taxi', 'uber', 'bolt']):
+        return 'Transportation & Logistics'
+    
+    # RETAIL & SALES
+    if any(word in title for word in ['sales', 'retail', 'shop', 'store', 'marketing', 'customer service', 'cashier']):
+        return 'Retail & Sales'
+    
+    # HOSPITALITY & TOURISM
+    if any(word in title for word in ['hotel', 'restaurant', 'tourism', 'hospitality', 'chef', 'cook', 'waiter', 'bartender']):
+        return 'Hospitality & Tourism'
+    
+    # SECURITY SERVICES (Common employment)
+    if any(word in title for word in ['security', 'guard', 'watchman', 'police', 'military']):
+        return 'Security Services'
+    
+    # DOMESTIC & SERVICE WORKERS
+    if any(word in title for word in ['domestic', 'house help', 'cleaner', 'gardener', 'laundry']):
+        return 'Domestic Services'
+    
+    # MEDIA & CREATIVE
+    if any(word in title for word in ['journalist', 'media', 'radio', 'television', 'artist', 'musician', 'photographer']):
+        return 'Media & Creative'
+    
+    return 'Other Services'
+
+
+def _sample_titles(count=5000, seed=42):
+    """Known titles, every keyword, keyword combinations and random noise."""
+    keywords = [keyword for _, words in GHANA_JOB_CATEGORY_KEYWORDS for keyword in words]
+    titles = [
+        "Bank Manager", "Software Engineer", "Market Trader", "Government Worker", "Teacher",
+        "Senior Medical Officer", "Medical Doctor", "Assembly Line Worker", "District Assembly Clerk",
+        "Managing Director", "Assistant Manager", "Real Estate Agent", "Uber Driver", "Cocoa Farmer",
+        "Gold Mine Supervisor", "MTN Customer Service", "Unemployed", "Student", "  NURSE  ",
+        "", "   ", "Accountant/Auditor", "Head of Security", "Chef de cuisine", "Radio Presenter"
+    ]
+    titles.extend(keywords)
+    titles.extend(keyword.upper() for keyword in keywords)
+
+    rng = random.Random(seed)
+    filler = ['senior', 'junior', 'chief', 'assistant', 'of', 'the', 'and', '-', '/', 'accra', 'kumasi', 'x']
+    for _ in range(count):
+        words = rng.sample(keywords, rng.randint(1, 3)) + rng.sample(filler, rng.randint(0, 3))
+        rng.shuffle(words)
+        separator = rng.choice([' ', '', '-'])
+        titles.append(separator.join(words))
+    return titles
+
+
+def test_single_title_parity():
+    """Compiled matcher returns the same category as the sequential scans."""
+    mismatches = [
+        (title, legacy_categorize_ghana_job_title(title), categorize_ghana_job_title(title))
+        for title in _sample_titles()
+        if legacy_categorize_ghana_job_title(title) != categorize_ghana_job_title(title)
+    ]
+    assert not mismatches, f"Category mismatches: {mismatches[:10]}"
+
+
+def test_missing_and_non_string_titles():
+    """Missing values and non-string titles are handled as before."""
+    for title in [None, np.nan, pd.NA, '', 0, 123, 4.5, True]:
+        assert categorize_ghana_job_title(title) == legacy_categorize_ghana_job_title(title), title
+
+
+def test_series_parity():
+    """Vectorized variant matches the scalar function row by row and keeps the index."""
+    titles = _sample_titles(count=2000) + [None, np.nan, 'Bank Manager', 'bank manager']
+    series = pd.Series(titles, index=range(100, 100 + len(titles)), name='emp_title', dtype=object)
+
+    result = categorize_ghana_job_titles(series)
+    expected = [legacy_categorize_ghana_job_title(title) for title in titles]
+
+    assert list(result) == expected
+    assert result.index.equals(series.index)
+    assert result.name == 'emp_title'
+    assert list(categorize_ghana_job_titles(titles)) == expected
+
+
+def main():
+    """Run all parity tests"""
+    tests = [test_single_title_parity, test_missing_and_non_string_titles, test_series_parity]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
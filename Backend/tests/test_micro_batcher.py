@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the inference server micro-batcher
+Checks batching and that stopping never leaves a request waiting
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.src.micro_batcher import MicroBatcher
+
+
+def _slow_double(items):
+    time.sleep(0.05)
+    return [{'value': item['value'] * 2} for item in items]
+
+
+def test_concurrent_items_share_a_batch():
+    """Items submitted together are scored in one call and resolve in order."""
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = MicroBatcher(_slow_double, executor, max_batch_size=8, max_wait_ms=20)
+            await batcher.start()
+            results = await asyncio.gather(*(batcher.submit({'value': i}) for i in range(8)))
+            await batcher.stop()
+            return results, batcher.stats()
+
+    results, stats = asyncio.run(run())
+    assert [r['value'] for r in results] == [i * 2 for i in range(8)]
+    assert stats['batches'] == 1 and stats['items'] == 8
+
+
+def test_stop_scores_queued_and_collecting_items():
+    """stop() resolves every item taken or queued before it, then rejects new ones."""
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = MicroBatcher(_slow_double, executor, max_batch_size=4, max_wait_ms=1000,
+                                   max_concurrent_batches=1)
+            await batcher.start()
+            waiting = [asyncio.create_task(batcher.submit({'value': i})) for i in range(10)]
+            await asyncio.sleep(0.01)  # first batch scoring, second collecting, rest queued
+            await asyncio.wait_for(batcher.stop(), 5)
+            results = await asyncio.wait_for(asyncio.gather(*waiting), 1)
+            try:
+                await batcher.submit({'value': 99})
+                rejected = False
+            except RuntimeError:
+                rejected = True
+            return results, rejected
+
+    results, rejected = asyncio.run(run())
+    assert [r['value'] for r in results] == [i * 2 for i in range(10)]
+    assert rejected
+
+
+def main():
+    """Run all micro-batcher tests"""
+    tests = [test_concurrent_items_share_a_batch, test_stop_scores_queued_and_collecting_items]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the ml_api batch prediction endpoint
+Checks that a batch request is scored with one batched call and that
+failing items keep their place in the response
+
+Run with: python manage.py test tests -p test_ml_api_batch.py
+"""
+
+import os
+import sys
+from unittest import mock
+
+import django
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+django.setup()
+
+from django.conf import settings
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from ml_api.views import _to_ml_input, batch_predict_credit_scores
+from ml_api.serializers import MLPredictionInputSerializer
+from ml_model.src.credit_scorer import get_credit_scorer
+from users.models import Role, User
+
+
+def prediction_input(**overrides):
+    data = {
+        'annual_income': '85000', 'loan_amount': '20000', 'interest_rate': '11.0',
+        'debt_to_income_ratio': '18.5', 'credit_history_length': '8.0', 'revolving_utilization': '35.0',
+        'max_bankcard_balance': '4000', 'total_accounts': 18, 'open_accounts': 9,
+        'employment_length': '5 years', 'job_title': 'Teacher', 'home_ownership': 'RENT'
+    }
+    data.update(overrides)
+    return data
+
+
+class BatchPredictEndpointTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Role.objects.create(name='Client User')
+        cls.user = User.objects.create_user(
+            'analyst@example.com', 'Str0ng-passw0rd', first_name='Kofi', last_name='Boateng', user_type='CLIENT'
+        )
+
+    def post(self, predictions, **extra):
+        request = APIRequestFactory().post('/api/ml/batch-predict/', {'predictions': predictions, **extra},
+                                           format='json')
+        force_authenticate(request, user=self.user)
+        return batch_predict_credit_scores(request)
+
+    def single_score(self, data):
+        serializer = MLPredictionInputSerializer(data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        return get_credit_scorer().predict_credit_score(_to_ml_input(serializer.validated_data))
+
+    def test_batch_is_scored_with_one_call(self):
+        predictions = [prediction_input(), prediction_input(job_title='Nurse', annual_income='42000'),
+                       prediction_input(job_title='Farmer', debt_to_income_ratio='35.0')]
+        scorer = get_credit_scorer()
+
+        with mock.patch.object(scorer, 'batch_predict_compact', wraps=scorer.batch_predict_compact) as batch:
+            response = self.post(predictions)
+
+        batch.assert_called_once()
+        self.assertEqual(len(batch.call_args[0][0]), 3)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['successful_predictions'], 3)
+        for i, data in enumerate(predictions):
+            result = response.data['results'][i]
+            self.assertEqual(result['batch_index'], i)
+            self.assertEqual(result['credit_score'], self.single_score(data)['credit_score'])
+            self.assertEqual(result['ghana_employment_analysis']['job_title'], data['job_title'])
+
+    def test_failing_item_keeps_its_index(self):
+        # Accepted by the serializer, rejected by the scorer's range validation
+        predictions = [prediction_input(), prediction_input(interest_rate='75.0'), prediction_input()]
+
+        response = self.post(predictions, include_detailed_analysis=False)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['successful_predictions'], 2)
+        self.assertEqual(response.data['failed_predictions'], 1)
+        results = response.data['results']
+        self.assertEqual([result['success'] for result in results], [True, False, True])
+        self.assertEqual(results[1]['batch_index'], 1)
+        self.assertTrue(results[1]['error'])
+        self.assertNotIn('ghana_employment_analysis', results[0])
+
+    def test_batch_size_limit_comes_from_settings(self):
+        response = self.post([prediction_input()] * (settings.ML_API_MAX_BATCH_SIZE + 1))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('predictions', response.data['validation_errors'])
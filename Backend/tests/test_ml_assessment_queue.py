@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for coalesced ML assessment jobs
+Checks that repeated triggers for one application share a queued job
+
+Run with: python manage.py test tests -p test_ml_assessment_queue.py
+"""
+
+import os
+import sys
+import unittest
+import uuid
+from unittest import mock
+
+import django
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+django.setup()
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from applications import tasks
+from ml_job_leases import LEASE_CLIENT, fresh_lease_client
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                            'LOCATION': 'ml-assessment-queue-tests'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE, ML_ASSESSMENT_COALESCE_SECONDS=600)
+class QueueTestCase(TestCase):
+    """Captures queued jobs instead of sending them to the broker."""
+
+    def setUp(self):
+        self.application_id = str(uuid.uuid4())
+        patcher = mock.patch.object(tasks.process_ml_credit_assessment, 'apply_async')
+        self.apply_async = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def enqueue(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            tasks.enqueue_ml_assessment(self.application_id, **kwargs)
+
+    def run_queued_job(self):
+        """Run the last queued job in-process with the arguments it was queued with."""
+        args, kwargs = self.apply_async.call_args[0]
+        return tasks.process_ml_credit_assessment.apply(args, kwargs).get()
+
+
+@unittest.skipIf(LEASE_CLIENT is None, 'needs fakeredis[lua] or a Redis server at ML_JOBS_TEST_REDIS_URL')
+class CoalescedEnqueueTests(QueueTestCase):
+    """The lease collapses triggers while a job is queued (shared Redis server)."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch('applications.tasks._lease_client', return_value=fresh_lease_client())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_two_triggers_queue_one_job(self):
+        self.enqueue(on_submission=True)
+        self.enqueue(force_reprocess=True)
+        self.assertEqual(self.apply_async.call_count, 1)
+        self.assertTrue(self.apply_async.call_args[0][1]['coalesced'])
+
+        # The queued job picks up the flags of the merged trigger
+        options, remaining = tasks._claim_queued_options(self.application_id)
+        self.assertTrue(options['on_submission'])
+        self.assertTrue(options['force_reprocess'])
+        self.assertEqual(remaining, 0)
+
+    def test_trigger_after_job_runs_queues_new_job(self):
+        self.enqueue()
+        # The application does not exist, so the job stops after claiming the lease
+        self.assertEqual(self.run_queued_job()['status'], 'error')
+
+        self.enqueue()
+        self.assertEqual(self.apply_async.call_count, 2)
+
+    def test_debounced_job_started_early_reschedules(self):
+        self.enqueue(force_reprocess=True, debounce_seconds=30)
+        self.enqueue(force_reprocess=True, debounce_seconds=30)
+
+        result = self.run_queued_job()
+        self.assertEqual(result['status'], 'deferred')
+        self.assertEqual(self.apply_async.call_count, 2)
+        self.assertGreater(self.apply_async.call_args[1]['countdown'], 0)
+        # Still queued, so another edit merges into the rescheduled job
+        self.enqueue(force_reprocess=True, debounce_seconds=30)
+        self.assertEqual(self.apply_async.call_count, 2)
+
+    def test_rolled_back_trigger_takes_no_lease(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                tasks.enqueue_ml_assessment(self.application_id)
+                raise RuntimeError('rolled back')
+        self.assertEqual(self.apply_async.call_count, 0)
+
+        self.enqueue()
+        self.assertEqual(self.apply_async.call_count, 1)
+
+    def test_failed_dispatch_releases_lease(self):
+        self.apply_async.side_effect = ConnectionError('broker down')
+        with self.assertRaises(ConnectionError):
+            self.enqueue()
+
+        self.apply_async.side_effect = None
+        self.enqueue()
+        self.assertEqual(self.apply_async.call_count, 2)
+
+
+class UncoalescedEnqueueTests(QueueTestCase):
+    """Without a usable shared lease, every trigger queues its own job."""
+
+    @override_settings(ML_JOBS_REDIS_URL='')
+    def test_every_trigger_queues_without_ml_jobs_redis(self):
+        self.assertFalse(tasks._coalescing_available())
+        self.enqueue(on_submission=True)
+        self.enqueue(force_reprocess=True)
+        self.assertEqual(self.apply_async.call_count, 2)
+        self.assertEqual(self.apply_async.call_args[0][1], {'on_submission': False, 'provisional_result': None})
+
+    def test_every_trigger_queues_when_lease_unreachable(self):
+        with mock.patch('applications.tasks._run_lease_script', side_effect=ConnectionError('redis down')):
+            self.enqueue(on_submission=True)
+            self.enqueue(force_reprocess=True)
+        self.assertEqual(self.apply_async.call_count, 2)
+        self.assertNotIn('coalesced', self.apply_async.call_args[0][1])
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for the versioned model artifact manifest
+Checks manifest validation, when the scorer falls back to the legacy pickles
+and the version token that drives hot reload
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.src.credit_scorer import CreditScorer, model_version_token
+from ml_model.src.model_artifacts import MANIFEST_FILENAME, read_manifest, verify_artifacts
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ml_model', 'models')
+
+
+def _copy_model_dir():
+    """Copy the deployed model directory so a test can modify its files."""
+    model_dir = os.path.join(tempfile.mkdtemp(), 'models')
+    shutil.copytree(MODEL_DIR, model_dir)
+    return model_dir
+
+
+def _write_manifest(model_dir, manifest):
+    with open(os.path.join(model_dir, MANIFEST_FILENAME), 'w') as f:
+        json.dump(manifest, f)
+
+
+def _load(model_dir):
+    scorer = CreditScorer(model_dir)
+    assert scorer.load_model(), "Model failed to load"
+    return scorer
+
+
+def test_directory_without_manifest_has_none():
+    """read_manifest returns None when there is no manifest file."""
+    assert read_manifest(tempfile.mkdtemp()) is None
+
+
+def test_invalid_manifests_are_rejected():
+    """Unknown manifest versions and manifests without a booster raise ValueError."""
+    model_dir = tempfile.mkdtemp()
+    for manifest in ({'manifest_version': 99, 'artifacts': {'booster': {}}},
+                     {'manifest_version': 1, 'artifacts': {}}):
+        _write_manifest(model_dir, manifest)
+        try:
+            read_manifest(model_dir)
+            raised = False
+        except ValueError:
+            raised = True
+        assert raised, manifest
+
+
+def test_changed_artifact_fails_verification():
+    """verify_artifacts raises when a file no longer matches its recorded checksum."""
+    model_dir = _copy_model_dir()
+    manifest = read_manifest(model_dir)
+    assert set(verify_artifacts(manifest, model_dir)) == set(manifest['artifacts'])
+
+    with open(os.path.join(model_dir, manifest['artifacts']['booster']['file']), 'ab') as f:
+        f.write(b'corrupt')
+    try:
+        verify_artifacts(manifest, model_dir)
+        raised = False
+    except ValueError:
+        raised = True
+    assert raised
+
+
+def test_deployed_model_loads_from_manifest():
+    """The deployed model directory loads the booster listed in its manifest."""
+    scorer = _load(MODEL_DIR)
+    manifest = read_manifest(MODEL_DIR)
+    assert scorer.artifact_source == f"manifest {manifest['model_version']}"
+    assert scorer.artifact_checksums == {name: artifact['sha256'] for name, artifact in manifest['artifacts'].items()}
+    assert scorer.feature_order == manifest['feature_order']
+
+
+def test_checksum_mismatch_falls_back_to_legacy_pickle():
+    """A booster that fails verification is skipped in favour of the legacy pickle."""
+    model_dir = _copy_model_dir()
+    with open(os.path.join(model_dir, 'xgboost_credit_model_fixed.ubj'), 'ab') as f:
+        f.write(b'corrupt')
+
+    scorer = _load(model_dir)
+    assert scorer.artifact_source == 'legacy xgboost_credit_model_fixed.pkl'
+
+
+def test_unreadable_manifest_falls_back_to_legacy_pickle():
+    """A manifest that is not valid JSON is ignored."""
+    model_dir = _copy_model_dir()
+    with open(os.path.join(model_dir, MANIFEST_FILENAME), 'w') as f:
+        f.write('{not json')
+
+    assert _load(model_dir).artifact_source == 'legacy xgboost_credit_model_fixed.pkl'
+
+
+def test_redeployed_source_pickle_takes_precedence():
+    """A legacy pickle changed since the manifest export is loaded instead of the stale booster."""
+    model_dir = _copy_model_dir()
+    # Trailing bytes change the checksum; pickle.load stops at the end of the pickle
+    with open(os.path.join(model_dir, 'xgboost_credit_model_fixed.pkl'), 'ab') as f:
+        f.write(b'\n')
+
+    assert _load(model_dir).artifact_source == 'legacy xgboost_credit_model_fixed.pkl'
+
+
+def test_manifest_and_legacy_models_score_alike():
+    """The exported booster predicts the same scores as the pickle it came from."""
+    model_dir = _copy_model_dir()
+    os.remove(os.path.join(model_dir, MANIFEST_FILENAME))
+    manifest_scorer, legacy_scorer = _load(MODEL_DIR), _load(model_dir)
+    assert legacy_scorer.artifact_source.startswith('legacy')
+
+    application = manifest_scorer._get_sample_data()
+    manifest_result = manifest_scorer.predict_credit_score(application, use_cache=False)
+    legacy_result = legacy_scorer.predict_credit_score(application, use_cache=False)
+    assert manifest_result['success'] and legacy_result['success']
+    assert manifest_result['credit_score'] == legacy_result['credit_score']
+    assert abs(manifest_result['raw_prediction'] - legacy_result['raw_prediction']) < 1e-3
+
+
+def test_version_token_tracks_manifest_and_source_pickle():
+    """The hot reload token changes with the manifest checksums and with a redeployed source pickle."""
+    model_dir = _copy_model_dir()
+    token = model_version_token(model_dir)
+    assert token[0] == 'manifest'
+    assert model_version_token(model_dir) == token
+
+    with open(os.path.join(model_dir, 'xgboost_credit_model_fixed.pkl'), 'ab') as f:
+        f.write(b'\n')
+    redeployed = model_version_token(model_dir)
+    assert redeployed != token
+
+    manifest = read_manifest(model_dir)
+    manifest['artifacts']['booster']['sha256'] = '0' * 64
+    _write_manifest(model_dir, manifest)
+    assert model_version_token(model_dir) not in (token, redeployed)
+
+
+def test_version_token_without_manifest_uses_legacy_files():
+    """Without a manifest the token follows the legacy pickles."""
+    model_dir = _copy_model_dir()
+    os.remove(os.path.join(model_dir, MANIFEST_FILENAME))
+    token = model_version_token(model_dir)
+    assert token[0] == 'legacy'
+
+    os.remove(os.path.join(model_dir, 'xgboost_credit_score_model.pkl'))
+    assert model_version_token(model_dir) != token
+
+
+def main():
+    """Run all model artifact tests"""
+    tests = [
+        test_directory_without_manifest_has_none,
+        test_invalid_manifests_are_rejected,
+        test_changed_artifact_fails_verification,
+        test_deployed_model_loads_from_manifest,
+        test_checksum_mismatch_falls_back_to_legacy_pickle,
+        test_unreadable_manifest_falls_back_to_legacy_pickle,
+        test_redeployed_source_pickle_takes_precedence,
+        test_manifest_and_legacy_models_score_alike,
+        test_version_token_tracks_manifest_and_source_pickle,
+        test_version_token_without_manifest_uses_legacy_files,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
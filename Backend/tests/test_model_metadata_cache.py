@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached model metadata and background health probes
+Checks that polling the scorer does not rerun predictions or rebuild metadata
+"""
+
+import os
+import sys
+import time
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.src.health_monitor import HealthMonitor
+from ml_model.src.scoring_metrics import MetricsSink, scoring_metrics
+import ml_model.src.credit_scorer as credit_scorer_module
+from scoring_helpers import load_scorer
+
+
+def _count_predictions(scorer):
+    """Wrap predict_credit_score on the instance and return the call counter."""
+    calls = {'count': 0}
+    predict = scorer.predict_credit_score
+
+    def counting_predict(*args, **kwargs):
+        calls['count'] += 1
+        return predict(*args, **kwargs)
+
+    scorer.predict_credit_score = counting_predict
+    return calls
+
+
+def test_health_check_served_from_last_probe():
+    """Repeated health checks reuse the last probe; max_age forces a fresh one."""
+    original_monitor = credit_scorer_module.health_monitor
+    credit_scorer_module.health_monitor = HealthMonitor(interval=60)
+    try:
+        scorer = load_scorer()
+        calls = _count_predictions(scorer)
+
+        first = scorer.health_check()
+        for _ in range(50):
+            assert scorer.health_check() == first
+        assert first['status'] == 'healthy'
+        assert calls['count'] == 1
+
+        scorer.health_check(max_age=0)
+        assert calls['count'] == 2
+    finally:
+        credit_scorer_module.health_monitor.stop()
+        credit_scorer_module.health_monitor = original_monitor
+
+
+def test_background_probe_refreshes_result():
+    """The monitor thread reprobes watched scorers on its interval."""
+    original_monitor = credit_scorer_module.health_monitor
+    credit_scorer_module.health_monitor = HealthMonitor(interval=0.2)
+    try:
+        scorer = load_scorer()
+        calls = _count_predictions(scorer)
+        scorer.health_check()
+        time.sleep(1.0)
+        assert calls['count'] >= 3
+    finally:
+        credit_scorer_module.health_monitor.stop()
+        credit_scorer_module.health_monitor = original_monitor
+
+
+def test_probe_bypasses_cache_and_metrics():
+    """Health probes score the model directly: no cache lookups, no recorded requests."""
+    class RecordingSink(MetricsSink):
+        def __init__(self):
+            self.requests = []
+
+        def record_request(self, mode, model_version, outcome, rows, total_seconds, stages):
+            self.requests.append((mode, outcome))
+
+    scorer = load_scorer()
+    cache_lookups = {'count': 0}
+
+    def counting_cache():
+        cache_lookups['count'] += 1
+        return None
+
+    scorer._get_prediction_cache = counting_cache
+    sink = RecordingSink()
+    scoring_metrics.sinks.append(sink)
+    try:
+        for _ in range(3):
+            assert scorer.run_health_probe()['status'] == 'healthy'
+        assert cache_lookups['count'] == 0
+        assert sink.requests == []
+
+        scorer.predict_credit_score(scorer._get_sample_data())
+        assert cache_lookups['count'] == 1
+        assert sink.requests == [('single', 'success')]
+    finally:
+        scoring_metrics.sinks.remove(sink)
+
+
+def test_metadata_copies_do_not_leak_mutations():
+    """Getters return copies of the precomputed metadata."""
+    scorer = load_scorer()
+    performance = scorer.get_model_performance()
+    performance['model_type'] = 'changed'
+    assert scorer.get_model_performance()['model_type'] == 'XGBoost Regressor'
+
+    importance = scorer.get_feature_importance()
+    importance.append({'feature': 'extra', 'importance': 1.0})
+    assert len(scorer.get_feature_importance()) == len(importance) - 1
+
+
+def main():
+    """Run all metadata cache tests"""
+    tests = [test_health_check_served_from_last_probe, test_background_probe_refreshes_result,
+             test_probe_bypasses_cache_and_metrics, test_metadata_copies_do_not_leak_mutations]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide model registry
+Checks lazy loading, warmup, hot reload and that every import path shares one registry
+"""
+
+import importlib.util
+import os
+import sys
+import time
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ml_model.src.model_registry as model_registry_module
+from ml_model.src.model_registry import ModelRegistry
+
+
+def _counting_loader(value='model'):
+    """Loader returning value and recording how often it ran."""
+    calls = {'count': 0}
+
+    def load():
+        calls['count'] += 1
+        return value
+
+    return load, calls
+
+
+def test_models_load_once_on_first_get():
+    """get() runs the loader once and serves later calls from memory."""
+    registry = ModelRegistry()
+    load, calls = _counting_loader()
+    registry.register('scorer', load)
+
+    assert not registry.is_loaded('scorer')
+    assert registry.get('scorer') == 'model'
+    assert registry.get('scorer') == 'model'
+    assert calls['count'] == 1
+    assert registry.is_loaded('scorer')
+
+
+def test_first_registration_wins():
+    """Registering a name again does not replace its loader."""
+    registry = ModelRegistry()
+    registry.register('scorer', lambda: 'first')
+    registry.register('scorer', lambda: 'second')
+    assert registry.get('scorer') == 'first'
+
+
+def test_unknown_model_raises_key_error():
+    """get() of an unregistered name raises KeyError."""
+    registry = ModelRegistry()
+    try:
+        registry.get('missing')
+        raised = False
+    except KeyError:
+        raised = True
+    assert raised
+
+
+def test_warmup_loads_models_and_reports_failures():
+    """warmup() loads every registered model and records loaders that fail."""
+    registry = ModelRegistry()
+    load, calls = _counting_loader()
+    registry.register('scorer', load)
+
+    def broken():
+        raise IOError('artifact missing')
+
+    registry.register('broken', broken)
+    result = registry.warmup(freeze=False)
+
+    assert result['models']['scorer'] == {'loaded': True}
+    assert result['models']['broken']['loaded'] is False
+    assert 'artifact missing' in result['models']['broken']['error']
+    assert result['process']['models']['scorer']['loaded']
+    assert not result['process']['models']['scorer']['inherited_from_parent']
+
+    registry.get('scorer')
+    assert calls['count'] == 1
+
+
+def test_unload_forces_a_fresh_load():
+    """After unload() the next get() runs the loader again."""
+    registry = ModelRegistry()
+    load, calls = _counting_loader()
+    registry.register('scorer', load)
+    registry.get('scorer')
+    registry.unload('scorer')
+
+    assert not registry.is_loaded('scorer')
+    registry.get('scorer')
+    assert calls['count'] == 2
+
+
+def test_other_import_paths_share_the_registry():
+    """Loading the module again under its top-level name reuses the existing registry."""
+    path = model_registry_module.__file__
+    spec = importlib.util.spec_from_file_location('model_registry', path)
+    module = importlib.util.module_from_spec(spec)
+    previous = sys.modules.get('model_registry')
+    sys.modules['model_registry'] = module
+    try:
+        spec.loader.exec_module(module)
+        assert module.registry is model_registry_module.registry
+    finally:
+        if previous is None:
+            sys.modules.pop('model_registry', None)
+        else:
+            sys.modules['model_registry'] = previous
+
+
+def _versioned_registry():
+    """Registry with one model whose loader returns the current version."""
+    registry = ModelRegistry()
+    state = {'version': 1, 'loads': 0, 'fail': False}
+
+    def load():
+        if state['fail']:
+            raise IOError('half-written artifact')
+        state['loads'] += 1
+        return f"model-v{state['version']}"
+
+    registry.register('scorer', load, version=lambda: state['version'])
+    return registry, state
+
+
+def test_reload_if_changed_swaps_in_new_version():
+    """A changed version token loads and serves the new model; an unchanged one does nothing."""
+    registry, state = _versioned_registry()
+    held = registry.get('scorer')
+
+    assert registry.reload_if_changed('scorer') is False
+    state['version'] = 2
+    assert registry.reload_if_changed('scorer') is True
+
+    assert held == 'model-v1'
+    assert registry.get('scorer') == 'model-v2'
+    assert registry.stats()['models']['scorer']['reloads'] == 1
+    assert registry.reload_if_changed('scorer') is False
+    assert state['loads'] == 2
+
+
+def test_failed_reload_keeps_current_model():
+    """A version that fails to load leaves the old model in service and is not retried."""
+    registry, state = _versioned_registry()
+    registry.get('scorer')
+    state['version'], state['fail'] = 2, True
+
+    assert registry.reload_if_changed('scorer') is False
+    assert registry.get('scorer') == 'model-v1'
+
+    state['fail'] = False
+    assert registry.reload_if_changed('scorer') is False
+    state['version'] = 3
+    assert registry.reload_if_changed('scorer') is True
+    assert registry.get('scorer') == 'model-v3'
+
+
+def test_models_not_loaded_are_not_reloaded():
+    """Only loaded models with version sources are checked."""
+    registry, state = _versioned_registry()
+    registry.register('static', lambda: 'static')
+    registry.get('static')
+    state['version'] = 2
+
+    assert registry.check_for_updates() == []
+    assert state['loads'] == 0
+
+
+def test_added_version_source_rebaselines_loaded_model():
+    """Adding a source does not itself trigger a reload; a change from it does."""
+    registry, state = _versioned_registry()
+    registry.get('scorer')
+    active = {'version': 'a'}
+    registry.add_version_source('scorer', lambda: active['version'])
+
+    assert registry.check_for_updates() == []
+    active['version'] = 'b'
+    assert registry.check_for_updates() == ['scorer']
+    assert state['loads'] == 2
+
+
+def test_watcher_reloads_when_woken():
+    """With hot reload enabled, the watcher thread swaps in a new version after a wake-up."""
+    registry, state = _versioned_registry()
+    registry.enable_hot_reload(interval=60)
+    registry.get('scorer')
+    assert registry.stats()['hot_reload']['watcher_running']
+
+    state['version'] = 2
+    registry.wake_watcher()
+    deadline = time.time() + 5
+    while registry.get('scorer') != 'model-v2' and time.time() < deadline:
+        time.sleep(0.01)
+    assert registry.get('scorer') == 'model-v2'
+
+
+def main():
+    """Run all model registry tests"""
+    tests = [
+        test_models_load_once_on_first_get,
+        test_first_registration_wins,
+        test_unknown_model_raises_key_error,
+        test_warmup_loads_models_and_reports_failures,
+        test_unload_forces_a_fresh_load,
+        test_other_import_paths_share_the_registry,
+        test_reload_if_changed_swaps_in_new_version,
+        test_failed_reload_keeps_current_model,
+        test_models_not_loaded_are_not_reloaded,
+        test_added_version_source_rebaselines_loaded_model,
+        test_watcher_reloads_when_woken,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
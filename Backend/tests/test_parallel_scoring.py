@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for process-pool parallel scoring
+Checks that sharded results match in-process scoring, in input order
+"""
+
+import os
+import sys
+from unittest import mock
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.src import parallel_scoring
+from ml_model.src.batch_result import BatchScoringResult
+from ml_model.src.parallel_scoring import iter_parallel_predictions, parallel_batch_predict
+from scoring_helpers import load_scorer
+
+
+def _applications(scorer, count=10):
+    sample = scorer._get_sample_data()
+    applications = [dict(sample, annual_inc=20000 + 7500 * i, dti=4.0 + 2 * i) for i in range(count)]
+    applications[4] = {'annual_inc': 50000}  # fails validation
+    return applications
+
+
+def _without_timestamp(result):
+    return {key: value for key, value in result.items() if key != 'prediction_timestamp'}
+
+
+def test_parallel_results_match_in_process_scoring():
+    """Rows scored in worker processes equal batch_predict, with batch_index in input order."""
+    scorer = load_scorer()
+    applications = _applications(scorer)
+    progress = []
+
+    results = list(iter_parallel_predictions(applications, workers=2, chunk_size=3,
+                                             progress_callback=lambda done, total: progress.append((done, total))))
+
+    expected = scorer.batch_predict(applications)
+    assert [row['batch_index'] for row in results] == list(range(len(applications)))
+    assert [_without_timestamp(row) for row in results] == [_without_timestamp(row) for row in expected]
+    assert not results[4]['success']
+    assert progress == [(3, 10), (6, 10), (9, 10), (10, 10)]
+
+
+def test_single_chunk_is_scored_in_process():
+    """Batches that fit in one chunk, or workers=1, never start a pool."""
+    scorer = load_scorer()
+    applications = _applications(scorer, count=5)
+    with mock.patch.object(parallel_scoring, 'iter_parallel_predictions') as pool:
+        small = parallel_batch_predict(applications, workers=4, chunk_size=10)
+        serial = parallel_batch_predict(applications, workers=1, chunk_size=2)
+
+    pool.assert_not_called()
+    assert len(small) == len(serial) == 5
+    assert [row['credit_score'] for row in small if row['success']] == \
+        [row['credit_score'] for row in serial if row['success']]
+
+
+def test_empty_input_yields_nothing():
+    """No applications means no pool and no results."""
+    assert list(iter_parallel_predictions([], workers=2)) == []
+
+
+def test_chunk_results_are_renumbered_to_input_positions():
+    """A chunk's batch_index values are offset by the chunk's start position."""
+    result = BatchScoringResult.from_rows([
+        {'success': False, 'error': 'bad input', 'batch_index': 0},
+        {'success': False, 'error': 'bad input', 'batch_index': 1},
+    ])
+    rows = list(parallel_scoring._chunk_results(500, result))
+    assert [row['batch_index'] for row in rows] == [500, 501]
+
+
+def main():
+    """Run all parallel scoring tests"""
+    tests = [
+        test_parallel_results_match_in_process_scoring,
+        test_single_chunk_is_scored_in_process,
+        test_empty_input_yields_nothing,
+        test_chunk_results_are_renumbered_to_input_positions,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
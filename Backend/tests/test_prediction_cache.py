@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the two-tier prediction cache
+Checks LRU eviction, model-version keys, result copies and the Redis tier
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.src.prediction_cache import PredictionCache, make_cache_key
+
+
+class _DictRedis:
+    """Minimal stand-in for the redis client methods the cache uses."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class _DownRedis:
+    """Redis client whose server is unreachable."""
+
+    def get(self, key):
+        raise ConnectionError('redis unavailable')
+
+    def set(self, key, value, ex=None):
+        raise ConnectionError('redis unavailable')
+
+
+def _result(score):
+    return {'credit_score': score, 'confidence_factors': {'score_range': 0.9}}
+
+
+def test_least_recently_used_entry_is_evicted():
+    """A lookup refreshes an entry, so the untouched one is evicted first."""
+    cache = PredictionCache(max_size=2)
+    cache.set('a', _result(600))
+    cache.set('b', _result(650))
+    assert cache.get('a')['credit_score'] == 600
+
+    cache.set('c', _result(700))
+
+    assert cache.get('b') is None
+    assert cache.get('a')['credit_score'] == 600
+    assert cache.get('c')['credit_score'] == 700
+    stats = cache.stats()
+    assert stats['size'] == 2 and stats['evictions'] == 1
+
+
+def test_zero_size_disables_caching():
+    """max_size=0 stores nothing and counts no lookups."""
+    cache = PredictionCache(max_size=0)
+    cache.set('a', _result(600))
+    assert cache.get('a') is None
+    assert cache.stats()['misses'] == 0
+
+
+def test_key_changes_with_model_checksums():
+    """Results cached under one set of artifact checksums miss once the model changes."""
+    features = np.array([1.0, 2.5, np.nan, 4.0])
+    old_model = (('model.pkl', 'abc123'),)
+    new_model = (('model.pkl', 'def456'),)
+    cache = PredictionCache(max_size=10)
+    cache.set(make_cache_key(old_model, features), _result(600))
+
+    assert make_cache_key(old_model, features) == make_cache_key(old_model, features.copy())
+    assert make_cache_key(old_model, features) != make_cache_key(new_model, features)
+    assert cache.get(make_cache_key(new_model, features)) is None
+    assert cache.get(make_cache_key(old_model, features))['credit_score'] == 600
+
+
+def test_key_covers_extra_inputs():
+    """Non-feature inputs passed as extra are part of the key."""
+    features = np.array([1.0, 2.0])
+    assert make_cache_key('v1', features, ('Engineer', 5)) != make_cache_key('v1', features, ('Teacher', 5))
+
+
+def test_callers_can_set_top_level_keys():
+    """Top-level changes to a stored or returned result do not reach the cache."""
+    cache = PredictionCache(max_size=10)
+    result = _result(600)
+    cache.set('a', result)
+    result['credit_score'] = 0
+
+    hit = cache.get('a')
+    hit['prediction_timestamp'] = 'now'
+    hit['batch_index'] = 3
+
+    again = cache.get('a')
+    assert again['credit_score'] == 600
+    assert 'prediction_timestamp' not in again and 'batch_index' not in again
+
+
+def test_redis_tier_serves_other_processes():
+    """An entry missing locally is read back from Redis and kept locally."""
+    redis = _DictRedis()
+    writer = PredictionCache(max_size=10)
+    writer._redis = redis
+    writer.set('a', _result(600))
+    assert json.loads(redis.values['ml_prediction:a'])['credit_score'] == 600
+
+    reader = PredictionCache(max_size=10)
+    reader._redis = redis
+    assert reader.get('a')['credit_score'] == 600
+    assert reader.get('a')['confidence_factors'] == {'score_range': 0.9}
+    stats = reader.stats()
+    assert stats['redis_hits'] == 1 and stats['hits'] == 2 and stats['size'] == 1
+
+
+def test_unreachable_redis_falls_back_to_local_tier():
+    """Redis errors are counted and never surface; the local tier keeps working."""
+    cache = PredictionCache(max_size=10)
+    cache._redis = _DownRedis()
+    cache.set('a', _result(600))
+
+    assert cache.get('a')['credit_score'] == 600
+    assert cache.get('b') is None
+    stats = cache.stats()
+    assert stats['redis_errors'] == 2 and stats['misses'] == 1
+
+
+def test_invalid_redis_url_disables_redis_tier():
+    """A URL the client cannot parse leaves a local-only cache."""
+    cache = PredictionCache(max_size=10, redis_url='not-a-redis-url')
+    assert cache.stats()['redis_enabled'] is False
+    cache.set('a', _result(600))
+    assert cache.get('a')['credit_score'] == 600
+
+
+def main():
+    """Run all prediction cache tests"""
+    tests = [
+        test_least_recently_used_entry_is_evicted,
+        test_zero_size_disables_caching,
+        test_key_changes_with_model_checksums,
+        test_key_covers_extra_inputs,
+        test_callers_can_set_top_level_keys,
+        test_redis_tier_serves_other_processes,
+        test_unreachable_redis_falls_back_to_local_tier,
+        test_invalid_redis_url_disables_redis_tier,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the scoring stage metrics
+Checks the recorded stages, request counters and Prometheus text output
+"""
+
+import os
+import sys
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.src.scoring_metrics import Histogram, MetricsSink, scoring_metrics
+from scoring_helpers import load_scorer
+
+
+class _RecordingSink(MetricsSink):
+    def __init__(self):
+        self.requests = []
+
+    def record_request(self, mode, model_version, outcome, rows, total_seconds, stages):
+        self.requests.append((mode, model_version, outcome, rows, dict(stages)))
+
+
+def test_single_prediction_records_stages():
+    """A single prediction reports every stage once, under its model version."""
+    scorer = load_scorer()
+    sink = _RecordingSink()
+    scoring_metrics.add_sink(sink)
+    try:
+        scorer.predict_credit_score(scorer._get_sample_data())
+        scorer.predict_credit_score({'annual_inc': 50000})
+    finally:
+        scoring_metrics.sinks.remove(sink)
+
+    (mode, version, outcome, rows, stages), invalid = sink.requests[0], sink.requests[1]
+    assert (mode, rows, version) == ('single', 1, scorer._model_version)
+    assert outcome in ('success', 'cache_hit')
+    assert {'validation', 'preprocessing'} <= set(stages)
+    if outcome == 'success':
+        assert {'model_predict', 'ghana_analysis', 'confidence'} <= set(stages)
+    assert invalid[2] == 'invalid' and set(invalid[4]) == {'validation'}
+
+
+def test_batch_prediction_records_rows():
+    """A batch is one request counting its rows."""
+    scorer = load_scorer()
+    sink = _RecordingSink()
+    scoring_metrics.add_sink(sink)
+    try:
+        scorer.batch_predict([scorer._get_sample_data()] * 5)
+    finally:
+        scoring_metrics.sinks.remove(sink)
+
+    batch_requests = [request for request in sink.requests if request[0] == 'batch']
+    assert len(batch_requests) == 1
+    assert batch_requests[0][2:4] == ('success', 5)
+
+
+def test_prometheus_text_format():
+    """Histograms are cumulative and end with +Inf, sum and count."""
+    scorer = load_scorer()
+    scorer.predict_credit_score(scorer._get_sample_data())
+    text = scoring_metrics.render_prometheus()
+
+    assert '# TYPE ml_scoring_stage_seconds histogram' in text
+    assert 'ml_scoring_stage_seconds_bucket{mode="single",stage="validation",le="+Inf"}' in text
+    assert f'model_version="{scorer._model_version}"' in text
+    assert 'ml_scoring_requests_total{' in text
+
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.cumulative_counts() == [1, 2, 3]
+
+
+def test_failing_sink_does_not_break_scoring():
+    """Sink errors are logged, never raised into the prediction."""
+    class BrokenSink(MetricsSink):
+        def record_request(self, *args):
+            raise RuntimeError("sink down")
+
+    scorer = load_scorer()
+    sink = BrokenSink()
+    scoring_metrics.add_sink(sink)
+    try:
+        assert scorer.predict_credit_score(scorer._get_sample_data())['success']
+    finally:
+        scoring_metrics.sinks.remove(sink)
+
+
+def test_incomplete_sink_fails_on_creation():
+    """A sink without record_request is rejected before it can be added."""
+    class IncompleteSink(MetricsSink):
+        pass
+
+    try:
+        IncompleteSink()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("IncompleteSink should not be instantiable")
+
+
+def test_disabled_metrics():
+    """With metrics disabled, scoring still works and nothing is recorded."""
+    scorer = load_scorer()
+    sink = _RecordingSink()
+    scoring_metrics.add_sink(sink)
+    scoring_metrics.enabled = False
+    try:
+        assert scorer.predict_credit_score(scorer._get_sample_data())['success']
+        assert all(result['success'] for result in scorer.batch_predict([scorer._get_sample_data()] * 3))
+    finally:
+        scoring_metrics.enabled = True
+        scoring_metrics.sinks.remove(sink)
+    assert sink.requests == []
+
+
+def main():
+    """Run all scoring metrics tests"""
+    tests = [test_single_prediction_records_stages, test_batch_prediction_records_rows,
+             test_prometheus_text_format, test_failing_sink_does_not_break_scoring, test_incomplete_sink_fails_on_creation,
+             test_disabled_metrics]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the NumPy tree evaluator
+Checks NumpyTreeEvaluator against XGBoost predict on the deployed model
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the Backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml_model.src.tree_evaluator import NumpyTreeEvaluator
+from scoring_helpers import load_scorer
+
+
+def _random_features(n_rows=20000, seed=11):
+    """Feature matrix spanning and exceeding the training ranges, with missing values."""
+    rng = np.random.default_rng(seed)
+    features = np.column_stack([
+        rng.uniform(0, 400000, n_rows),   # annual_inc
+        rng.uniform(0, 80, n_rows),       # dti
+        rng.uniform(3, 35, n_rows),       # int_rate
+        rng.uniform(0, 150, n_rows),      # revol_util
+    ] + [rng.integers(0, 25, n_rows).astype('float64') for _ in range(12)])
+    features[::53, 1] = np.nan
+    features[::71, 14] = np.nan
+    return features
+
+
+def test_matches_xgboost_exactly():
+    """Native predictions are bit-identical to XGBoost for arrays and DataFrames."""
+    scorer = load_scorer()
+    evaluator = NumpyTreeEvaluator.from_booster(scorer.model)
+    features = _random_features()
+
+    expected = scorer.model.predict(features)
+    assert np.array_equal(evaluator.predict(features), expected)
+
+    frame = pd.DataFrame(features, columns=evaluator.feature_names)
+    assert np.array_equal(evaluator.predict(frame[evaluator.feature_names[::-1]]), expected)
+    assert np.array_equal(evaluator.predict(features[0]), expected[:1])
+
+
+def test_split_thresholds_are_exact():
+    """Rows sitting exactly on split thresholds take the same branch as XGBoost."""
+    scorer = load_scorer()
+    evaluator = NumpyTreeEvaluator.from_booster(scorer.model)
+    features = np.repeat(_random_features(n_rows=1, seed=3), 200, axis=0)
+    splits = ~evaluator.is_leaf
+    for row, node in enumerate(np.flatnonzero(splits)[:200]):
+        features[row, evaluator.split_index[node]] = evaluator.split_condition[node]
+
+    assert np.array_equal(evaluator.predict(features), scorer.model.predict(features))
+
+
+def test_base_score_read_from_saved_config():
+    """base_score parses in both the plain and the bracketed (XGBoost 2.x) format."""
+    assert NumpyTreeEvaluator.parse_base_score('[5.2E2]') == 520.0
+    assert NumpyTreeEvaluator.parse_base_score('5.2E2') == 520.0
+
+    scorer = load_scorer()
+    config = json.loads(scorer.model.get_booster().save_config())
+    base_score = NumpyTreeEvaluator.parse_base_score(config['learner']['learner_model_param']['base_score'])
+    evaluator = NumpyTreeEvaluator.from_booster(scorer.model)
+    assert evaluator.base_score == np.float32(base_score)
+
+
+def test_scorer_native_backend_results_unchanged():
+    """Selecting the native backend does not change scoring results."""
+    xgboost_scorer = load_scorer()
+    native_scorer = load_scorer()
+    native_scorer.scoring_backend = 'native'
+    native_scorer._configure_scoring_backend()
+    assert native_scorer.tree_evaluator is not None
+
+    application = xgboost_scorer._get_sample_data()
+    for annual_inc in [8000, 45000, 72000, 150000, 900000]:
+        data = dict(application, annual_inc=annual_inc)
+        assert (native_scorer.predict_credit_score(data)['raw_prediction'] ==
+                xgboost_scorer.predict_credit_score(data)['raw_prediction'])
+
+
+def main():
+    """Run all parity tests"""
+    tests = [test_matches_xgboost_exactly, test_split_thresholds_are_exact, test_base_score_read_from_saved_config,
+             test_scorer_native_backend_results_unchanged]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    print(f"\nTotal: {len(tests) - failed}/{len(tests)} tests passed")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)